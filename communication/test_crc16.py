@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# PyTest : crc16
+# made : hbesthee@naver.com
+# date : 2026-10-18
+
+# Original Packages
+from unittest.mock import patch
+
+import os
+
+
+
+# Third-party Packages
+import pytest
+
+
+
+# User's Package 들을 포함시키기 위한 sys.path에 모듈 폴더 추가하기
+from pathlib import Path
+from sys import path as sys_path
+module_folder = str(Path(__file__).parent)
+if (not module_folder in sys_path):
+	sys_path.append(str(module_folder))
+
+
+# User's Package
+import crc16 as crc16_module
+from crc16 import Crc16, crc16_many, crc16bytes, crc16, crc16str, PRESETS, _crc16bytes_bytewise, _reflect16
+
+
+
+CHECK_DATA = b'123456789'
+
+# reveng CRC 카탈로그의 check 값 (CHECK_DATA의 CRC)
+CHECK_VALUES = {
+	'CCITT-FALSE':	0x29B1,
+	'XMODEM':		0x31C3,
+	'KERMIT':		0x2189,
+	'X-25':			0x906E,
+	'MODBUS':		0x4B37,
+	'ARC':			0xBB3D,
+	'USB':			0xB4C8,
+}
+
+
+
+def crc16_bitwise(data: bytes, poly: int, init: int, reflect: bool, xor_out: int) -> int:
+	"""비트 단위 기준 구현 (테이블을 사용하지 않음)"""
+	crc = init
+	for byte in data:
+		if (reflect):
+			byte = int(f'{byte:08b}'[::-1], 2)
+		crc ^= byte << 8
+		for _ in range(8):
+			crc = (((crc << 1) ^ poly) if (crc & 0x8000) else (crc << 1)) & 0xFFFF
+	if (reflect):
+		crc = _reflect16(crc)
+	return crc ^ xor_out
+
+
+def sample_data():
+	return [os.urandom(size) for size in (0, 1, 7, 8, 9, 15, 16, 17, 255, 1024, 1031)]
+
+
+
+def test_catalogue_check_values():
+	"""1. 모든 PRESETS가 카탈로그의 check 값과 일치"""
+	assert set(PRESETS) == set(CHECK_VALUES)
+	for name, check in CHECK_VALUES.items():
+		assert Crc16(CHECK_DATA, preset = name).value == check, name
+		assert crc16_bitwise(CHECK_DATA, *PRESETS[name]) == check, name
+
+
+def test_legacy_functions():
+	"""2. crc16bytes/crc16str/crc16은 기존 구현과 같은 값 (정수 목록 입력 포함)"""
+	assert crc16bytes(CHECK_DATA) == 0x29B1
+	assert crc16str('123456789') == 0x29B1
+	assert crc16(*CHECK_DATA) == 0x29B1
+	assert crc16bytes([0x31, 0x32]) == 15802
+	assert crc16bytes(bytearray(CHECK_DATA)) == crc16bytes(list(CHECK_DATA)) == crc16bytes(iter(CHECK_DATA)) == 0x29B1
+	assert crc16bytes([0x131, 0x232]) == _crc16bytes_bytewise([0x131, 0x232]) # 기존과 같이 하위 8비트 사용
+	for data in sample_data():
+		assert crc16bytes(data) == _crc16bytes_bytewise(data)
+
+
+@pytest.mark.parametrize('name', sorted(PRESETS))
+def test_sliced_matches_bitwise(name):
+	"""3. slice-by-8 테이블 계산이 비트 단위 계산과 일치 (crc_hqx 경로도 강제로 테이블 계산)"""
+	for data in sample_data():
+		crc = Crc16(preset = name)
+		crc._use_hqx = False
+		assert crc.update(data).value == crc16_bitwise(data, *PRESETS[name])
+		assert Crc16(data, preset = name).value == crc16_bitwise(data, *PRESETS[name])
+
+
+@pytest.mark.parametrize('name', sorted(PRESETS))
+def test_incremental_update(name):
+	"""4. 여러 번 나누어 update() 해도 한 번에 계산한 값과 같고, copy()/reset() 후에도 독립적으로 계산"""
+	data = os.urandom(1000)
+	expected = Crc16(data, preset = name)
+	for split in (1, 7, 8, 13, 500):
+		crc = Crc16(preset = name)
+		for start in range(0, len(data), split):
+			crc.update(memoryview(data)[start:start + split])
+		assert crc.value == expected.value
+		assert crc.digest() == expected.digest()
+
+	head = Crc16(data[:100], preset = name)
+	branch = head.copy().update(data[100:])
+	assert branch.value == expected.value
+	assert head.value == Crc16(data[:100], preset = name).value
+	assert head.reset().update(data).hexdigest() == expected.hexdigest()
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+@pytest.mark.parametrize('name', sorted(PRESETS))
+def test_crc16_many(name, use_numpy):
+	"""5. crc16_many()는 패킷별 Crc16 값과 같음 (numpy 경로와 numpy가 없을 때의 경로)"""
+	if (use_numpy):
+		np = pytest.importorskip('numpy')
+		packets = [os.urandom(size) for size in (32, 32, 0, 5, 32, 5, 1024)] + [[0x31, 0x32]]
+		expected = [Crc16(packet, preset = name).value for packet in packets]
+		assert crc16_many(packets, preset = name) == expected
+
+		matrix = np.frombuffer(os.urandom(16 * 24), dtype = np.uint8).reshape(16, 24)
+		assert crc16_many(matrix, preset = name) == [Crc16(row.tobytes(), preset = name).value for row in matrix]
+	else:
+		packets = [os.urandom(size) for size in (32, 32, 0, 5, 1024)] + [[0x31, 0x32]]
+		expected = [Crc16(packet, preset = name).value for packet in packets]
+		with patch.object(crc16_module, 'np', None):
+			assert crc16_many(packets, preset = name) == expected
@@ -19,7 +19,7 @@ if (__name__ == '__main__'):
 	# sys.path.append(path.dirname( path.dirname( path.abspath(__file__) ) ))
 	sys.path.append( path.abspath('../..') )
 
-from lib.file_logger import createLogger
+from lib.file_logger import createLogger, LogCollector
 
 
 CONFIDENCE_THRESHOLD = 0.6
@@ -58,12 +58,14 @@ class YoloDetector(Process):
 			, backend = cv2.dnn.DNN_BACKEND_CUDA
 			, target = cv2.dnn.DNN_TARGET_CUDA_FP16
 			, yolo_version = 4, is_tiny = True
-			, network_size = NETWORK_SIZE ) -> None:
+			, network_size = NETWORK_SIZE
+			, log_collector = None ) -> None:
 		""" YoloDetector class 생성자\n
 			frame_q 프로세스간 영상 프레임 공유를 위한 큐\n
 			detections_q 프로세스간 객체 인식 결과 공유를 위한 큐\n
 			backend : or cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE = NCS2\n
-			target : or cv2.dnn.DNN_TARGET_MYRIAD = NCS2
+			target : or cv2.dnn.DNN_TARGET_MYRIAD = NCS2\n
+			log_collector : LogCollector.queue (지정하면 로그 파일은 수집기 프로세스에서만 기록)
 		"""
 		super(YoloDetector, self).__init__(name = self.__class__.__name__)
 
@@ -77,6 +79,7 @@ class YoloDetector(Process):
 		self._backend = backend
 		self._target = target
 		self._network_size = network_size
+		self._log_collector = log_collector
 
 
 	def init_model(self):
@@ -99,7 +102,7 @@ class YoloDetector(Process):
 	def run(self):
 		""" Yolo detector 실행부 """
 		
-		self._detection_log = createLogger(log_filename = 'detection', log_level = 20)
+		self._detection_log = createLogger(log_filename = 'detection', log_level = 20, log_collector = self._log_collector)
 		self._detection_log.info(f'Yolo detector started. PID = {getpid()}')
 
 		self.init_model()
@@ -246,6 +249,8 @@ if (__name__ == '__main__'):
 
 	if (not path.exists('./logs')):
 		makedirs('./logs')
+	log_collector = LogCollector() # 여러 프로세스의 로그 파일 기록을 하나의 프로세스에서 처리
+	log_collector.start()
 
 	capture.set(cv2.CAP_PROP_FRAME_WIDTH, FRAME_WIDTH)
 	capture.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_HEIGTH)
@@ -259,6 +264,7 @@ if (__name__ == '__main__'):
 	detector = YoloDetector(_frame_q, _detections_q
 		, backend = backend
 		, target = target
+		, log_collector = log_collector.queue
 	)
 	detector.start()
 
@@ -290,3 +296,5 @@ if (__name__ == '__main__'):
 
 	capture.release()
 	cv2.destroyAllWindows()
+	detector.join()
+	log_collector.stop()
@@ -5,19 +5,273 @@
 # use tab char size: 4
 
 # Original Packages
-from abc import ABC
+from abc import ABC, abstractmethod
 from asyncio import Queue, Task
+from collections import deque
 from logging import getLogger
-from typing import Any, Optional
+from time import perf_counter
+from typing import Any, Callable, Final, Optional, Union
 from uuid import UUID
 
 import asyncio
+import struct
 
 
 
 
+class ChunkBuffer:
+	"""수신한 바이트 청크를 복사하지 않고 목록으로 보관하는 버퍼
+
+	앞쪽에서 소비한 만큼 오프셋만 옮기므로 소비 비용이 남은 데이터 크기와 무관하며,
+	요청한 범위가 한 청크 안에 있으면 memoryview로 복사 없이 반환합니다.
+	여러 청크에 걸친 범위는 해당 청크들만 한 번 합칩니다.
+	"""
+
+	def __init__(self):
+		self._chunks: deque[bytes] = deque()
+		self._offset = 0 # 첫 번째 청크에서 이미 소비한 바이트 수
+		self._size = 0
+		self.scan_offset = 0 # 구분자 탐색을 다시 시작할 위치 (DelimiterFramer에서 사용)
+
+
+	def __len__(self) -> int:
+		return self._size
+
+
+	def _contiguous(self, size: int) -> memoryview:
+		"""앞쪽 size 바이트를 연속된 memoryview로 반환 (여러 청크에 걸치면 합쳐서 첫 청크로 교체)"""
+		first = self._chunks[0]
+		if ((len(first) - self._offset) >= size):
+			return memoryview(first)[self._offset:self._offset + size]
+
+		parts = [memoryview(first)[self._offset:]]
+		merged_size = len(parts[0])
+		self._chunks.popleft()
+		while (merged_size < size):
+			chunk = self._chunks.popleft()
+			parts.append(chunk)
+			merged_size += len(chunk)
+		merged = b''.join(parts)
+		self._chunks.appendleft(merged)
+		self._offset = 0
+		return memoryview(merged)[:size]
+
+
+	def append(self, data: Union[bytes, bytearray, memoryview]) -> None:
+		"""청크 추가 (bytes는 복사 없이 보관)"""
+		if (not data):
+			return
+		if (not isinstance(data, bytes)):
+			data = bytes(data)
+		self._chunks.append(data)
+		self._size += len(data)
+
+
+	def clear(self) -> None:
+		"""모든 데이터 삭제"""
+		self._chunks.clear()
+		self._offset = 0
+		self._size = 0
+		self.scan_offset = 0
+
+
+	def consume(self, size: int) -> memoryview:
+		"""앞쪽 size 바이트를 꺼냄
+
+		Raises:
+			ValueError: 버퍼의 데이터가 size보다 적은 경우
+		"""
+		view = self.peek(size)
+		if (view == None):
+			raise ValueError(f"Not enough data: {size} > {self._size}")
+		self.skip(size)
+		return view
+
+
+	def find(self, sub: bytes, start: int = 0) -> int:
+		"""start 위치부터 sub를 찾아 버퍼 앞쪽 기준 위치 반환 (없으면 -1)"""
+		if ((not sub) or ((start + len(sub)) > self._size)):
+			return -1
+
+		position = 0 # 현재 청크의 버퍼 기준 시작 위치
+		tail = b'' # 청크 경계에 걸친 sub를 찾기 위한 이전 청크의 끝부분
+		for index, chunk in enumerate(self._chunks):
+			chunk_offset = self._offset if (index == 0) else 0
+			chunk_length = len(chunk) - chunk_offset
+			chunk_end = position + chunk_length
+			if (chunk_end > start):
+				if (tail):
+					boundary = tail + chunk[chunk_offset:chunk_offset + len(sub) - 1]
+					found = boundary.find(sub, max(0, start - (position - len(tail))))
+					if ((found >= 0) and (found < len(tail))):
+						return position - len(tail) + found
+
+				found = chunk.find(sub, chunk_offset + max(0, start - position))
+				if (found >= 0):
+					return position + found - chunk_offset
+
+			if (len(sub) > 1):
+				tail = (tail + chunk[chunk_offset:])[-(len(sub) - 1):]
+			position = chunk_end
+		return -1
+
+
+	def peek(self, size: int) -> Optional[memoryview]:
+		"""앞쪽 size 바이트를 소비하지 않고 반환 (데이터가 부족하면 None)"""
+		if (size > self._size):
+			return None
+		if (size == 0):
+			return memoryview(b'')
+		return self._contiguous(size)
+
+
+	def skip(self, size: int) -> None:
+		"""앞쪽 size 바이트를 버림"""
+		size = min(size, self._size)
+		self._size -= size
+		self.scan_offset = 0
+		while (size > 0):
+			remain = len(self._chunks[0]) - self._offset
+			if (size < remain):
+				self._offset += size
+				return
+			size -= remain
+			self._chunks.popleft()
+			self._offset = 0
+
+
+
+class Framer(ABC):
+	"""ChunkBuffer에서 완성된 프레임을 하나씩 잘라내는 프레이머 (설정만 보관하므로 여러 파서에서 공유 가능)"""
+
+	@abstractmethod
+	def next_frame(self, buffer: ChunkBuffer) -> Optional[memoryview]:
+		"""완성된 프레임이 있으면 버퍼에서 꺼내어 반환 (없으면 None)
+
+		Raises:
+			ValueError: 프레임 길이가 max_length를 넘는 경우
+		"""
+
+
+	def encode(self, payload: bytes) -> bytes:
+		"""데이터를 이 프레이머 형식의 프레임으로 만들어 반환 (송신용)
+
+		Raises:
+			NotImplementedError: 프레임 형식을 데이터만으로 만들 수 없는 프레이머인 경우
+		"""
+		raise NotImplementedError(f"{type(self).__name__} does not support encode()")
+
+
+
+class LengthPrefixFramer(Framer):
+	"""[길이 필드][데이터] 형식의 프레이머 (길이 필드는 데이터 길이만 나타냄)"""
+
+	def __init__(self, length_format: str = '!I', include_header: bool = False, max_length: int = 16 * 1024 * 1024):
+		"""
+		Args:
+			length_format: 길이 필드의 struct 형식 (예: '!H', '!I', '<Q')
+			include_header: 반환하는 프레임에 길이 필드를 포함할지 여부
+			max_length: 허용하는 최대 데이터 길이
+		"""
+		self._length = struct.Struct(length_format)
+		self.include_header = include_header
+		self.max_length = max_length
+
+
+	def next_frame(self, buffer: ChunkBuffer) -> Optional[memoryview]:
+		header = buffer.peek(self._length.size)
+		if (header == None):
+			return None
+
+		(length,) = self._length.unpack(header)
+		if (length > self.max_length):
+			raise ValueError(f"Frame length exceeds max_length: {length} > {self.max_length}")
+		if (len(buffer) < (self._length.size + length)):
+			return None
+
+		frame = buffer.consume(self._length.size + length)
+		return frame if (self.include_header) else frame[self._length.size:]
+
+
+	def encode(self, payload: bytes) -> bytes:
+		return self._length.pack(len(payload)) + payload
+
+
+
+class DelimiterFramer(Framer):
+	"""구분자로 끝나는 프레임의 프레이머 (예: 줄 단위 텍스트)"""
+
+	def __init__(self, delimiter: bytes = b'\n', include_delimiter: bool = False, max_length: int = 1024 * 1024):
+		"""
+		Args:
+			delimiter: 프레임 구분자
+			include_delimiter: 반환하는 프레임에 구분자를 포함할지 여부
+			max_length: 구분자를 제외한 최대 프레임 길이
+		"""
+		self.delimiter = delimiter
+		self.include_delimiter = include_delimiter
+		self.max_length = max_length
+
+
+	def next_frame(self, buffer: ChunkBuffer) -> Optional[memoryview]:
+		index = buffer.find(self.delimiter, buffer.scan_offset)
+		if (index < 0):
+			if (len(buffer) > (self.max_length + len(self.delimiter))):
+				raise ValueError(f"Delimiter not found within max_length: {self.max_length}")
+			# 다음 수신 시 이미 탐색한 구간을 다시 탐색하지 않도록 위치 기록
+			buffer.scan_offset = max(0, len(buffer) - len(self.delimiter) + 1)
+			return None
+		if (index > self.max_length):
+			raise ValueError(f"Frame length exceeds max_length: {index} > {self.max_length}")
+
+		frame = buffer.consume(index + len(self.delimiter))
+		return frame if (self.include_delimiter) else frame[:index]
+
+
+	def encode(self, payload: bytes) -> bytes:
+		return payload + self.delimiter
+
+
+
+class FixedHeaderFramer(Framer):
+	"""[고정 길이 헤더][본문] 형식의 프레이머 (본문 길이는 헤더에서 계산)"""
+
+	def __init__(self, header_size: int, body_length: Callable[[memoryview], int], max_length: int = 16 * 1024 * 1024):
+		"""
+		Args:
+			header_size: 헤더 크기 (bytes)
+			body_length: 헤더를 받아 본문 길이를 반환하는 함수
+			max_length: 허용하는 최대 본문 길이
+		"""
+		self.header_size = header_size
+		self.body_length = body_length
+		self.max_length = max_length
+
+
+	def next_frame(self, buffer: ChunkBuffer) -> Optional[memoryview]:
+		header = buffer.peek(self.header_size)
+		if (header == None):
+			return None
+
+		length = self.body_length(header)
+		if (length > self.max_length):
+			raise ValueError(f"Frame length exceeds max_length: {length} > {self.max_length}")
+		if (len(buffer) < (self.header_size + length)):
+			return None
+		return buffer.consume(self.header_size + length) # 헤더 + 본문
+
+
+
 class BaseParser(ABC):
-	"""바이트 데이터를 메시지 패킷으로 파싱하는 기본 클래스"""
+	"""바이트 데이터를 메시지 패킷으로 파싱하는 기본 클래스
+
+	framer를 지정한 하위 클래스는 _buf 대신 ChunkBuffer에 청크를 보관하고, 완성된 프레임마다
+	handle_frame()을 호출합니다. 프레임은 memoryview이므로 필요한 부분만 변환하면 복사를 줄일 수 있습니다.
+	사용법:
+		class LengthPrefixedParser(BaseParser):
+			framer = LengthPrefixFramer('!I', include_header=True)
+	"""
+	framer: Optional[Framer] = None
 
 	def __init__(self, parser_uuid: UUID
 				, data_queue: Queue[bytes]
@@ -32,16 +286,86 @@ class BaseParser(ABC):
 			packet_queue: 파싱된 메시지 패킷을 담는 큐 (output)
 		"""
 		self._buf: bytearray = bytearray()
+		self._chunks = ChunkBuffer() # framer를 사용하는 경우의 수신 버퍼
 		self._running = False
 		self._parse_task: Optional[Task] = None
 		self.uuid = parser_uuid
 		self.data_queue = data_queue
 		self.packet_queue = packet_queue # 메시지 패킷 큐
+		self.observer: Optional[Callable[[int, int, float], None]] = None # 계측 콜백 (수신 바이트 수, 패킷 수, 파싱 시간(초))
+		self.intercept: Optional[Callable[[Any], bool]] = None # True를 반환한 패킷은 패킷 큐에 넣지 않음 (예: keepalive 자동 응답)
 		self.logger = getLogger(logger_name)
 
 		self.logger.debug(f"BaseParser 초기화: {data_queue=}, {packet_queue=}")
 
 
+	def feed(self, data: Union[bytes, bytearray, memoryview]) -> list[Any] | None:
+		"""수신한 바이트 데이터를 버퍼에 추가하고 완성된 패킷 목록 반환
+
+		Returns:
+			list[Any] | None: 완성된 패킷 목록 (없으면 None)
+		"""
+		if (self.framer == None):
+			self._buf.extend(data)
+			packets = self.parse()
+		else:
+			self._chunks.append(data)
+			packets = []
+			while True:
+				frame = self.framer.next_frame(self._chunks)
+				if (frame == None):
+					break
+				packet = self.handle_frame(frame)
+				if (packet is not None):
+					packets.append(packet)
+
+		if (packets and (self.intercept != None)):
+			packets = [packet for packet in packets if (not self.intercept(packet))]
+		return packets if packets else None
+
+
+	def build_keepalive(self, payload: bytes) -> bytes:
+		"""keepalive ping/pong 데이터를 송신할 바이트로 만들어 반환 (framer가 있으면 프레임으로 감쌈)
+
+		FixedHeaderFramer처럼 데이터만으로 프레임을 만들 수 없는 경우, 하위 클래스에서 재정의합니다.
+		"""
+		if (self.framer == None):
+			return payload
+		return self.framer.encode(payload)
+
+
+	def is_keepalive(self, packet: Any, payload: Optional[bytes]) -> bool:
+		"""파싱된 패킷이 keepalive ping/pong 데이터인지 확인 (str 패킷은 UTF-8로 변환하여 비교)
+
+		Args:
+			packet: 파싱된 패킷
+			payload: keepalive ping 또는 pong 데이터 (None이면 항상 False)
+		"""
+		if (payload == None):
+			return False
+		if (type(packet) is str):
+			packet = packet.encode('utf-8')
+		if (not isinstance(packet, (bytes, bytearray, memoryview))):
+			return False
+		if (packet == payload):
+			return True
+		if (self.framer == None):
+			return False
+		try:
+			return (packet == self.build_keepalive(payload)) # 헤더/구분자를 포함하는 프레임
+		except NotImplementedError:
+			return False
+
+
+	def handle_frame(self, frame: memoryview) -> Any:
+		"""framer가 잘라낸 프레임을 패킷으로 변환 (기본 동작: bytes로 변환)
+
+		프레임은 수신 청크를 가리키는 memoryview이므로, 하위 클래스에서 헤더 등 필요한 부분만
+		변환하면 복사 없이 처리할 수 있습니다. None을 반환하면 패킷 큐에 넣지 않습니다.
+		"""
+		return bytes(frame)
+
+
 	def parse(self) -> list[Any] | None:
 		"""파서에서 받은 바이트 데이터들을 조합 분석하여 패킷을 생성하여 메시지 패킷 큐에 입력합니다.
 			기본 동작: 바이트 데이터를 문자열로 변환하여 메시지 패킷 큐에 입력
@@ -73,9 +397,13 @@ class BaseParser(ABC):
 
 					if isinstance(data, str):
 						data = data.encode()
-					if isinstance(data, bytes):
-						self._buf.extend(data)
-						packets = self.parse()
+					if isinstance(data, (bytes, bytearray, memoryview)):
+						if (self.observer == None):
+							packets = self.feed(data)
+						else:
+							start_time = perf_counter()
+							packets = self.feed(data)
+							self.observer(len(data), len(packets) if packets else 0, perf_counter() - start_time)
 						if (packets):
 							for packet in packets:
 								await self.packet_queue.put((self.uuid, packet))
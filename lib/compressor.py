@@ -0,0 +1,367 @@
+# 백업 파일 및 로그 파일 압축을 위한 공용 압축기 모듈
+# date: 2026-10-18
+# author: hbesthee@naver.com
+#-*- coding: utf-8 -*-
+# use tab char size: 4
+
+# Original Packages
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from logging import getLogger
+from multiprocessing import get_context
+from os import cpu_count, path, remove, replace
+from threading import RLock, Thread
+from typing import Callable, Final, Optional, Tuple
+
+import gzip
+import zlib
+
+
+# Third-party Packages (선택 사항: 설치되지 않은 경우 gzip으로 대체)
+try:
+	import zstandard
+except ImportError:
+	zstandard = None
+
+try:
+	import lz4.frame as lz4_frame
+except ImportError:
+	lz4_frame = None
+
+
+
+ProgressCallback = Callable[[int, int], None] # (처리한 바이트 수, 전체 바이트 수)
+
+
+
+class Codec(Enum):
+	GZIP = "gzip"		# 표준 라이브러리 (블록 단위 멀티스레드 압축)
+	ZSTD = "zstd"		# zstandard 패키지 필요
+	LZ4 = "lz4"			# lz4 패키지 필요
+
+
+CODEC_EXTENSIONS: Final[dict] = {
+	Codec.GZIP: '.gz',
+	Codec.ZSTD: '.zst',
+	Codec.LZ4: '.lz4',
+}
+COMPRESSED_EXTENSIONS: Final[Tuple[str, ...]] = tuple(CODEC_EXTENSIONS.values())
+
+
+
+def codec_from_path(file_path: str) -> Optional[Codec]:
+	"""파일 확장자로 압축 방식 판별 (압축 파일이 아니면 None)"""
+	for codec, extension in CODEC_EXTENSIONS.items():
+		if (file_path.endswith(extension)):
+			return codec
+	return None
+
+
+def is_available(codec: Codec) -> bool:
+	"""압축 방식에 필요한 패키지가 설치되어 있는지 여부"""
+	if (codec == Codec.ZSTD):
+		return (zstandard != None)
+	if (codec == Codec.LZ4):
+		return (lz4_frame != None)
+	return True
+
+
+def strip_extension(file_path: str) -> str:
+	"""압축 파일 확장자를 제거한 경로 반환"""
+	codec = codec_from_path(file_path)
+	return file_path[:-len(CODEC_EXTENSIONS[codec])] if (codec != None) else file_path
+
+
+def compress_file(source: str, dest: Optional[str] = None, codec: Codec = Codec.GZIP, level: int = 6,
+				threads: int = 0, block_size: int = 1 << 20, progress: Optional[ProgressCallback] = None,
+				remove_source: bool = False) -> str:
+	"""
+	파일을 스트리밍 방식으로 압축 (현재 프로세스에서 실행)
+
+	gzip은 블록마다 독립된 gzip 멤버로 압축하여 여러 스레드에서 동시에 압축합니다. 여러 멤버가 이어진
+	파일은 표준 gzip 형식이므로 gzip.open() 등으로 그대로 읽을 수 있습니다.
+	압축 파일은 임시 파일에 기록한 뒤 완료 시 이름을 바꾸므로, 중간에 실패해도 불완전한 압축 파일이 남지 않습니다.
+
+	Args:
+		source: 압축할 파일 경로
+		dest: 압축 파일 경로 (생략 시 source에 압축 방식별 확장자를 붙인 경로)
+		codec: 압축 방식
+		level: 압축 수준
+		threads: 압축 스레드 수 (0이면 CPU 수)
+		block_size: 한 번에 읽어 압축할 블록 크기 (bytes)
+		progress: 블록을 기록할 때마다 (처리한 바이트 수, 전체 바이트 수)로 호출되는 콜백
+		remove_source: 압축 완료 후 원본 파일 삭제 여부
+
+	Returns:
+		str: 압축 파일 경로
+
+	Raises:
+		ValueError: 압축 방식에 필요한 패키지가 설치되지 않은 경우
+	"""
+	if (not is_available(codec)):
+		raise ValueError(f"Codec is not available: {codec.value}")
+
+	dest = dest or f"{source}{CODEC_EXTENSIONS[codec]}"
+	temp_path = f"{dest}.tmp"
+	threads = threads or cpu_count() or 1
+	total = path.getsize(source)
+
+	try:
+		with open(source, 'rb') as f_in, open(temp_path, 'wb') as f_out:
+			if (codec == Codec.ZSTD):
+				_compress_zstd(f_in, f_out, level, threads, block_size, total, progress)
+			elif (codec == Codec.LZ4):
+				_compress_lz4(f_in, f_out, level, block_size, total, progress)
+			else:
+				_compress_gzip(f_in, f_out, level, threads, block_size, total, progress)
+		replace(temp_path, dest)
+	except Exception:
+		if path.exists(temp_path):
+			remove(temp_path)
+		raise
+
+	if (remove_source):
+		remove(source)
+	return dest
+
+
+def decompress_file(source: str, dest: Optional[str] = None, block_size: int = 1 << 20) -> str:
+	"""
+	압축 파일의 압축 해제 (압축 방식은 확장자로 판별)
+
+	Args:
+		source: 압축 파일 경로
+		dest: 압축 해제할 파일 경로 (생략 시 source에서 압축 확장자를 제거한 경로)
+		block_size: 한 번에 기록할 블록 크기 (bytes)
+
+	Returns:
+		str: 압축 해제된 파일 경로
+	"""
+	dest = dest or strip_extension(source)
+	temp_path = f"{dest}.tmp"
+	try:
+		with open_compressed(source) as f_in, open(temp_path, 'wb') as f_out:
+			while (block := f_in.read(block_size)):
+				f_out.write(block)
+		replace(temp_path, dest)
+	except Exception:
+		if path.exists(temp_path):
+			remove(temp_path)
+		raise
+	return dest
+
+
+def open_compressed(file_path: str):
+	"""압축 파일을 읽기용 파일 객체로 열기 (압축 방식은 확장자로 판별)
+
+	Raises:
+		ValueError: 압축 파일 확장자가 아니거나 필요한 패키지가 설치되지 않은 경우
+	"""
+	codec = codec_from_path(file_path)
+	if (codec == None):
+		raise ValueError(f"Unknown compressed file extension: {file_path}")
+	if (not is_available(codec)):
+		raise ValueError(f"Codec is not available: {codec.value}")
+
+	if (codec == Codec.ZSTD):
+		return zstandard.open(file_path, 'rb')
+	if (codec == Codec.LZ4):
+		return lz4_frame.open(file_path, 'rb')
+	return gzip.open(file_path, 'rb')
+
+
+def _compress_gzip(f_in, f_out, level: int, threads: int, block_size: int, total: int,
+					progress: Optional[ProgressCallback]):
+	"""블록마다 gzip 멤버를 만들어 스레드 풀에서 압축 (zlib은 GIL을 해제하므로 병렬로 실행됨)"""
+	compress_block = lambda block: zlib.compress(block, level, wbits=31) # wbits=31: gzip 헤더/트레일러 포함
+
+	if (threads <= 1):
+		_write_blocks(f_in, f_out, compress_block, block_size, total, progress)
+		return
+
+	done = 0
+	pending = deque()
+	with ThreadPoolExecutor(max_workers=threads) as executor:
+		while True:
+			# 메모리 사용량을 제한하기 위해 스레드 수의 2배까지만 블록을 미리 읽음
+			while (len(pending) < (threads * 2)):
+				block = f_in.read(block_size)
+				if (not block):
+					break
+				pending.append((len(block), executor.submit(compress_block, block)))
+			if (not pending):
+				break
+
+			block_length, future = pending.popleft()
+			f_out.write(future.result())
+			done += block_length
+			if (progress != None):
+				progress(done, total)
+
+	if (total == 0):
+		f_out.write(compress_block(b''))
+
+
+def _compress_lz4(f_in, f_out, level: int, block_size: int, total: int, progress: Optional[ProgressCallback]):
+	"""lz4 프레임 형식으로 스트리밍 압축"""
+	with lz4_frame.LZ4FrameCompressor(compression_level=level) as compressor:
+		f_out.write(compressor.begin())
+		_write_blocks(f_in, f_out, compressor.compress, block_size, total, progress)
+		f_out.write(compressor.flush())
+
+
+def _compress_zstd(f_in, f_out, level: int, threads: int, block_size: int, total: int,
+					progress: Optional[ProgressCallback]):
+	"""zstd 형식으로 스트리밍 압축 (zstandard 자체 멀티스레드 압축 사용)"""
+	compressor = zstandard.ZstdCompressor(level=level, threads=threads if (threads > 1) else 0)
+	with compressor.stream_writer(f_out, size=total, closefd=False) as writer:
+		_write_blocks(f_in, writer, lambda block: block, block_size, total, progress)
+
+
+def _compress_worker(source: str, dest: Optional[str], codec: Codec, level: int, threads: int, block_size: int,
+					progress_queue, remove_source: bool) -> str:
+	"""프로세스 풀에서 실행되는 압축 작업 (진행 상황은 progress_queue로 전달)"""
+	progress = None
+	if (progress_queue != None):
+		progress = lambda done, total: progress_queue.put((done, total))
+
+	try:
+		return compress_file(source, dest, codec, level, threads, block_size, progress, remove_source)
+	finally:
+		if (progress_queue != None):
+			progress_queue.put(None)
+
+
+def _write_blocks(f_in, f_out, transform: Callable[[bytes], bytes], block_size: int, total: int,
+					progress: Optional[ProgressCallback]):
+	"""블록 단위로 읽어 변환한 결과를 기록"""
+	done = 0
+	while (block := f_in.read(block_size)):
+		f_out.write(transform(block))
+		done += len(block)
+		if (progress != None):
+			progress(done, total)
+
+
+
+class Compressor:
+	"""압축 방식, 압축 수준, 스레드 수 설정을 보관하고 압축 작업을 백그라운드 실행하는 압축기
+
+	processes가 1 이상이면 별도 프로세스 풀에서 압축하므로, 큰 파일을 압축하는 동안에도
+	호출한 프로세스의 로깅이나 DB 쓰기가 GIL 경쟁으로 지연되지 않습니다.
+	사용법:
+		from lib.compressor import Codec, Compressor
+
+		compressor = Compressor(codec=Codec.ZSTD, level=3, processes=1)
+		future = compressor.submit('backup-202501.db', remove_source=True)
+		compressed_path = future.result()
+		compressor.close()
+	"""
+
+	def __init__(self, codec: Codec = Codec.GZIP, level: Optional[int] = None, threads: int = 0,
+				block_size: int = 1 << 20, processes: int = 1, logger_name: str = 'compressor'):
+		"""
+		Args:
+			codec: 압축 방식 (필요한 패키지가 설치되지 않았으면 gzip으로 대체)
+			level: 압축 수준 (생략 시 gzip 6, zstd 3, lz4 0)
+			threads: 파일 하나를 압축할 때 사용할 스레드 수 (0이면 CPU 수)
+			block_size: 한 번에 읽어 압축할 블록 크기 (bytes)
+			processes: 압축 프로세스 풀의 크기 (0이면 프로세스 풀 대신 스레드에서 실행)
+			logger_name: 로거 이름
+		"""
+		self.logger = getLogger(logger_name)
+		if (not is_available(codec)):
+			self.logger.warning(f"Codec {codec.value} is not available, fallback to gzip")
+			codec = Codec.GZIP
+
+		self.codec = codec
+		self.level = level if (level != None) else {Codec.GZIP: 6, Codec.ZSTD: 3, Codec.LZ4: 0}[codec]
+		self.threads = threads
+		self.block_size = block_size
+		self.processes = max(0, processes)
+
+		self._executor: Optional[Executor] = None
+		self._progress_manager = None
+		self._lock = RLock()
+
+
+	@property
+	def extension(self) -> str:
+		"""압축 파일 확장자"""
+		return CODEC_EXTENSIONS[self.codec]
+
+
+	def _get_executor(self) -> Executor:
+		"""압축 작업을 실행할 실행기 (처음 사용할 때 생성)"""
+		with self._lock:
+			if (self._executor == None):
+				if (self.processes > 0):
+					# 스레드를 사용하는 프로세스에서 fork하면 잠금 상태가 복제될 수 있으므로 spawn 사용
+					self._executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=get_context('spawn'))
+				else:
+					self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='compressor')
+			return self._executor
+
+
+	def _relay_progress(self, progress_queue, progress: ProgressCallback):
+		"""프로세스 풀의 진행 상황을 현재 프로세스의 콜백으로 전달"""
+		while True:
+			item = progress_queue.get()
+			if (item == None):
+				break
+			try:
+				progress(*item)
+			except Exception as e:
+				self.logger.error(f"Progress callback error: {e}")
+
+
+	def close(self, wait: bool = True):
+		"""실행기 종료
+
+		Args:
+			wait: 실행 중인 압축 작업이 끝날 때까지 대기할지 여부
+		"""
+		with self._lock:
+			if (self._executor != None):
+				self._executor.shutdown(wait=wait)
+				self._executor = None
+			if (self._progress_manager != None):
+				self._progress_manager.shutdown()
+				self._progress_manager = None
+
+
+	def compress(self, source: str, dest: Optional[str] = None, progress: Optional[ProgressCallback] = None,
+				remove_source: bool = False) -> str:
+		"""현재 스레드에서 압축 (인자는 compress_file()과 같음)"""
+		return compress_file(source, dest, self.codec, self.level, self.threads, self.block_size, progress, remove_source)
+
+
+	def submit(self, source: str, dest: Optional[str] = None, progress: Optional[ProgressCallback] = None,
+				remove_source: bool = False) -> Future:
+		"""
+		압축 작업을 백그라운드(프로세스 풀 또는 스레드)에서 실행
+
+		Args:
+			source: 압축할 파일 경로
+			dest: 압축 파일 경로 (생략 시 source에 압축 방식별 확장자를 붙인 경로)
+			progress: (처리한 바이트 수, 전체 바이트 수)로 호출되는 콜백 (현재 프로세스의 별도 스레드에서 호출)
+			remove_source: 압축 완료 후 원본 파일 삭제 여부
+
+		Returns:
+			Future: 결과로 압축 파일 경로를 반환하는 Future
+		"""
+		executor = self._get_executor()
+		if (self.processes == 0):
+			return executor.submit(self.compress, source, dest, progress, remove_source)
+
+		progress_queue = None
+		if (progress != None):
+			with self._lock:
+				if (self._progress_manager == None):
+					self._progress_manager = get_context('spawn').Manager()
+				progress_queue = self._progress_manager.Queue()
+			Thread(target=self._relay_progress, args=(progress_queue, progress), daemon=True).start()
+
+		return executor.submit(_compress_worker, source, dest, self.codec, self.level, self.threads,
+				self.block_size, progress_queue, remove_source)
@@ -5,26 +5,399 @@
 # use tab char size: 4
 
 # Original Packages
-from logging import getLogger, Formatter, Logger, StreamHandler, INFO, WARNING
-from logging.handlers import TimedRotatingFileHandler
-from os import path, remove, rename
-
-import gzip
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from logging import getLogger, Formatter, Handler, Logger, LogRecord, StreamHandler, INFO, WARNING
+from logging.handlers import QueueHandler, TimedRotatingFileHandler
+from multiprocessing import get_context
+from os import path, rename
+from queue import Empty, Full, Queue
+from threading import Thread
+from time import monotonic
+from typing import Any, Dict, List, Optional
+
+import atexit
+import json
 import os
+import signal
+
+
+
+# User's Package 들을 포함시키기 위한 sys.path에 프로젝트 폴더 추가하기
+from pathlib import Path
+from sys import path as sys_path
+project_folder = str(Path(__file__).parent.parent)
+if (not project_folder in sys_path):
+	sys_path.append(str(project_folder))
+
+
+# User's Package
+from lib.compressor import Compressor
+from lib.log_index import build_index
+
+
+
+LOG_FORMAT_JSON = 'json' # log_format에 지정하면 JSON-lines 형식으로 기록하고, 로테이션 시 블록 색인 생성
+
 
 
 class GZipRotator:
-	""" 로그를 분할 처리할 때 로그 파일을 압축하는데 이용하는 Rotator """
+	""" 로그를 분할 처리할 때 로그 파일을 압축하는데 이용하는 Rotator
+
+	압축은 백그라운드에서 실행하므로 로그 기록(emit)이 압축이 끝날 때까지 멈추지 않습니다.
+	"""
+
+	def __init__(self, compressor: Optional[Compressor] = None):
+		"""
+		Args:
+			compressor: 로그 파일 압축기 (생략 시 백그라운드 스레드에서 gzip으로 압축)
+		"""
+		self._compressor = compressor
+
+
+	def __call__(self, source, dest):
+		if ( path.exists(source) and (not path.exists(dest)) ):
+			rename(source, dest)
+			future = self.compressor.submit(dest, f'{dest}{self.compressor.extension}', remove_source=True)
+			future.add_done_callback(self._on_compressed)
+
+
+	@staticmethod
+	def _on_compressed(future):
+		if (future.exception() != None):
+			getLogger(__name__).error(f'Failed to compress rotated log: {future.exception()}')
+
+
+	@property
+	def compressor(self) -> Compressor:
+		""" 로그 파일 압축기 (지정하지 않았으면 처음 사용할 때 생성) """
+		if (self._compressor == None):
+			# 로거는 임의의 스크립트에서 사용되므로, 기본값은 스크립트를 다시 import하는 spawn 프로세스 대신 스레드 사용
+			self._compressor = Compressor(processes=0)
+		return self._compressor
+
+
+
+class IndexedGZipRotator(GZipRotator):
+	""" 분할된 로그 파일을 줄 경계에 맞춘 블록 단위 gzip으로 압축하고, 블록별 시간/레벨 색인(.gz.idx)을 만드는 Rotator
+
+	압축 파일은 표준 gzip 형식이며, lib/log_index.py의 query 명령은 색인으로 조건에 맞는 블록만 읽습니다.
+	"""
+
+	def __init__(self, level: int = 6):
+		"""
+		Args:
+			level: gzip 압축 수준
+		"""
+		super().__init__() # 압축은 build_index가 처리하므로 compressor는 생성되지 않음
+		self.level = level
+		self._executor = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = 'IndexedGZipRotator')
+
 
 	def __call__(self, source, dest):
 		if ( path.exists(source) and (not path.exists(dest)) ):
 			rename(source, dest)
-			f_in = open(dest, 'rb')
-			f_out = gzip.open(f'{dest}.gz', 'wb')
-			f_out.writelines(f_in)
-			f_out.close()
-			f_in.close()
-			remove(dest)
+			future = self._executor.submit(build_index, dest, level = self.level, remove_source = True)
+			future.add_done_callback(self._on_compressed)
+
+
+
+class JsonLinesFormatter(Formatter):
+	""" 레코드를 한 줄의 JSON 객체로 기록하는 Formatter (JSON-lines)
+
+	기본 항목: ts(epoch 초), time, level, levelno, logger, module, line, process, msg, exc(예외 정보가 있을 때)
+	extra로 전달한 값(예: ConnectionLoggerAdapter의 conn)도 같은 객체에 기록합니다.
+	"""
+	_RESERVED = frozenset(LogRecord('', 0, '', 0, '', (), None).__dict__) | {'message', 'asctime'}
+
+	def format(self, record: LogRecord) -> str:
+		entry = {
+			'ts': round(record.created, 6),
+			'time': datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
+			'level': record.levelname,
+			'levelno': record.levelno,
+			'logger': record.name,
+			'module': record.module,
+			'line': record.lineno,
+			'process': record.process,
+			'msg': record.getMessage(),
+		}
+		if (record.exc_info):
+			record.exc_text = record.exc_text or self.formatException(record.exc_info)
+		if (record.exc_text):
+			entry['exc'] = record.exc_text
+		if (record.stack_info):
+			entry['stack'] = self.formatStack(record.stack_info)
+		for key, value in record.__dict__.items():
+			if (key not in self._RESERVED):
+				entry[key] = value
+		return json.dumps(entry, ensure_ascii = False, default = str)
+
+
+class _BatchFlushMixin:
+	""" 레코드마다 호출되는 flush()를 미루고, BatchQueueListener가 배치를 기록한 뒤 flush_now()로 한 번에 flush 하도록 하는 Mixin """
+
+	def close(self):
+		self.flush_now()
+		super().close()
+
+
+	def flush(self):
+		pass
+
+
+	def flush_now(self):
+		super().flush()
+
+
+
+class BatchStreamHandler(_BatchFlushMixin, StreamHandler):
+	""" flush를 배치 단위로 하는 StreamHandler (BatchQueueListener 전용) """
+
+
+
+class BatchTimedRotatingFileHandler(_BatchFlushMixin, TimedRotatingFileHandler):
+	""" flush를 배치 단위로 하는 TimedRotatingFileHandler (BatchQueueListener 전용)
+
+	리스너 스레드에서만 호출되므로 자정 로테이션과 압축 요청도 리스너 스레드에서 처리됩니다.
+	"""
+
+
+
+class DropQueueHandler(QueueHandler):
+	""" 크기가 제한된 큐가 가득 찼을 때 기다리지 않고 레코드를 버리는 QueueHandler
+
+	같은 프로세스의 리스너 스레드로만 전달하므로 prepare()에서 메시지를 만들지 않습니다.
+	(메시지 형식화도 리스너 스레드에서 처리되므로, 로그 인자로 이후에 변경되는 객체를 전달하면 안 됩니다)
+	"""
+	DROP_NEW = 'new' # 새 레코드를 버림
+	DROP_OLD = 'old' # 가장 오래된 레코드를 버리고 새 레코드를 넣음
+
+	def __init__(self, queue: Queue, drop_policy: str = DROP_NEW):
+		"""
+		Args:
+			queue: 리스너와 공유하는 큐
+			drop_policy: 큐가 가득 찼을 때 버릴 레코드 ; DROP_NEW ('new') 또는 DROP_OLD ('old')
+		"""
+		super().__init__(queue)
+		if (drop_policy not in (self.DROP_NEW, self.DROP_OLD)):
+			raise ValueError(f'Unknown drop_policy: {drop_policy}')
+		self.drop_policy = drop_policy
+		self.dropped = 0
+
+
+	def enqueue(self, record: LogRecord):
+		try:
+			self.queue.put_nowait(record)
+			return
+		except Full:
+			pass
+
+		self.dropped += 1
+		if (self.drop_policy == self.DROP_OLD):
+			try:
+				self.queue.get_nowait()
+				self.queue.put_nowait(record)
+			except (Empty, Full):
+				pass
+
+
+	def prepare(self, record: LogRecord) -> LogRecord:
+		return record
+
+
+
+class BatchQueueListener:
+	""" 큐의 레코드를 batch_size 개까지 모아 기록하고, flush_interval 초마다 (또는 큐가 비었을 때) 핸들러를 flush 하는 리스너
+
+	logging.handlers.QueueListener와 사용법(start, stop, handlers)은 같지만, Python 버전마다 다른
+	QueueListener의 비공개 구현(_monitor)에 의존하지 않도록 리스너 스레드를 직접 구현합니다.
+	"""
+	_SENTINEL = None # 리스너 스레드 종료 표시
+
+	def __init__(self, queue: Queue, *handlers: Handler, batch_size: int = 256, flush_interval: float = 1.0
+			, respect_handler_level: bool = True):
+		"""
+		Args:
+			queue: DropQueueHandler와 공유하는 큐
+			handlers: 리스너 스레드에서 실행할 핸들러 (flush_now()가 있으면 배치 후에 한 번만 flush)
+			batch_size: 한 번에 꺼내 기록하는 최대 레코드 수
+			flush_interval: 기록한 레코드를 flush 하기까지 최대 대기 시간 (초)
+			respect_handler_level: 핸들러의 레벨보다 낮은 레코드는 해당 핸들러에 전달하지 않음
+		"""
+		self.queue = queue
+		self.handlers = handlers
+		self.batch_size = max(1, batch_size)
+		self.flush_interval = flush_interval
+		self.respect_handler_level = respect_handler_level
+		self._thread: Optional[Thread] = None
+
+
+	def _flush(self):
+		for handler in self.handlers:
+			flush = getattr(handler, 'flush_now', handler.flush)
+			try:
+				flush()
+			except Exception:
+				pass # flush 실패로 리스너 스레드가 종료되지 않도록 함
+
+
+	def _run(self):
+		q = self.queue
+		has_task_done = hasattr(q, 'task_done')
+		pending = False # flush 하지 않은 레코드가 있는지 여부
+		last_flush = monotonic()
+		while True:
+			timeout = max(0.0, last_flush + self.flush_interval - monotonic()) if pending else None
+			try:
+				batch = [q.get(True, timeout)]
+			except Empty:
+				self._flush()
+				pending, last_flush = False, monotonic()
+				continue
+			while (len(batch) < self.batch_size):
+				try:
+					batch.append(q.get_nowait())
+				except Empty:
+					break
+
+			stop = False
+			for record in batch:
+				if (record is self._SENTINEL):
+					stop = True
+				elif (not stop):
+					self.handle(record)
+				if has_task_done:
+					q.task_done()
+			pending = True
+
+			if (stop or ((monotonic() - last_flush) >= self.flush_interval)):
+				self._flush()
+				pending, last_flush = False, monotonic()
+			if stop:
+				break
+
+
+	def handle(self, record: LogRecord):
+		""" 레코드를 핸들러들에 전달 (리스너 스레드에서 호출) """
+		for handler in self.handlers:
+			if ((not self.respect_handler_level) or (record.levelno >= handler.level)):
+				handler.handle(record)
+
+
+	def start(self):
+		""" 리스너 스레드를 시작합니다. """
+		self._thread = Thread(target = self._run, name = 'BatchQueueListener', daemon = True)
+		self._thread.start()
+
+
+	def stop(self):
+		""" 큐에 남은 레코드를 모두 기록하고 flush 한 뒤 리스너 스레드를 종료합니다. """
+		if (self._thread == None):
+			return
+		self.queue.put(self._SENTINEL) # 큐가 가득 차 있어도 리스너가 비우는 중이므로 기다림
+		self._thread.join()
+		self._thread = None
+
+
+
+class LogForwardHandler(QueueHandler):
+	""" 레코드를 LogCollector 프로세스로 보내는 핸들러 (자식 프로세스용)
+
+	multiprocessing 큐의 put은 백그라운드 feeder 스레드가 전송하므로 호출한 스레드는 파일 I/O나 잠금을 기다리지 않습니다.
+	레코드는 prepare()에서 메시지를 만들고 인자/예외 정보를 제거하여 pickle 가능한 상태로 보냅니다.
+	"""
+	def __init__(self, queue: Any):
+		super().__init__(queue)
+		self.dropped = 0
+
+
+	def enqueue(self, record: LogRecord):
+		try:
+			self.queue.put_nowait((LogCollector.RECORD, record))
+		except Full:
+			self.dropped += 1
+
+
+
+def _run_log_collector(queue: Any):
+	""" (LogCollector 프로세스) 설정 메시지로 파일 핸들러를 만들고, 받은 레코드를 같은 이름의 로거로 기록 """
+	signal.signal(signal.SIGINT, signal.SIG_IGN) # Ctrl+C는 부모 프로세스가 처리하고, 남은 레코드를 기록한 뒤 종료
+	while True:
+		message = queue.get()
+		if (message == None):
+			break
+		kind, payload = message
+		try:
+			if (kind == LogCollector.CONFIG):
+				if (not os.path.exists(payload['log_path'])):
+					os.makedirs(payload['log_path'])
+				createLogger(**payload)
+			elif (kind == LogCollector.RECORD):
+				getLogger(payload.name).handle(payload)
+		except Exception as e:
+			getLogger(__name__).error(f'LogCollector failed to handle {kind} message: {e}')
+	_close_all_loggers()
+
+
+
+class LogCollector:
+	""" 여러 프로세스의 로그를 하나의 프로세스에서 파일로 기록하는 로그 수집기
+
+	파일 핸들러(로테이션, 압축 포함)는 수집기 프로세스에만 있으므로, 여러 프로세스가 같은 파일에 쓰거나
+	로테이션 시 파일 이름을 바꾸면서 충돌하지 않습니다.
+	사용법:
+		collector = LogCollector()
+		collector.start()
+		worker = Process(target=work, args=(collector.queue, ))	# 자식 프로세스에 큐 전달
+		...
+		log = createLogger(log_filename = 'worker', log_collector = queue)	# 자식 프로세스에서
+		...
+		collector.stop()
+	"""
+	CONFIG = 'config'
+	RECORD = 'record'
+
+	def __init__(self, queue_max_size = 0, start_method = None):
+		"""
+		Args:
+			queue_max_size (int): 수집 큐의 최대 메시지 수 (0: 무제한, 가득 차면 LogForwardHandler가 레코드를 버림)
+			start_method (str): multiprocessing 시작 방식 ('fork', 'spawn' 등, None: 기본값)
+		"""
+		self._context = get_context(start_method)
+		self.queue = self._context.Queue(queue_max_size)
+		self._process = None
+
+
+	def is_alive(self) -> bool:
+		return ((self._process != None) and self._process.is_alive())
+
+
+	def start(self):
+		""" 수집기 프로세스를 시작합니다. """
+		if self.is_alive():
+			return
+		self._process = self._context.Process(target = _run_log_collector, args = (self.queue, ), name = 'LogCollector')
+		self._process.start()
+		atexit.register(self.stop)
+
+
+	def stop(self, timeout: float = 5.0):
+		""" 큐에 남은 레코드를 모두 기록한 뒤 수집기 프로세스를 종료합니다. """
+		if (self._process == None):
+			return
+		if self._process.is_alive():
+			self.queue.put(None)
+			self._process.join(timeout)
+			if self._process.is_alive():
+				self._process.terminate()
+		self._process = None
+		atexit.unregister(self.stop)
+
+
+
+_queue_listeners: Dict[Optional[str], BatchQueueListener] = {} # logger_name -> 큐 모드 로거의 리스너
+
 
 
 class FileLogger:
@@ -34,6 +407,8 @@ class FileLogger:
 
 		logger = FileLogger(log_filename = 'test_logger', log_path = '/tmp/test')
 		logger.info('start test app')
+
+	log_queue = True 이면 로그 호출은 큐에 레코드를 넣기만 하고, 파일/콘솔 기록과 로테이션은 리스너 스레드에서 처리합니다.
 	"""
 	__log = None
 
@@ -44,7 +419,13 @@ class FileLogger:
 			, log_level = WARNING
 			, log_console = True
 			, logger_name = None
-			, log_format = '%(asctime)s %(levelname)s %(module)s.%(lineno)d] %(message)s'):
+			, log_format = '%(asctime)s %(levelname)s %(module)s.%(lineno)d] %(message)s'
+			, log_queue = False
+			, queue_max_size = 10000
+			, drop_policy = DropQueueHandler.DROP_NEW
+			, flush_interval = 1.0
+			, batch_size = 256
+			, log_collector = None):
 		"""Logger 클래스를 초기화합니다.
 
 		Args:
@@ -53,7 +434,13 @@ class FileLogger:
 			log_ext (string): 로깅 파일 기본 확장자 ; ".log"
 			log_level : 로깅 레벨 = logging.DEBUG (10), logging.INFO (20), logging.WARNING (30), logging.ERROR (40), logging.CRITICAL (50)
 			log_console (boolean): 콘솔로도 로깅 출력 여부
-			log_format (str): Formatter로 전달할 로그 포맷 문자열
+			log_format (str): Formatter로 전달할 로그 포맷 문자열 (LOG_FORMAT_JSON: JSON-lines 형식, 로테이션 시 블록 색인 생성)
+			log_queue (boolean): 큐와 리스너 스레드를 통해 기록할지 여부
+			queue_max_size (int): (log_queue) 큐의 최대 레코드 수 (가득 차면 drop_policy에 따라 버림)
+			drop_policy (str): (log_queue) 큐가 가득 찼을 때 버릴 레코드 ; 'new' (새 레코드) 또는 'old' (가장 오래된 레코드)
+			flush_interval (float): (log_queue) 기록한 레코드를 flush 하기까지 최대 대기 시간 (초)
+			batch_size (int): (log_queue) 리스너가 한 번에 기록하는 최대 레코드 수
+			log_collector (multiprocessing.Queue): LogCollector.queue를 지정하면 파일 대신 수집기 프로세스로 레코드를 보냄
 		"""
 
 		self.log_path		= log_path
@@ -68,40 +455,22 @@ class FileLogger:
 		if not os.path.exists(self.log_path):
 			os.makedirs(self.log_path)
 
-		self.__log = self.__createLogger()
+		self.__log = createLogger(log_path = self.log_path, log_filename = self.log_filename, log_ext = self.log_ext
+				, log_level = self.log_level, log_console = self.log_console, logger_name = self._logger_name
+				, log_format = self.log_format, log_queue = log_queue, queue_max_size = queue_max_size
+				, drop_policy = drop_policy, flush_interval = flush_interval, batch_size = batch_size
+				, log_collector = log_collector)
 
 
-	def __createLogger(self):
-		"""실제 로깅 처리를 위한 객체를 생성하고 초기화합니다.
+	def close(self):
+		"""(log_queue) 큐에 남은 레코드를 모두 기록하고 리스너 스레드를 종료합니다."""
+		closeLogger(self._logger_name)
 
-		Returns:
-			logging.Logger: 로깅처리 실 객체
-		"""
-		# intialize logger
-		log = getLogger(self._logger_name)
-		if (len(log.handlers) > 0):
-			return log
-		log.setLevel(self.log_level) 
-
-		# Make file handler
-		LOG_FILENAME = self.log_path + '/' + self.log_filename + self.log_ext
-		file_handler = TimedRotatingFileHandler(
-			filename = LOG_FILENAME, when = 'midnight', interval = 1
-			, backupCount = 100, encoding = 'utf-8'
-		) # Rotate at midnight
-		file_handler.suffix = "%Y%m%d" # add file date
-
-		formatter = Formatter(self.log_format)
-		log.addHandler(file_handler)
-		file_handler.setFormatter(formatter)
-		if (self.log_console == True):
-			stream_handler = StreamHandler()
-			log.addHandler(stream_handler)
-			stream_handler.setFormatter(formatter)
-		#log.debug('created')
-		file_handler.rotator = GZipRotator() # 압축 분할 처리
 
-		return log
+	@property
+	def dropped(self) -> int:
+		"""(log_queue) 큐가 가득 차서 버린 레코드 수"""
+		return sum(handler.dropped for handler in self.__log.handlers if isinstance(handler, (DropQueueHandler, LogForwardHandler)))
 
 
 	def critical(self, msg, *args, **kwargs):
@@ -129,13 +498,41 @@ class FileLogger:
 			self.__log.warning(msg, *args, **kwargs)
 
 
+def closeLogger(logger_name = None):
+	"""큐 모드(log_queue = True)로 생성한 로거의 남은 레코드를 모두 기록하고 리스너 스레드를 종료합니다.
+
+	Args:
+		logger_name (str): createLogger()에 지정한 로거 이름
+	"""
+	listener = _queue_listeners.pop(logger_name, None)
+	if (listener == None):
+		return
+
+	# 큐 핸들러를 먼저 제거하여, 종료 표시를 넣는 동안 DROP_OLD 정책이 종료 표시를 버리지 않도록 함
+	log = getLogger(logger_name)
+	for handler in list(log.handlers):
+		if isinstance(handler, DropQueueHandler):
+			log.removeHandler(handler)
+			handler.close()
+
+	listener.stop()
+	for handler in listener.handlers:
+		handler.close()
+
+
 def createLogger(log_path = './logs'
 			, log_filename = 'logger'
 			, log_ext = '.log'
 			, log_level = WARNING
 			, log_console = True
 			, logger_name = None
-			, log_format = '%(asctime)s %(levelname)s %(module)s.%(lineno)d] %(message)s') -> Logger:
+			, log_format = '%(asctime)s %(levelname)s %(module)s.%(lineno)d] %(message)s'
+			, log_queue = False
+			, queue_max_size = 10000
+			, drop_policy = DropQueueHandler.DROP_NEW
+			, flush_interval = 1.0
+			, batch_size = 256
+			, log_collector = None) -> Logger:
 	"""Logger 클래스를 초기화합니다.
 
 	Args:
@@ -144,7 +541,14 @@ def createLogger(log_path = './logs'
 		log_ext (str): 로깅 파일 기본 확장자 ; ".log"
 		log_level : 로깅 레벨 = logging.DEBUG (10), logging.INFO (20), logging.WARNING (30), logging.ERROR (40), logging.CRITICAL (50)
 		log_console (boolean): 콘솔로도 로깅 출력 여부
-		log_format (str): Formatter로 전달할 로그 포맷 문자열
+		log_format (str): Formatter로 전달할 로그 포맷 문자열 (LOG_FORMAT_JSON: JSON-lines 형식, 로테이션 시 블록 색인 생성)
+		log_queue (boolean): 로거에는 DropQueueHandler만 두고, 파일/콘솔 기록은 BatchQueueListener 스레드에서 처리할지 여부
+		queue_max_size (int): (log_queue) 큐의 최대 레코드 수
+		drop_policy (str): (log_queue) 큐가 가득 찼을 때 버릴 레코드 ; 'new' 또는 'old'
+		flush_interval (float): (log_queue) 기록한 레코드를 flush 하기까지 최대 대기 시간 (초)
+		batch_size (int): (log_queue) 리스너가 한 번에 기록하는 최대 레코드 수
+		log_collector (multiprocessing.Queue): LogCollector.queue를 지정하면 로거에는 LogForwardHandler만 두고,
+			파일/콘솔 핸들러는 수집기 프로세스에서 (나머지 인자로) 생성합니다. (여러 프로세스가 같은 로그 파일을 사용할 때)
 
 	Returns:
 		Logger: 생성된 
@@ -156,27 +560,56 @@ def createLogger(log_path = './logs'
 		return log
 	log.setLevel(log_level) 
 
+	if (log_collector != None):
+		# 수집기 프로세스에 같은 설정의 로거를 만들도록 요청 (이미 있으면 무시됨). 같은 큐로 보내므로 레코드보다 먼저 처리됨
+		log_collector.put((LogCollector.CONFIG, dict(log_path = log_path, log_filename = log_filename, log_ext = log_ext
+				, log_level = log_level, log_console = log_console, logger_name = logger_name, log_format = log_format
+				, log_queue = log_queue, queue_max_size = queue_max_size, drop_policy = drop_policy
+				, flush_interval = flush_interval, batch_size = batch_size)))
+		log.addHandler(LogForwardHandler(log_collector))
+		return log
+
 	# Make file handler
 	LOG_FILENAME = log_path + '/' + log_filename + log_ext
-	file_handler = TimedRotatingFileHandler(
+	file_handler_class = BatchTimedRotatingFileHandler if log_queue else TimedRotatingFileHandler
+	file_handler = file_handler_class(
 		filename = LOG_FILENAME, when = 'midnight', interval = 1
 		, backupCount = 100, encoding = 'utf-8'
 	) # Rotate at midnight
 	file_handler.suffix = "%Y%m%d" # add file date
 
-	formatter = Formatter(log_format)
-	log.addHandler(file_handler)
+	formatter = JsonLinesFormatter() if (log_format == LOG_FORMAT_JSON) else Formatter(log_format)
 	file_handler.setFormatter(formatter)
+	handlers: List[Handler] = [file_handler]
 	if (log_console == True):
-		stream_handler = StreamHandler()
-		log.addHandler(stream_handler)
+		stream_handler = BatchStreamHandler() if log_queue else StreamHandler()
 		stream_handler.setFormatter(formatter)
+		handlers.append(stream_handler)
 	#log.debug('created')
-	file_handler.rotator = GZipRotator() # 압축 분할 처리
+	file_handler.rotator = IndexedGZipRotator() if (log_format == LOG_FORMAT_JSON) else GZipRotator() # 압축 분할 처리
+
+	if (not log_queue):
+		for handler in handlers:
+			log.addHandler(handler)
+		return log
+
+	# 큐 모드: 로그 호출은 큐에 넣기만 하고, 기록/로테이션/압축 요청은 리스너 스레드에서 처리
+	queue = Queue(queue_max_size)
+	log.addHandler(DropQueueHandler(queue, drop_policy))
+	listener = BatchQueueListener(queue, *handlers, batch_size = batch_size, flush_interval = flush_interval)
+	listener.start()
+	if (not _queue_listeners):
+		atexit.register(_close_all_loggers)
+	_queue_listeners[logger_name] = listener
 
 	return log
 
 
+def _close_all_loggers():
+	for logger_name in list(_queue_listeners):
+		closeLogger(logger_name)
+
+
 # Testing at shell
 if __name__ == '__main__':
 	log = FileLogger(log_filename = 'logger_test', log_level = logging.DEBUG)
@@ -0,0 +1,245 @@
+# 로그 파일 블록 색인(시간/레벨) 생성 및 색인을 이용한 압축 로그 조회 도구
+# date: 2026-10-18
+# author: hbesthee@naver.com
+#-*- coding: utf-8 -*-
+# use tab char size: 4
+#
+# 사용 예:
+#	python lib/log_index.py build logs/app.log.20261018
+#	python lib/log_index.py query logs/app.log.*.gz --since "2026-10-18 09:00" --until "2026-10-18 10:00" --level WARNING
+#
+# 로그 파일을 줄 경계에 맞춘 블록마다 독립된 gzip 멤버로 압축하고, 블록별 압축 위치와 시간 범위, 레벨을
+# '<압축 파일>.idx'에 기록합니다. 압축 파일은 표준 gzip 형식이므로 zgrep 등으로도 그대로 읽을 수 있으며,
+# 조회 시에는 조건에 맞는 블록만 읽어 압축을 해제합니다.
+
+# Original Packages
+from argparse import ArgumentParser
+from datetime import datetime
+from logging import getLevelName
+from os import path, remove, replace
+from typing import Any, Dict, Final, Iterator, List, Optional, Tuple
+
+import gzip
+import json
+import re
+import sys
+import zlib
+
+
+
+INDEX_VERSION: Final		= 1
+INDEX_EXTENSION: Final		= '.idx'
+BLOCK_SIZE: Final			= 1 << 20 # 압축 블록의 기준 크기 (압축 전, bytes)
+
+# 텍스트 로그 줄 머리 ('%(asctime)s %(levelname)s ...' 형식)
+TEXT_LINE_PATTERN = re.compile(rb'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),(\d{3}) ([A-Z]+) ')
+
+# 블록 색인 항목: [압축 위치, 압축 길이, 첫 시각, 마지막 시각, 최대 레벨, 줄 수]
+BLOCK_OFFSET, BLOCK_LENGTH, BLOCK_FIRST_TS, BLOCK_LAST_TS, BLOCK_MAX_LEVEL, BLOCK_LINES = range(6)
+
+
+
+def parse_line(line: bytes) -> Optional[Tuple[float, int]]:
+	"""로그 줄에서 (시각(epoch 초), 레벨 번호) 추출 (JSON-lines 또는 텍스트 형식, 레코드 시작 줄이 아니면 None)"""
+	if (line.startswith(b'{')):
+		try:
+			record = json.loads(line)
+			return float(record['ts']), int(record['levelno'])
+		except (ValueError, KeyError, TypeError):
+			return None
+
+	matched = TEXT_LINE_PATTERN.match(line)
+	if (matched == None):
+		return None
+	level = getLevelName(matched.group(3).decode())
+	if (not isinstance(level, int)):
+		return None
+	timestamp = datetime.strptime(matched.group(1).decode(), '%Y-%m-%d %H:%M:%S').timestamp() + int(matched.group(2)) / 1000
+	return timestamp, level
+
+
+def build_index(source: str, dest: Optional[str] = None, level: int = 6, block_size: int = BLOCK_SIZE,
+				remove_source: bool = False) -> str:
+	"""로그 파일을 블록 단위 gzip으로 압축하고 블록 색인 파일 생성
+
+	블록은 레코드 시작 줄에서만 나누므로 여러 줄 레코드(예: 예외 traceback)는 한 블록에 담깁니다.
+
+	Args:
+		source: 로그 파일 경로
+		dest: 압축 파일 경로 (생략 시 source + '.gz')
+		level: gzip 압축 수준
+		block_size: 압축 블록의 기준 크기 (압축 전, bytes)
+		remove_source: 완료 후 원본 파일 삭제 여부
+
+	Returns:
+		str: 색인 파일 경로 (dest + '.idx')
+	"""
+	dest = dest or f'{source}.gz'
+	index_path = f'{dest}{INDEX_EXTENSION}'
+	blocks: List[List[Any]] = []
+	offset = 0
+
+	def flush_block(lines: List[bytes], first_ts: Optional[float], last_ts: float, max_level: int):
+		nonlocal offset
+		data = zlib.compress(b''.join(lines), level, wbits=31) # 독립된 gzip 멤버
+		f_out.write(data)
+		if (first_ts == None): # 시각을 알 수 없는 블록은 모든 조회에 포함
+			first_ts, last_ts = 0.0, sys.float_info.max
+		blocks.append([offset, len(data), first_ts, last_ts, max_level, len(lines)])
+		offset += len(data)
+
+	temp_path = f'{dest}.tmp'
+	try:
+		with open(source, 'rb') as f_in, open(temp_path, 'wb') as f_out:
+			lines: List[bytes] = []
+			size = 0
+			first_ts: Optional[float] = None
+			last_ts = 0.0
+			max_level = 0
+			for line in f_in:
+				parsed = parse_line(line)
+				if (parsed != None):
+					if (size >= block_size):
+						flush_block(lines, first_ts, last_ts, max_level)
+						lines, size, first_ts, last_ts, max_level = [], 0, None, 0.0, 0
+					timestamp, line_level = parsed
+					first_ts = timestamp if (first_ts == None) else min(first_ts, timestamp)
+					last_ts = max(last_ts, timestamp)
+					max_level = max(max_level, line_level)
+				lines.append(line)
+				size += len(line)
+			if (lines):
+				flush_block(lines, first_ts, last_ts, max_level)
+
+		with open(f'{index_path}.tmp', 'w', encoding='utf-8') as f:
+			json.dump({'version': INDEX_VERSION, 'source': path.basename(source), 'blocks': blocks}, f)
+		replace(temp_path, dest)
+		replace(f'{index_path}.tmp', index_path)
+	except Exception:
+		for file_path in (temp_path, f'{index_path}.tmp'):
+			if path.exists(file_path):
+				remove(file_path)
+		raise
+
+	if (remove_source):
+		remove(source)
+	return index_path
+
+
+def load_index(file_path: str) -> Optional[Dict[str, Any]]:
+	"""압축 로그 파일의 색인 (색인 파일이 없거나 버전이 다르면 None)"""
+	index_path = f'{file_path}{INDEX_EXTENSION}'
+	if (not path.exists(index_path)):
+		return None
+	with open(index_path, 'r', encoding='utf-8') as f:
+		index = json.load(f)
+	return index if (index.get('version') == INDEX_VERSION) else None
+
+
+def query(file_path: str, since: Optional[float] = None, until: Optional[float] = None, min_level: int = 0,
+		contains: Optional[bytes] = None) -> Iterator[bytes]:
+	"""조건에 맞는 로그 줄 반환 (색인이 있으면 조건에 맞는 블록만 읽고, 없으면 파일 전체를 읽음)
+
+	Args:
+		file_path: 로그 파일 경로 (.gz 또는 압축하지 않은 파일)
+		since: 시작 시각 (epoch 초, 포함)
+		until: 종료 시각 (epoch 초, 제외)
+		min_level: 최소 레벨 번호 (예: logging.WARNING)
+		contains: 줄에 포함되어야 하는 bytes
+
+	Returns:
+		조건에 맞는 레코드의 줄 (여러 줄 레코드의 이어지는 줄 포함)
+	"""
+	index = load_index(file_path)
+	if (index == None):
+		yield from _filter_lines(_read_all(file_path), since, until, min_level, contains)
+		return
+
+	with open(file_path, 'rb') as f:
+		for block in index['blocks']:
+			if ((since != None) and (block[BLOCK_LAST_TS] < since)):
+				continue
+			if ((until != None) and (block[BLOCK_FIRST_TS] >= until)):
+				continue
+			if (block[BLOCK_MAX_LEVEL] < min_level):
+				continue
+			f.seek(block[BLOCK_OFFSET])
+			data = zlib.decompress(f.read(block[BLOCK_LENGTH]), wbits=31)
+			yield from _filter_lines(data.splitlines(keepends=True), since, until, min_level, contains)
+
+
+def _filter_lines(lines, since: Optional[float], until: Optional[float], min_level: int,
+				contains: Optional[bytes]) -> Iterator[bytes]:
+	"""레코드 시작 줄의 시각/레벨로 판단하고, 이어지는 줄은 시작 줄의 판단을 따름"""
+	matched = False
+	for line in lines:
+		parsed = parse_line(line)
+		if (parsed != None):
+			timestamp, level = parsed
+			matched = (((since == None) or (timestamp >= since)) and ((until == None) or (timestamp < until))
+					and (level >= min_level))
+		if (matched and ((contains == None) or (contains in line))):
+			yield line
+
+
+def _read_all(file_path: str) -> Iterator[bytes]:
+	if (file_path.endswith('.gz')):
+		with gzip.open(file_path, 'rb') as f:
+			yield from f
+	else:
+		with open(file_path, 'rb') as f:
+			yield from f
+
+
+def _parse_time(value: Optional[str]) -> Optional[float]:
+	"""'YYYY-MM-DD[ HH:MM[:SS]]' 또는 epoch 초 문자열을 epoch 초로 변환"""
+	if (value == None):
+		return None
+	try:
+		return float(value)
+	except ValueError:
+		pass
+	for time_format in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d'):
+		try:
+			return datetime.strptime(value, time_format).timestamp()
+		except ValueError:
+			pass
+	raise ValueError(f'Invalid time: {value}')
+
+
+def main(argv: Optional[List[str]] = None):
+	parser = ArgumentParser(description="Log block index builder / query tool")
+	commands = parser.add_subparsers(dest='command', required=True)
+
+	build_parser = commands.add_parser('build', help='로그 파일을 블록 단위 gzip으로 압축하고 색인 생성')
+	build_parser.add_argument('files', nargs='+', help='로그 파일 경로')
+	build_parser.add_argument('--block-size', type=int, default=BLOCK_SIZE, help='압축 블록의 기준 크기 (bytes)')
+	build_parser.add_argument('--keep', action='store_true', help='원본 파일을 삭제하지 않음')
+
+	query_parser = commands.add_parser('query', help='시간 범위와 레벨로 로그 조회')
+	query_parser.add_argument('files', nargs='+', help='로그 파일 경로 (.gz, 색인이 없으면 전체를 읽음)')
+	query_parser.add_argument('--since', help="시작 시각 ('YYYY-MM-DD HH:MM:SS' 또는 epoch 초)")
+	query_parser.add_argument('--until', help="종료 시각 ('YYYY-MM-DD HH:MM:SS' 또는 epoch 초)")
+	query_parser.add_argument('--level', default='NOTSET', help='최소 레벨 (예: WARNING)')
+	query_parser.add_argument('--contains', help='줄에 포함되어야 하는 문자열')
+	args = parser.parse_args(argv)
+
+	if (args.command == 'build'):
+		for file_path in args.files:
+			print(build_index(file_path, block_size=args.block_size, remove_source=not args.keep))
+		return
+
+	min_level = getLevelName(args.level.upper())
+	if (not isinstance(min_level, int)):
+		parser.error(f'Unknown level: {args.level}')
+	since, until = _parse_time(args.since), _parse_time(args.until)
+	contains = args.contains.encode('utf-8') if args.contains else None
+	output = sys.stdout.buffer
+	for file_path in sorted(args.files):
+		for line in query(file_path, since, until, min_level, contains):
+			output.write(line)
+	output.flush()
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# 클라이언트별 순서를 보장하는 패킷 분배기 (Packet Dispatcher)
+# made : hbesthee@naver.com
+# date : 2026-10-18
+
+# Original Packages
+from asyncio import QueueFull, Task
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Deque, Dict, Final, Hashable, List, Optional, Set, Tuple, Union
+
+import asyncio
+
+
+
+PacketHandler = Callable[[Any, Any], Union[Awaitable[Any], Any]] # (uuid, packet) -> 결과
+ResultHandler = Callable[[Any, Any], Awaitable[None]] # (uuid, 결과)
+PacketRouter = Callable[[Any, Any], Hashable] # (uuid, packet) -> 레인(lane) 키
+
+
+
+class PacketDispatcherDef:
+	LOGGER_NAME: Final			= 'packet_dispatcher'
+	CONCURRENCY: Final			= 4 # 동시에 처리하는 레인 수
+	QUANTUM: Final				= 8 # 한 레인에서 연속으로 처리하는 최대 패킷 수 (이후 다른 레인에 양보)
+	LANE_MAX_SIZE: Final		= 0 # 레인별 최대 대기 패킷 수 (0: 무제한)
+
+
+
+class _Lane:
+	"""레인 하나의 대기 패킷 목록"""
+	def __init__(self):
+		self.items: Deque[Tuple[Any, Any]] = deque()
+		self.not_full = asyncio.Event()
+		self.not_full.set()
+
+
+
+class PacketDispatcher:
+	"""(uuid, packet) 항목을 레인별로 나누어 처리하는 분배기입니다.<br />
+	asyncio.Queue의 put()/put_nowait()/qsize()/empty()를 제공하므로 파서의 packet_queue 대신 사용할 수 있습니다.
+
+	- 같은 레인(기본: 클라이언트 uuid)의 패킷은 순서대로 하나씩 처리됩니다.
+	- 서로 다른 레인은 최대 concurrency 개까지 동시에 처리되며, 레인마다 quantum 개씩 번갈아 처리(round-robin)하므로
+		패킷이 많은 클라이언트가 다른 클라이언트를 막지 않습니다.
+	- handler가 코루틴 함수이면 이벤트 루프에서, 일반 함수이면 executor(스레드 풀)에서 실행됩니다. (CPU 작업용)
+	"""
+	def __init__(self,
+					handler: PacketHandler,
+					on_result: Optional[ResultHandler] = None,
+					router: Optional[PacketRouter] = None,
+					concurrency: int = PacketDispatcherDef.CONCURRENCY,
+					quantum: int = PacketDispatcherDef.QUANTUM,
+					lane_max_size: int = PacketDispatcherDef.LANE_MAX_SIZE,
+					executor: Optional[Executor] = None,
+					logger_name: str = PacketDispatcherDef.LOGGER_NAME):
+		"""PacketDispatcher 클래스의 생성자입니다.
+
+		Args:
+			handler: 패킷 처리 함수 (uuid, packet) -> 결과. 코루틴 함수가 아니면 executor에서 실행됩니다.
+			on_result: handler의 결과가 None이 아닐 때 호출할 코루틴 함수 (uuid, 결과)
+			router: 패킷의 레인 키를 결정하는 함수 (uuid, packet) -> 키. (None: uuid)
+			concurrency: 동시에 처리하는 레인 수입니다.
+			quantum: 한 레인에서 연속으로 처리하는 최대 패킷 수입니다.
+			lane_max_size: 레인별 최대 대기 패킷 수입니다. (0: 무제한, 초과 시 put()은 대기, put_nowait()는 QueueFull)
+			executor: 일반 함수 handler를 실행할 executor입니다. (None: concurrency 크기의 ThreadPoolExecutor 생성)
+			logger_name: 사용할 로거의 이름입니다.
+		"""
+		self.logger = getLogger(logger_name)
+		self.handler = handler
+		self.on_result = on_result
+		self.router = router
+		self.concurrency = max(1, concurrency)
+		self.quantum = max(1, quantum)
+		self.lane_max_size = lane_max_size
+
+		self._is_coroutine = asyncio.iscoroutinefunction(handler)
+		self._executor: Optional[Executor] = executor
+		self._own_executor: bool = False
+
+		self._lanes: Dict[Hashable, _Lane] = {}
+		self._ready: asyncio.Queue = asyncio.Queue() # 처리할 패킷이 있는 레인 키 (round-robin 순서)
+		self._scheduled: Set[Hashable] = set() # _ready에 있거나 처리 중인 레인 키
+		self._workers: List[Task] = []
+		self._size: int = 0
+
+		self._stats: Dict[str, int] = {
+			'dispatched': 0,
+			'errors': 0,
+			'max_queue_depth': 0,
+		}
+
+
+	def _get_lane(self, item: Tuple[Any, Any]) -> Tuple[Hashable, _Lane]:
+		uuid, packet = item
+		key = uuid if (self.router == None) else self.router(uuid, packet)
+		lane = self._lanes.get(key)
+		if (lane == None):
+			lane = self._lanes[key] = _Lane()
+		return key, lane
+
+
+	async def _handle(self, uuid: Any, packet: Any):
+		"""패킷 하나를 처리하고 결과를 on_result로 전달합니다."""
+		try:
+			if (self._is_coroutine):
+				result = await self.handler(uuid, packet)
+			else:
+				result = await asyncio.get_running_loop().run_in_executor(self._executor, self.handler, uuid, packet)
+
+			if ((result != None) and (self.on_result != None)):
+				await self.on_result(uuid, result)
+			self._stats['dispatched'] += 1
+
+		except asyncio.CancelledError:
+			raise
+		except Exception as e:
+			self._stats['errors'] += 1
+			self.logger.error(f"패킷 처리 중 예외 발생 [from: {uuid}]: {e}", exc_info=True)
+
+
+	async def _worker(self):
+		"""준비된 레인을 꺼내 최대 quantum 개의 패킷을 순서대로 처리한 뒤, 남은 패킷이 있으면 레인을 다시 줄 끝에 넣습니다."""
+		while True:
+			key = await self._ready.get()
+			lane = self._lanes.get(key)
+			try:
+				for _ in range(self.quantum):
+					if ((lane == None) or (not lane.items)):
+						break
+					uuid, packet = lane.items.popleft()
+					self._size -= 1
+					lane.not_full.set()
+					await self._handle(uuid, packet)
+			finally:
+				lane = self._lanes.get(key) # 처리 중 remove() 후 같은 키로 새 레인이 생겼을 수 있음
+				if ((lane != None) and lane.items):
+					self._ready.put_nowait(key)
+				else:
+					self._scheduled.discard(key)
+				self._ready.task_done()
+
+
+	def empty(self) -> bool:
+		return (self._size == 0)
+
+
+	def get_stats(self) -> Dict[str, Any]:
+		"""분배 통계를 반환합니다.
+
+		Returns:
+			처리한 패킷 수(dispatched), 처리 중 예외 수(errors), 레인 수(lanes), 전체 대기 패킷 수(queue_size),
+			최대 레인 대기 패킷 수(max_queue_depth), 레인별 대기 패킷 수(queue_depth: {str(키): 개수})
+		"""
+		stats: Dict[str, Any] = dict(self._stats)
+		stats['lanes'] = len(self._lanes)
+		stats['queue_size'] = self._size
+		stats['queue_depth'] = {str(key): len(lane.items) for key, lane in self._lanes.items()}
+		return stats
+
+
+	async def put(self, item: Tuple[Any, Any]):
+		"""(uuid, packet) 항목을 레인에 넣습니다. 레인이 가득 차면 자리가 생길 때까지 대기합니다."""
+		while True:
+			try:
+				self.put_nowait(item)
+				return
+			except QueueFull:
+				await self._get_lane(item)[1].not_full.wait()
+
+
+	def put_nowait(self, item: Tuple[Any, Any]):
+		"""(uuid, packet) 항목을 레인에 넣습니다.
+
+		Raises:
+			QueueFull: 레인의 대기 패킷 수가 lane_max_size에 도달한 경우
+		"""
+		key, lane = self._get_lane(item)
+		if ((self.lane_max_size > 0) and (len(lane.items) >= self.lane_max_size)):
+			lane.not_full.clear()
+			raise QueueFull()
+
+		lane.items.append(item)
+		self._size += 1
+		if (len(lane.items) > self._stats['max_queue_depth']):
+			self._stats['max_queue_depth'] = len(lane.items)
+
+		if (key not in self._scheduled):
+			self._scheduled.add(key)
+			self._ready.put_nowait(key)
+
+
+	def qsize(self) -> int:
+		return self._size
+
+
+	def remove(self, key: Hashable):
+		"""레인을 제거하고 대기 중인 패킷을 버립니다. (클라이언트 연결 종료 시)"""
+		lane = self._lanes.pop(key, None)
+		if (lane != None):
+			self._size -= len(lane.items)
+			lane.items.clear()
+			lane.not_full.set()
+
+
+	def start(self):
+		"""분배 태스크들을 시작합니다. (실행 중인 이벤트 루프에서 호출)"""
+		if (self._workers):
+			return
+		if ((not self._is_coroutine) and (self._executor == None)):
+			self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='PacketDispatcher')
+			self._own_executor = True
+		self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+		self.logger.info(f"패킷 분배기가 시작되었습니다. (동시 처리 레인 수: {self.concurrency})")
+
+
+	async def stop(self):
+		"""분배 태스크들을 종료합니다. 대기 중인 패킷은 처리되지 않습니다."""
+		for task in self._workers:
+			task.cancel()
+		if (self._workers):
+			await asyncio.gather(*self._workers, return_exceptions=True)
+		self._workers = []
+
+		if (self._own_executor):
+			self._executor.shutdown(wait=False)
+			self._executor = None
+			self._own_executor = False
+		self.logger.info("패킷 분배기가 종료되었습니다.")
@@ -4,19 +4,23 @@
 # date : 2025-06-12
 
 # Original Packages
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, date
 from enum import Enum
-from os import listdir, makedirs, path, remove
+from itertools import groupby
+from os import fsync, listdir, makedirs, path, remove, replace
 from queue import Empty, Full, Queue
-from shutil import copy2, copyfileobj
-from threading import Event, local as thread_local, RLock, Thread
-from time import time
-from typing import Optional, Tuple, Any, Generator
-from gzip import open as gzip_open
+from threading import Condition, Event, local as thread_local, RLock, Thread
+from time import perf_counter, time
+from typing import Callable, Final, Optional, Tuple, Any, Generator, Iterator, List, Dict, Union
 
 import logging
+import mmap
+import pickle
 import sqlite3
+import struct
 
 
 
@@ -24,7 +28,16 @@ import sqlite3
 
 
 
+# User's Package 들을 포함시키기 위한 sys.path에 프로젝트 폴더 추가하기
+from pathlib import Path
+from sys import path as sys_path
+project_folder = str(Path(__file__).parent.parent)
+if (not project_folder in sys_path):
+	sys_path.append(str(project_folder))
+
+
 # User's Package
+from lib.compressor import COMPRESSED_EXTENSIONS, Compressor, decompress_file, strip_extension
 
 
 
@@ -36,10 +49,430 @@ class RetentionPeriod(Enum):
 
 
 
+class ReplicationMode(Enum):
+	SYNC = "sync"		# 메인 DB와 백업 DB에 순서대로 동기 기록
+	ASYNC = "async"		# 메인 DB에 먼저 커밋하고, 복제 로그를 통해 별도 스레드가 백업 DB에 적용
+
+
+
+class QueueFullPolicy(Enum):
+	BLOCK = "block"					# 큐에 빈 자리가 날 때까지 대기 (제한 시간 초과 시 RuntimeError)
+	DROP_OLDEST = "drop_oldest"		# 가장 오래된 작업을 버리고 새 작업을 추가
+	REJECT = "reject"				# 즉시 RuntimeError 발생
+	SPILL = "spill"					# 디스크 저널에 임시 보관 후 큐에 빈 자리가 나면 순서대로 처리
+
+
+
+class SpillJournal:
+	"""execute 큐가 가득 찼을 때 작업을 임시로 보관하는 추가 전용(append-only) 디스크 저널
+
+	파일 구조는 [헤더: 매직(4) + 커밋된 위치(8)] 뒤에 [4바이트 길이][pickle 데이터] 레코드가 이어집니다.
+	pop()으로 꺼낸 작업에는 레코드 끝 위치(task['spill_offset'])를 기록하고, 작업이 커밋된 뒤 commit()으로
+	커밋된 위치를 헤더에 기록(fsync)하므로, 재시작 시 이미 커밋된 작업은 다시 처리하지 않습니다.
+	꺼낸 작업이 모두 커밋되면 파일을 비웁니다.
+	"""
+	_MAGIC: Final = b'SPJ1'
+	_FILE_HEADER: Final = struct.Struct('<4sQ')
+	_HEADER: Final = struct.Struct('<I')
+
+	def __init__(self, journal_path: str):
+		"""
+		Args:
+			journal_path (str): 저널 파일 경로
+		"""
+		self.journal_path = journal_path
+		self._file = open(journal_path, 'r+b' if path.exists(journal_path) else 'w+b')
+		self._count = 0
+
+		header = self._file.read(self._FILE_HEADER.size)
+		if (len(header) == self._FILE_HEADER.size):
+			magic, self._committed_offset = self._FILE_HEADER.unpack(header)
+			if (magic != self._MAGIC):
+				raise ValueError(f"Invalid spill journal: {journal_path}")
+		else:
+			self._committed_offset = self._FILE_HEADER.size
+			self._file.truncate(0)
+			self._write_header()
+		self._read_offset = self._committed_offset
+
+		# 이전 실행에서 커밋되지 못한 레코드 수 확인
+		self._file.seek(self._read_offset)
+		while True:
+			header = self._file.read(self._HEADER.size)
+			if (len(header) < self._HEADER.size):
+				break
+			(length,) = self._HEADER.unpack(header)
+			if (len(self._file.read(length)) < length):
+				break
+			self._count += 1
+		self.restored_count = self._count
+
+
+	def __len__(self) -> int:
+		return self._count
+
+
+	def _write_header(self):
+		"""커밋된 위치를 헤더에 기록하고 디스크에 동기화"""
+		self._file.seek(0)
+		self._file.write(self._FILE_HEADER.pack(self._MAGIC, self._committed_offset))
+		self._file.flush()
+		fsync(self._file.fileno())
+
+
+	def append(self, task: Dict[str, Any]):
+		"""작업을 저널 끝에 추가"""
+		record = pickle.dumps(task, protocol=pickle.HIGHEST_PROTOCOL)
+		self._file.seek(0, 2)
+		self._file.write(self._HEADER.pack(len(record)) + record)
+		self._file.flush()
+		self._count += 1
+
+
+	def clear(self):
+		"""보관 중인 모든 작업 삭제"""
+		self._file.truncate(self._FILE_HEADER.size)
+		self._committed_offset = self._read_offset = self._FILE_HEADER.size
+		self._count = 0
+		self.restored_count = 0
+		self._write_header()
+
+
+	def close(self):
+		"""저널 파일 닫기"""
+		self._file.close()
+
+
+	def commit(self, offset: int):
+		"""offset(꺼낸 작업의 task['spill_offset'])까지의 작업이 커밋되었음을 기록 (모두 커밋되었으면 저널을 비움)"""
+		if (offset <= self._committed_offset):
+			return
+
+		self._committed_offset = offset
+		if ((self._count == 0) and (offset == self._read_offset)):
+			self._file.truncate(self._FILE_HEADER.size)
+			self._committed_offset = self._read_offset = self._FILE_HEADER.size
+		self._write_header()
+
+
+	def pop(self, max_count: int) -> List[Dict[str, Any]]:
+		"""저널 앞쪽에서 최대 max_count 개의 작업을 꺼냄 (커밋 후 commit()을 호출해야 재시작 시 다시 처리하지 않음)
+
+		Returns:
+			List[Dict[str, Any]]: 추가된 순서대로 꺼낸 작업 목록 (task['spill_offset']: 레코드 끝 위치)
+		"""
+		tasks = []
+		self._file.seek(self._read_offset)
+		while ((len(tasks) < max_count) and (self._count > 0)):
+			(length,) = self._HEADER.unpack(self._file.read(self._HEADER.size))
+			task = pickle.loads(self._file.read(length))
+			task['spill_offset'] = self._file.tell()
+			tasks.append(task)
+			self._count -= 1
+
+		self._read_offset = self._file.tell()
+		return tasks
+
+
+
+class WriteAheadJournal:
+	"""execute()로 입력된 작업을 커밋될 때까지 보관하는 메모리 매핑(mmap) 추가 전용 저널
+
+	파일 구조는 [헤더: 매직(4) + 커밋된 순번(8)] 뒤에 [4바이트 길이][8바이트 순번][pickle 데이터] 레코드가 이어지며,
+	길이가 0인 위치가 끝입니다. 레코드는 메모리 복사만으로 기록되므로 프로세스가 비정상 종료되어도
+	운영체제의 페이지 캐시에 남아 다음 실행에서 복구할 수 있습니다. (전원 장애 대비는 sync=True)
+	커밋된 순번이 마지막 순번에 도달하면 기록 위치를 처음으로 되돌려 저널을 비우고,
+	큐가 완전히 비지 않더라도 커밋된 앞부분이 _COMPACT_MIN_SIZE 이상이고 남은 레코드보다 크면
+	남은 레코드만 새 파일로 옮겨(원자적 교체) 파일 크기가 계속 늘어나지 않도록 합니다.
+	"""
+	_MAGIC: Final = b'SRJ1'
+	_FILE_HEADER: Final = struct.Struct('<4sQ')
+	_RECORD_HEADER: Final = struct.Struct('<IQ')
+	_INITIAL_SIZE: Final[int] = 4 * 1024 * 1024
+	_COMPACT_MIN_SIZE: Final[int] = 4 * 1024 * 1024 # 압축(compaction)을 시작하는 커밋된 앞부분의 최소 크기
+
+	def __init__(self, journal_path: str, sync: bool=False):
+		"""
+		Args:
+			journal_path (str): 저널 파일 경로
+			sync (bool): flush() 호출 시 mmap 내용을 디스크에 동기화(msync)할지 여부
+		"""
+		self.journal_path = journal_path
+		self.sync = sync
+		self._lock = RLock()
+
+		self._file = open(journal_path, 'a+b')
+		size = path.getsize(journal_path)
+		if (size < self._INITIAL_SIZE):
+			self._file.truncate(self._INITIAL_SIZE)
+			size = self._INITIAL_SIZE
+		self._map = mmap.mmap(self._file.fileno(), size)
+
+		magic, self._committed_seq = self._FILE_HEADER.unpack_from(self._map, 0)
+		if (magic != self._MAGIC):
+			self._committed_seq = 0
+			self._FILE_HEADER.pack_into(self._map, 0, self._MAGIC, 0)
+			self._RECORD_HEADER.pack_into(self._map, self._FILE_HEADER.size, 0, 0)
+
+		# 이전 실행에서 커밋되지 못한 작업 복구
+		self._pending = []
+		self._write_offset = self._FILE_HEADER.size
+		self._last_seq = self._committed_seq
+		self._tail_offset = self._write_offset
+		self._committed_offset = None # 커밋되지 않은 첫 레코드의 위치
+		while ((self._write_offset + self._RECORD_HEADER.size) <= len(self._map)):
+			length, seq = self._RECORD_HEADER.unpack_from(self._map, self._write_offset)
+			record_end = self._write_offset + self._RECORD_HEADER.size + length
+			if ((length == 0) or (record_end > len(self._map))):
+				break
+			if (seq > self._committed_seq):
+				if (self._committed_offset == None):
+					self._committed_offset = self._write_offset
+				task = pickle.loads(self._map[self._write_offset + self._RECORD_HEADER.size:record_end])
+				task['journal_seq'] = seq
+				self._pending.append(task)
+			self._last_seq = max(self._last_seq, seq)
+			self._tail_offset = self._write_offset
+			self._write_offset = record_end
+		if (self._committed_offset == None):
+			self._committed_offset = self._write_offset
+
+
+	def __len__(self) -> int:
+		"""커밋되지 않은 작업 수"""
+		return self._last_seq - self._committed_seq
+
+
+	def _compact(self):
+		"""커밋되지 않은 레코드만 새 파일로 옮기고 저널 파일을 원자적으로 교체"""
+		live = self._map[self._committed_offset:self._write_offset]
+		new_size = self._INITIAL_SIZE
+		while (new_size < (self._FILE_HEADER.size + len(live) + self._RECORD_HEADER.size)):
+			new_size *= 2
+
+		temp_path = f"{self.journal_path}.compact"
+		with open(temp_path, 'wb') as f:
+			f.write(self._FILE_HEADER.pack(self._MAGIC, self._committed_seq))
+			f.write(live)
+			f.truncate(new_size) # 나머지는 0으로 채워지므로 남은 레코드 뒤가 끝 표시가 됨
+			f.flush()
+			if (self.sync):
+				fsync(f.fileno())
+
+		self._map.close()
+		self._file.close()
+		replace(temp_path, self.journal_path)
+		self._file = open(self.journal_path, 'a+b')
+		self._map = mmap.mmap(self._file.fileno(), new_size)
+
+		shift = self._committed_offset - self._FILE_HEADER.size
+		self._write_offset -= shift
+		self._tail_offset -= shift
+		self._committed_offset = self._FILE_HEADER.size
+
+
+	def _ensure_capacity(self, size: int):
+		"""기록할 공간이 부족하면 파일을 두 배씩 늘려 다시 매핑"""
+		required = self._write_offset + size + self._RECORD_HEADER.size
+		if (required <= len(self._map)):
+			return
+
+		new_size = len(self._map)
+		while (new_size < required):
+			new_size *= 2
+		self._map.close()
+		self._file.truncate(new_size)
+		self._map = mmap.mmap(self._file.fileno(), new_size)
+
+
+	def append(self, task: Dict[str, Any]) -> int:
+		"""작업을 저널 끝에 추가하고 순번을 task['journal_seq']에 기록
+
+		Returns:
+			int: 추가한 작업의 순번
+		"""
+		record = pickle.dumps(task, protocol=pickle.HIGHEST_PROTOCOL)
+		with self._lock:
+			self._ensure_capacity(self._RECORD_HEADER.size + len(record))
+			seq = self._last_seq + 1
+			offset = self._write_offset + self._RECORD_HEADER.size
+			self._map[offset:offset + len(record)] = record
+			# 다음 레코드 위치를 끝 표시로 만든 뒤 길이를 기록하여, 중간에 중단되어도 불완전한 레코드를 읽지 않도록 함
+			self._RECORD_HEADER.pack_into(self._map, offset + len(record), 0, 0)
+			self._RECORD_HEADER.pack_into(self._map, self._write_offset, len(record), seq)
+
+			self._tail_offset = self._write_offset
+			self._write_offset = offset + len(record)
+			self._last_seq = seq
+		task['journal_seq'] = seq
+		return seq
+
+
+	def close(self):
+		"""저널 파일 닫기"""
+		with self._lock:
+			self.flush()
+			self._map.close()
+			self._file.close()
+
+
+	def commit(self, seq: int):
+		"""seq까지의 작업이 커밋되었음을 기록 (모두 커밋되었으면 저널을 비우고, 커밋된 앞부분이 크면 압축)"""
+		with self._lock:
+			if (seq <= self._committed_seq):
+				return
+
+			self._committed_seq = min(seq, self._last_seq)
+			if (self._committed_seq == self._last_seq):
+				self._write_offset = self._FILE_HEADER.size
+				self._tail_offset = self._write_offset
+				self._committed_offset = self._write_offset
+				self._RECORD_HEADER.pack_into(self._map, self._write_offset, 0, 0)
+			else:
+				while (self._committed_offset < self._write_offset):
+					length, record_seq = self._RECORD_HEADER.unpack_from(self._map, self._committed_offset)
+					if (record_seq > self._committed_seq):
+						break
+					self._committed_offset += self._RECORD_HEADER.size + length
+			self._FILE_HEADER.pack_into(self._map, 0, self._MAGIC, self._committed_seq)
+
+			committed_size = self._committed_offset - self._FILE_HEADER.size
+			if ((committed_size >= self._COMPACT_MIN_SIZE) and (committed_size >= (self._write_offset - self._committed_offset))):
+				self._compact()
+
+
+	def discard_last(self, seq: int):
+		"""큐에 넣지 못한 마지막 작업을 저널에서 제거"""
+		with self._lock:
+			if (seq != self._last_seq):
+				return
+			self._write_offset = self._tail_offset
+			self._RECORD_HEADER.pack_into(self._map, self._write_offset, 0, 0)
+			self._last_seq -= 1
+			if (self._committed_seq == self._last_seq):
+				self.commit(self._last_seq + 1)
+
+
+	def flush(self):
+		"""sync=True이면 기록된 내용을 디스크에 동기화"""
+		if (self.sync):
+			with self._lock:
+				self._map.flush()
+
+
+	def take_pending(self) -> List[Dict[str, Any]]:
+		"""이전 실행에서 커밋되지 못한 작업 목록을 꺼냄 (순번 순서)"""
+		pending, self._pending = self._pending, []
+		return pending
+
+
+
+class PartitionCache:
+	"""압축된 월별 백업 파일(.db.gz, .db.zst, .db.lz4)의 압축 해제본을 보관하는 크기 제한 LRU 캐시"""
+
+	def __init__(self, cache_folder: str, max_files: int=4):
+		"""
+		Args:
+			cache_folder (str): 압축 해제한 파일을 보관할 폴더
+			max_files (int): 보관할 최대 파일 수 (초과 시 가장 오래 사용하지 않은 파일 삭제)
+		"""
+		self.cache_folder = cache_folder
+		self.max_files = max(1, max_files)
+		self._entries = OrderedDict() # (압축 파일 경로, 수정 시각) -> 압축 해제 파일 경로
+		self._lock = RLock()
+		self.hits = 0
+		self.misses = 0
+
+		makedirs(cache_folder, exist_ok=True)
+
+
+	def clear(self):
+		"""캐시된 모든 파일 삭제"""
+		with self._lock:
+			while (self._entries):
+				_, extracted_path = self._entries.popitem(last=False)
+				if path.exists(extracted_path):
+					remove(extracted_path)
+
+
+	def get(self, compressed_path: str) -> str:
+		"""압축 파일에 대한 압축 해제본 경로 반환 (캐시에 없으면 압축 해제)
+
+		Args:
+			compressed_path: 압축된 백업 파일 경로
+
+		Returns:
+			str: 압축 해제된 DB 파일 경로
+		"""
+		key = (compressed_path, path.getmtime(compressed_path))
+		with self._lock:
+			extracted_path = self._entries.get(key)
+			if ((extracted_path != None) and path.exists(extracted_path)):
+				self._entries.move_to_end(key)
+				self.hits += 1
+				return extracted_path
+
+			self.misses += 1
+			extracted_path = decompress_file(compressed_path,
+					path.join(self.cache_folder, strip_extension(path.basename(compressed_path))))
+
+			self._entries[key] = extracted_path
+			while (len(self._entries) > self.max_files):
+				_, evicted_path = self._entries.popitem(last=False)
+				if ((evicted_path != extracted_path) and path.exists(evicted_path)):
+					remove(evicted_path)
+			return extracted_path
+
+
+
 class SqliteReplicationManager:
+	_ROTATION_BACKUP_PAGES: Final[int] = 1024 # 로테이션 스냅샷 시 backup() 한 단계에서 복사할 페이지 수
+	_ROTATION_SWAP_TIMEOUT: Final[float] = 2.0 # 메인 DB 교체 시 사용 중인 조회 연결의 반환을 기다리는 최대 시간 (초)
+	_ROTATION_SWAP_WAIT_INTERVAL: Final[float] = 10.0 # 쓰기 워커가 메인 DB 교체를 위해 조회 연결 반환을 기다리는 최소 간격 (초)
+	_ROTATION_REPLAY_MEMORY_LIMIT: Final[int] = 10000 # 로테이션 중 스냅샷에 다시 적용할 작업을 메모리에 보관하는 최대 수 (초과분은 디스크 저널에 기록)
+	_LATENCY_SAMPLES: Final[int] = 10000 # 커밋 지연 시간 백분위 계산에 사용할 최근 표본 수
+	_RATE_WINDOW: Final[float] = 10.0 # 초당 처리 행 수를 계산하는 구간 (초)
+	_REPLICA_BATCH_SIZE: Final[int] = 1000 # 비동기 복제 시 한 트랜잭션으로 적용할 최대 복제 로그 수
+	_REPLICATION_LOG_TRUNCATE_ROWS: Final[int] = 1000 # 적용 완료된 복제 로그를 정리하는 최소 행 수
+	_JOURNAL_MODES: Final[Tuple[str, ...]] = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+	_SYNCHRONOUS_MODES: Final[Tuple[str, ...]] = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+	_SQL_CREATE_REPLICATION_LOG: Final[str] = """
+			CREATE TABLE IF NOT EXISTS _replication_log (
+				seq INTEGER PRIMARY KEY AUTOINCREMENT,
+				sql TEXT NOT NULL,
+				parameters BLOB NOT NULL,
+				created REAL NOT NULL
+			)
+		"""
+	_SQL_CREATE_REPLICATION_STATE: Final[str] = """
+			CREATE TABLE IF NOT EXISTS _replication_state (
+				id INTEGER PRIMARY KEY CHECK (id = 1),
+				applied_seq INTEGER NOT NULL
+			)
+		"""
+
 	def __init__(self, db_name: str, db_folder: str, backup_folder: str,
 				table_schema: str=None,
-				retention_period: RetentionPeriod=RetentionPeriod.UNLIMITED
+				retention_period: RetentionPeriod=RetentionPeriod.UNLIMITED,
+				batch_max_size: int=1,
+				batch_max_wait_ms: float=0.0,
+				read_pool_size: int=4,
+				queue_max_size: int=0,
+				queue_full_policy: QueueFullPolicy=QueueFullPolicy.BLOCK,
+				spill_path: Optional[str]=None,
+				replication_mode: ReplicationMode=ReplicationMode.SYNC,
+				partition_cache_size: int=4,
+				partition_cache_folder: Optional[str]=None,
+				compressor: Optional[Compressor]=None,
+				cached_statements: int=256,
+				schema_version: int=1,
+				statements: Optional[Dict[str, str]]=None,
+				journal_mode: str='WAL',
+				synchronous: str='NORMAL',
+				durable_queue: bool=False,
+				journal_path: Optional[str]=None,
+				journal_sync: bool=False
 				):
 		"""
 		SQLite 이중화 매니저 초기화
@@ -50,20 +483,112 @@ class SqliteReplicationManager:
 			backup_folder (str): 백업 DB 폴더 경로
 			retention_period (RetentionPeriod): 데이터 보존 기간
 			table_shcema (str): 새로 생성된 DB의 기본 테이블 스키마
+			batch_max_size (int): 그룹 커밋 시 한 트랜잭션에 묶을 최대 작업 수 (1 이하이면 그룹 커밋 사용 안 함)
+			batch_max_wait_ms (float): 그룹 커밋 시 작업을 모으기 위해 대기하는 최대 시간 (ms)
+			read_pool_size (int): query()에서 사용하는 읽기 전용 연결 풀의 크기
+			queue_max_size (int): execute 큐의 최대 크기 (0이면 무제한)
+			queue_full_policy (QueueFullPolicy): execute 큐가 가득 찼을 때의 처리 정책
+			spill_path (str): SPILL 정책에서 사용할 저널 파일 경로 (생략 시 "{db_folder}/{db_name}.spill")
+			replication_mode (ReplicationMode): 백업 DB 복제 방식
+			partition_cache_size (int): query_range()에서 압축 해제한 월별 백업 파일을 보관할 최대 개수
+			partition_cache_folder (str): 압축 해제 파일 보관 폴더 (생략 시 "{backup_folder}/.partition_cache")
+			compressor (Compressor): 이전 달 백업 파일 압축기 (생략 시 백그라운드 스레드에서 gzip으로 압축,
+				별도 프로세스에서 압축하려면 Compressor(processes=1)을 지정하고 스크립트에 if __name__ == '__main__': 보호 필요)
+			cached_statements (int): 연결마다 보관할 준비된 SQL 문(prepared statement) 캐시 크기
+			schema_version (int): table_schema의 버전 (DB의 PRAGMA user_version과 같으면 스키마 적용 생략)
+			statements (Dict[str, str]): 미리 등록할 이름 있는 SQL 문 (이름 -> SQL)
+			journal_mode (str): 쓰기 연결의 PRAGMA journal_mode (DELETE, TRUNCATE, PERSIST, MEMORY, WAL, OFF)
+			synchronous (str): 쓰기 연결의 PRAGMA synchronous (OFF, NORMAL, FULL, EXTRA)
+			durable_queue (bool): execute()로 입력된 작업을 커밋될 때까지 저널에 보관하여 비정상 종료 후 재실행 시 다시 처리
+				(적어도 한 번 실행되므로, 종료 직전에 커밋된 작업이 다시 실행될 수 있음)
+			journal_path (str): durable_queue에서 사용할 저널 파일 경로 (생략 시 "{db_folder}/{db_name}.journal")
+			journal_sync (bool): 배치를 실행하기 전에 저널을 디스크에 동기화할지 여부 (전원 장애 대비)
+
+		Raises:
+			ValueError: journal_mode 또는 synchronous 값이 올바르지 않은 경우
 		"""
+		if (journal_mode.upper() not in self._JOURNAL_MODES):
+			raise ValueError(f"Invalid journal_mode: {journal_mode}")
+		if (synchronous.upper() not in self._SYNCHRONOUS_MODES):
+			raise ValueError(f"Invalid synchronous: {synchronous}")
+		self.journal_mode = journal_mode.upper()
+		self.synchronous = synchronous.upper()
+
 		self._execute_queue_timeout = 2
+		self._batch_max_size = max(1, batch_max_size)
+		self._batch_max_wait = max(0.0, batch_max_wait_ms) / 1000.0
 		self._prev_check_time = time()
 		self._main_conn = None
 		self._backup_conn = None
 
+		# 준비된 SQL 문 캐시와 이름 있는 SQL 문 등록부
+		self._cached_statements = max(0, cached_statements)
+		self._statements = {}
+
 		# 백그라운드 작업을 위한 큐와 스레드
-		self._execute_queue = Queue(maxsize=0)
+		self.queue_full_policy = queue_full_policy
+		self._execute_queue = Queue(maxsize=max(0, queue_max_size))
+		self._spill_journal = None
+		self._spill_lock = RLock()
+		self._journal = None
+		self._journal_lock = RLock()
 		self._shutdown_event = Event()
 		self._worker_thread = None
 
+		# 조회용 읽기 전용 연결 풀: (generation, connection) 항목을 보관
+		self._read_pool_size = max(1, read_pool_size)
+		self._read_pool = Queue(maxsize=0)
+		self._read_pool_created = 0
+		self._read_pool_generation = 0
+		self._read_pool_in_use = 0
+		self._read_pool_paused = False
+		self._read_pool_lock = RLock()
+		self._read_pool_condition = Condition(self._read_pool_lock)
+
+		# 비동기 복제 (ReplicationMode.ASYNC)
+		self.replication_mode = replication_mode
+		self._replica_thread = None
+		self._replica_event = Event()
+		self._replica_lock = RLock()
+		self._replica_source_conn = None
+		self._replica_target_conn = None
+		self._replica_applied_seq = None # 백업 DB에 적용된 마지막 복제 로그 번호 (None: 아직 읽지 않음)
+		self._replication_log_truncated_seq = 0
+
+		# 온라인 월별 로테이션 상태
+		self._rotation_thread = None
+		self._rotation_snapshot_ready = Event()
+		self._rotation_snapshot_path = None
+		self._rotation_replay = None
+		self._rotation_replay_journal = None # _rotation_replay가 가득 찬 뒤의 작업을 보관하는 저널 ("{main_db_path}.replay")
+		self._rotation_error = None
+		self._rotation_swap_wait_time = 0.0 # 이 시각 전에는 메인 DB 교체 시 조회 연결 반환을 기다리지 않음
+		self._rotation_finished = Event() # 진행 중인 로테이션이 없으면 설정 (메인 DB 교체 또는 스냅샷 실패로 끝나면 설정)
+		self._rotation_finished.set()
+
 		# 스레드 안전성을 위한 락
 		self._lock = RLock()
 		self._connection_lock = RLock()
+		self._stats_lock = RLock()
+
+		# 배치(그룹 커밋) 통계
+		self._stats = {
+			'batch_count': 0,
+			'task_count': 0,
+			'last_batch_size': 0,
+			'last_batch_latency_ms': 0.0,
+			'max_batch_size': 0,
+			'max_batch_latency_ms': 0.0,
+			'total_batch_latency_ms': 0.0,
+			'dropped_count': 0,
+			'rejected_count': 0,
+			'spilled_count': 0,
+			'last_rotation_pause_ms': 0.0,
+			'journal_replayed_count': 0,
+		}
+		self._started_time = perf_counter()
+		self._commit_latencies = deque(maxlen=self._LATENCY_SAMPLES) # 작업별 큐 입력 ~ 커밋 지연 시간 (ms)
+		self._commit_history = deque() # (커밋 시각, 작업 수)
 
 		# 연결 관리
 		self._thread_local = thread_local()
@@ -72,12 +597,27 @@ class SqliteReplicationManager:
 		self.db_folder = db_folder
 		self.backup_folder = backup_folder
 		self.table_schema = table_schema
+		self.schema_version = schema_version
 		self.retention_period = retention_period
 
+		for name, sql in (statements or {}).items():
+			self.register_statement(name, sql)
+
 		# 폴더 생성
 		makedirs(db_folder, exist_ok=True)
 		makedirs(backup_folder, exist_ok=True)
 
+		# 이전 달 백업 파일 압축기: 로테이션 스레드에서 사용하며, 직접 생성한 경우에만 종료 시 함께 종료
+		self._owns_compressor = (compressor == None)
+		# 기본값은 스레드: spawn 프로세스 풀은 호스트 스크립트의 __main__을 다시 import하므로 보호되지 않은 스크립트가 재실행됨
+		self._compressor = compressor or Compressor(processes=0)
+
+		# 월별 백업 파일 조회용 압축 해제 캐시
+		self._partition_cache = PartitionCache(
+			partition_cache_folder or path.join(backup_folder, ".partition_cache"),
+			max_files=partition_cache_size
+		)
+
 		# 파일 경로 설정
 		self.main_db_path = path.join(db_folder, f"{db_name}.db")
 		current_month = date.today().strftime("%Y%m")
@@ -87,9 +627,22 @@ class SqliteReplicationManager:
 		logging.basicConfig(level=logging.INFO)
 		self.logger = logging.getLogger(__name__)
 
+		# 큐가 가득 찼을 때 작업을 보관할 저널 (이전 실행에서 남은 작업은 이어서 처리)
+		if (queue_full_policy == QueueFullPolicy.SPILL):
+			self._spill_journal = SpillJournal(spill_path or path.join(db_folder, f"{db_name}.spill"))
+			if (self._spill_journal.restored_count > 0):
+				self.logger.warning(f"Restored {self._spill_journal.restored_count} spilled tasks")
+
+		# 커밋되지 않은 작업을 보관하는 저널 (SPILL 저널에 남은 작업은 이 저널에도 모두 있으므로 버림)
+		if (durable_queue):
+			self._journal = WriteAheadJournal(journal_path or path.join(db_folder, f"{db_name}.journal"), sync=journal_sync)
+			if ((len(self._journal) > 0) and (self._spill_journal != None)):
+				self._spill_journal.clear()
+
 		# 초기 연결 설정
 		self._initialize_connections()
 		self._start_background_worker()
+		self._replay_journal()
 
 		# 월별 로테이션 체크
 		# self._check_monthly_rotation()
@@ -103,27 +656,183 @@ class SqliteReplicationManager:
 		self.close()
 
 
+	def _acquire_read_connection(self) -> Tuple[int, sqlite3.Connection]:
+		"""읽기 전용 연결 풀에서 연결 하나를 빌려옴 (풀이 가득 찬 경우 반환될 때까지 대기)
+
+		Returns:
+			Tuple[int, sqlite3.Connection]: 연결이 생성된 풀 세대 번호와 연결
+		"""
+		with self._read_pool_condition:
+			while (self._read_pool_paused): # 메인 DB 교체 중에는 대기
+				self._read_pool_condition.wait()
+			self._read_pool_in_use += 1
+
+		try:
+			return self._borrow_read_connection()
+		except Exception:
+			with self._read_pool_condition:
+				self._read_pool_in_use -= 1
+				self._read_pool_condition.notify_all()
+			raise
+
+
+	def _append_replication_log(self, conn: sqlite3.Connection, sql: str, parameters_list: List[Any]):
+		"""메인 DB의 현재 트랜잭션에 복제 로그 추가"""
+		created = datetime.now().timestamp()
+		conn.executemany(
+			"INSERT INTO _replication_log (sql, parameters, created) VALUES (?, ?, ?)",
+			[(sql, pickle.dumps(parameters, protocol=pickle.HIGHEST_PROTOCOL), created) for parameters in parameters_list]
+		)
+
+
+	def _apply_batch(self, conn: sqlite3.Connection, tasks: List[Dict[str, Any]],
+					replication_log: bool = False, applied_seq: Optional[int] = None):
+		"""여러 작업을 하나의 트랜잭션으로 묶어 실행
+
+		동일한 SQL이 연속되는 구간은 executemany()로 한 번에 실행합니다.
+		구간마다 SAVEPOINT를 두어 실패한 구간만 되돌린 뒤 개별 실행으로 재시도하므로,
+		한 작업의 오류가 같은 배치의 다른 작업에 영향을 주지 않습니다.
+
+		Args:
+			conn: 작업을 적용할 연결
+			tasks: 실행할 작업 목록
+			replication_log: 성공한 작업을 같은 트랜잭션에서 복제 로그에 기록할지 여부
+			applied_seq: 지정 시 같은 트랜잭션에서 복제 적용 위치를 기록 (백업 DB용)
+		"""
+		conn.execute("BEGIN")
+		try:
+			for sql, group in groupby(tasks, key=lambda task: task['sql']):
+				parameters_list = [task['parameters'] for task in group]
+				if ((len(parameters_list) > 1) and self._is_dml(sql)):
+					if (self._run_in_savepoint(conn, conn.executemany, sql, parameters_list,
+								parameters_list if replication_log else None)):
+						continue
+				for parameters in parameters_list:
+					self._run_in_savepoint(conn, conn.execute, sql, parameters,
+								[parameters] if replication_log else None)
+
+			if (applied_seq != None):
+				conn.execute("INSERT OR REPLACE INTO _replication_state (id, applied_seq) VALUES (1, ?)", (applied_seq,))
+			conn.commit()
+
+		except Exception:
+			if (conn.in_transaction):
+				conn.rollback()
+			raise
+
+
+	def _apply_replication_log(self) -> int:
+		"""메인 DB의 복제 로그 중 백업 DB에 적용되지 않은 항목을 한 트랜잭션으로 적용
+
+		적용 위치(applied_seq)는 같은 트랜잭션에서 백업 DB에 기록하므로, 재시작 후에도 이어서 적용합니다.
+
+		Returns:
+			int: 적용한 복제 로그 수
+		"""
+		with self._replica_lock:
+			if (self._replica_source_conn == None):
+				self._replica_source_conn = self._create_read_connection()
+
+			if (self._replica_target_conn == None):
+				self._replica_target_conn = self._connect(self.backup_db_path, check_same_thread=False)
+				row = self._replica_target_conn.execute("SELECT applied_seq FROM _replication_state WHERE id = 1").fetchone()
+				self._replica_applied_seq = row[0] if row else 0
+
+			rows = self._replica_source_conn.execute(
+				"SELECT seq, sql, parameters FROM _replication_log WHERE seq > ? ORDER BY seq LIMIT ?",
+				(self._replica_applied_seq, self._REPLICA_BATCH_SIZE)
+			).fetchall()
+			if (not rows):
+				return 0
+
+			tasks = [{'sql': sql, 'parameters': pickle.loads(parameters)} for (_, sql, parameters) in rows]
+			self._apply_batch(self._replica_target_conn, tasks, applied_seq=rows[-1][0])
+			self._replica_applied_seq = rows[-1][0]
+			return len(rows)
+
+
+	def _apply_schema(self, conn: sqlite3.Connection):
+		"""기본 테이블 스키마를 연결에 직접 적용 (PRAGMA user_version이 schema_version과 같으면 생략)"""
+		if (self.table_schema == None):
+			return
+
+		if (conn.execute("PRAGMA user_version").fetchone()[0] == self.schema_version):
+			return
+
+		conn.executescript(self.table_schema)
+		conn.execute(f"PRAGMA user_version = {int(self.schema_version)}")
+
+
 	def _background_worker(self):
 		"""백그라운드 워커 스레드"""
 		self.logger.info("Background worker started.")
 
 		while (not self._shutdown_event.is_set()):
 			try:
-				# 큐에서 DDL 작업 가져오기 (타임아웃 1초)
-				task = self._execute_queue.get(timeout=1.0)
-				self._execute_ddl(task['sql'], task['parameters']) # DDL 실행
-				self._execute_queue.task_done()
+				# 큐에서 DDL 작업 가져오기 (타임아웃 1초, 로테이션 진행 중에는 0.1초)
+				task = self._execute_queue.get(timeout=(1.0 if (self._rotation_replay == None) else 0.1))
 			except Empty:
-				self._check_monthly_rotation()
+				self._run_maintenance()
 				continue
+
+			tasks = self._collect_batch(task)
+			try:
+				self._execute_batch(tasks) # DDL 실행
 			except Exception as e:
 				self.logger.error(f"Background worker error: {e}")
-				continue
+			finally:
+				for _ in tasks:
+					self._execute_queue.task_done()
+
+			self._run_maintenance(self._REPLICATION_LOG_TRUNCATE_ROWS)
 
 		self._close_connections()
 		self.logger.info("Background worker stopped.")
 
 
+	def _borrow_read_connection(self) -> Tuple[int, sqlite3.Connection]:
+		"""풀에서 유효한 연결을 꺼내거나, 풀 크기 이내라면 새 연결을 생성"""
+		while True:
+			try:
+				generation, conn = self._read_pool.get_nowait()
+			except Empty:
+				with self._read_pool_lock:
+					if (self._read_pool_created < self._read_pool_size):
+						self._read_pool_created += 1
+						generation = self._read_pool_generation
+						break
+				try:
+					generation, conn = self._read_pool.get(timeout=30.0)
+				except Empty:
+					raise RuntimeError("Read connection pool exhausted")
+
+			if (generation == self._read_pool_generation):
+				return generation, conn
+			conn.close() # 이전 세대의 연결은 폐기
+
+		try:
+			return generation, self._create_read_connection()
+		except Exception:
+			with self._read_pool_lock:
+				self._read_pool_created -= 1
+			raise
+
+
+	def _catch_up_replica(self) -> Optional[int]:
+		"""비동기 복제 시 복제 로그를 모두 백업 DB에 적용
+
+		Returns:
+			Optional[int]: 적용된 마지막 복제 로그 번호 (동기 복제이면 None)
+		"""
+		if (self.replication_mode != ReplicationMode.ASYNC):
+			return None
+
+		with self._replica_lock:
+			while (self._apply_replication_log() > 0):
+				pass
+			return self._replica_applied_seq
+
+
 	def _check_monthly_rotation(self):
 		"""월별 로테이션 체크 및 실행: 10초에 한번씩 수행행"""
 		if (self.retention_period == RetentionPeriod.UNLIMITED):
@@ -153,9 +862,9 @@ class SqliteReplicationManager:
 
 		try:
 			for filename in listdir(self.backup_folder):
-				if (filename.startswith(f"{self.db_name}-") and filename.endswith(".db.gz")):
+				if (filename.startswith(f"{self.db_name}-") and filename.endswith(tuple(f".db{extension}" for extension in COMPRESSED_EXTENSIONS))):
 					# 파일명에서 날짜 추출
-					date_part = filename.replace(f"{self.db_name}-", "").replace(".db.gz", "")
+					date_part = strip_extension(filename).replace(f"{self.db_name}-", "").replace(".db", "")
 
 					try:
 						file_date = datetime.strptime(date_part, "%Y%m").date()
@@ -175,8 +884,20 @@ class SqliteReplicationManager:
 			self.logger.error(f"Failed to cleanup old backups: {e}")
 
 
+	def _clear_rotation_replay(self):
+		"""로테이션 중 기록한 다시 적용할 작업을 버리고 저널 파일 삭제"""
+		self._rotation_replay = None
+		if (self._rotation_replay_journal != None):
+			self._rotation_replay_journal.close()
+			remove(self._rotation_replay_journal.journal_path)
+			self._rotation_replay_journal = None
+
+
 	def _close_connections(self):
 		"""모든 연결 종료"""
+		self._reset_read_pool()
+		self._close_replica_connections()
+
 		with self._connection_lock:
 			if (hasattr(self._thread_local, 'main_conn')):
 				self._thread_local.main_conn.close()
@@ -195,24 +916,162 @@ class SqliteReplicationManager:
 				self._backup_conn = None
 
 
-	def _compress_previous_backup(self):
-		"""이전 백업 파일 압축"""
-		if not path.exists(self.backup_db_path):
-			return
+	def _close_replica_connections(self):
+		"""비동기 복제 스레드의 연결 종료 (다음 적용 시 현재 경로로 다시 연결)"""
+		with self._replica_lock:
+			if (self._replica_source_conn != None):
+				self._replica_source_conn.close()
+				self._replica_source_conn = None
 
-		compressed_path = f"{self.backup_db_path}.gz"
+			if (self._replica_target_conn != None):
+				self._replica_target_conn.close()
+				self._replica_target_conn = None
 
-		try:
-			with open(self.backup_db_path, 'rb') as f_in:
-				with gzip_open(compressed_path, 'wb') as f_out:
-					copyfileobj(f_in, f_out)
 
+	def _collect_batch(self, first_task: Dict[str, Any]) -> List[Dict[str, Any]]:
+		"""그룹 커밋을 위해 큐에서 최대 batch_max_size 개의 작업을 batch_max_wait_ms 동안 모음
+
+		Args:
+			first_task: 이미 큐에서 꺼낸 첫 번째 작업
+
+		Returns:
+			List[Dict[str, Any]]: 한 번에 처리할 작업 목록
+		"""
+		tasks = [first_task]
+		deadline = perf_counter() + self._batch_max_wait
+		while (len(tasks) < self._batch_max_size):
+			remaining = deadline - perf_counter()
+			try:
+				if (remaining > 0):
+					tasks.append(self._execute_queue.get(timeout=remaining))
+				else:
+					tasks.append(self._execute_queue.get_nowait())
+			except Empty:
+				break
+		return tasks
+
+
+	def _compress_previous_backup(self, backup_db_path: Optional[str] = None):
+		"""이전 백업 파일 압축 (압축기의 프로세스 풀에서 실행하고 완료될 때까지 대기)
+
+		Args:
+			backup_db_path: 압축할 백업 파일 경로 (생략 시 현재 백업 파일)
+		"""
+		backup_db_path = backup_db_path or self.backup_db_path
+		if not path.exists(backup_db_path):
+			return
+
+		try:
+			compressed_path = self._compressor.submit(backup_db_path).result()
 			self.logger.info(f"Backup compressed: {compressed_path}")
 
 		except Exception as e:
 			self.logger.error(f"Failed to compress backup: {e}")
 
 
+	def _connect(self, db_path: str, check_same_thread: bool = True) -> sqlite3.Connection:
+		"""쓰기용 연결 생성 (기본값: WAL, synchronous=NORMAL)"""
+		conn = sqlite3.connect(db_path, check_same_thread=check_same_thread, timeout=30.0,
+							cached_statements=self._cached_statements)
+		conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+		conn.execute(f"PRAGMA synchronous={self.synchronous}")
+		return conn
+
+
+	def _create_read_connection(self) -> sqlite3.Connection:
+		"""메인 DB에 대한 읽기 전용 연결 생성"""
+		conn = sqlite3.connect(self.main_db_path, check_same_thread=False, timeout=30.0,
+							cached_statements=self._cached_statements)
+		conn.execute("PRAGMA query_only=ON")
+		return conn
+
+
+	def _enqueue(self, task: Dict[str, Any]):
+		"""queue_full_policy에 따라 작업을 큐에 넣음
+
+		Raises:
+			Full: BLOCK 정책에서 제한 시간 안에 큐에 넣지 못했거나, REJECT 정책에서 큐가 가득 찬 경우
+		"""
+		if (self.queue_full_policy == QueueFullPolicy.SPILL):
+			self._enqueue_or_spill(task)
+		elif (self.queue_full_policy == QueueFullPolicy.DROP_OLDEST):
+			self._enqueue_drop_oldest(task)
+		elif (self.queue_full_policy == QueueFullPolicy.REJECT):
+			self._execute_queue.put_nowait(task)
+		else:
+			self._execute_queue.put(task, timeout=self._execute_queue_timeout)
+
+
+	def _enqueue_drop_oldest(self, task: Dict[str, Any]):
+		"""큐가 가득 차 있으면 가장 오래된 작업을 버리고 새 작업을 추가"""
+		while True:
+			try:
+				self._execute_queue.put_nowait(task)
+				return
+			except Full:
+				pass
+
+			try:
+				dropped = self._execute_queue.get_nowait()
+				self._execute_queue.task_done()
+			except Empty:
+				continue
+			self._increase_stat('dropped_count')
+			self.logger.warning(f"Execute queue is full, oldest task dropped: {dropped['sql'][:50]}...")
+
+
+	def _enqueue_or_spill(self, task: Dict[str, Any]):
+		"""큐가 가득 찼거나 저널에 대기 중인 작업이 있으면 순서 유지를 위해 저널에 추가"""
+		with self._spill_lock:
+			if (len(self._spill_journal) == 0):
+				try:
+					self._execute_queue.put_nowait(task)
+					return
+				except Full:
+					pass
+
+			self._spill_journal.append(task)
+			self._increase_stat('spilled_count')
+
+
+	def _execute_batch(self, tasks: List[Dict[str, Any]]):
+		"""작업 목록 실행: 1개이면 개별 실행, 여러 개이면 DB별로 하나의 트랜잭션으로 실행"""
+		start_time = perf_counter()
+		if (self._journal != None):
+			self._journal.flush()
+
+		try:
+			if (len(tasks) == 1):
+				self._execute_ddl(tasks[0]['sql'], tasks[0]['parameters'])
+			else:
+				main_conn, backup_conn = self._get_thread_connections()
+				with self._lock:
+					if (self.replication_mode == ReplicationMode.ASYNC):
+						self._apply_batch(main_conn, tasks, replication_log=True)
+					else:
+						self._apply_batch(main_conn, tasks)
+						self._apply_batch(backup_conn, tasks)
+		finally:
+			if (self.replication_mode == ReplicationMode.ASYNC):
+				self._replica_event.set()
+
+			# 실패한 작업도 다시 실행하지 않도록 처리 완료로 기록 (큐 순서대로 처리되므로 마지막 순번까지 완료)
+			if (self._journal != None):
+				self._journal.commit(max(task.get('journal_seq', 0) for task in tasks))
+			spill_offset = max(task.get('spill_offset', 0) for task in tasks)
+			if (spill_offset > 0):
+				with self._spill_lock:
+					self._spill_journal.commit(spill_offset)
+
+			# 로테이션 중이면 교체될 메인 DB(스냅샷)에 다시 적용하기 위해 기록
+			if (self._rotation_replay != None):
+				self._record_rotation_replay(tasks)
+
+		latency_ms = (perf_counter() - start_time) * 1000.0
+		self._record_batch(tasks, latency_ms)
+		self.logger.debug(f"Batch committed: {len(tasks)} tasks in {latency_ms:.3f} ms")
+
+
 	def _execute_ddl(self, sql: str, parameters: Tuple):
 		"""실제 DDL 실행"""
 		main_conn, backup_conn = self._get_thread_connections()
@@ -221,11 +1080,16 @@ class SqliteReplicationManager:
 			with self._lock:
 				# 메인 DB에 실행
 				main_conn.execute(sql, parameters)
-				main_conn.commit()
+				if (self.replication_mode == ReplicationMode.ASYNC):
+					# 비동기 복제: 복제 로그만 같은 트랜잭션에 기록하고 백업 DB 적용은 복제 스레드에 맡김
+					self._append_replication_log(main_conn, sql, [parameters])
+					main_conn.commit()
+				else:
+					main_conn.commit()
 
-				# 백업 DB에 실행
-				backup_conn.execute(sql, parameters)
-				backup_conn.commit()
+					# 백업 DB에 실행
+					backup_conn.execute(sql, parameters)
+					backup_conn.commit()
 
 				self.logger.debug(f"DDL executed successfully: {sql[:50]}...")
 
@@ -240,27 +1104,104 @@ class SqliteReplicationManager:
 			raise
 
 
+	def _finish_monthly_rotation(self, swap_timeout: Optional[float] = None):
+		"""스냅샷이 준비되었으면 로테이션 중 처리된 작업을 스냅샷에 적용하고 메인 DB를 원자적으로 교체
+
+		Args:
+			swap_timeout: 사용 중인 조회 연결이 반환되기를 기다리는 최대 시간 (초)
+				None이면 쓰기 워커용: 평소에는 기다리지 않고 시도하며, _ROTATION_SWAP_WAIT_INTERVAL마다 한 번만
+				_ROTATION_SWAP_TIMEOUT 동안 기다림 (긴 조회가 이어져도 배치 처리가 막히지 않도록)
+		"""
+		if ((self._rotation_replay == None) or (not self._rotation_snapshot_ready.is_set())):
+			return
+
+		snapshot_path = self._rotation_snapshot_path
+		if (self._rotation_error != None):
+			self.logger.error(f"Monthly rotation snapshot failed, keeping current main DB: {self._rotation_error}")
+			self._clear_rotation_replay()
+			if path.exists(snapshot_path):
+				remove(snapshot_path)
+			self._rotation_finished.set()
+			return
+
+		if (swap_timeout == None):
+			now = time()
+			if (now < self._rotation_swap_wait_time):
+				swap_timeout = 0.0
+			else:
+				swap_timeout = self._ROTATION_SWAP_TIMEOUT
+				self._rotation_swap_wait_time = now + self._ROTATION_SWAP_WAIT_INTERVAL
+
+		if (not self._pause_read_pool(swap_timeout)):
+			if (swap_timeout > 0):
+				self.logger.warning("Main DB swap postponed: queries are still running")
+			return
+
+		pause_start_time = perf_counter()
+		try:
+			with self._lock:
+				snapshot_conn = sqlite3.connect(snapshot_path)
+				try:
+					self._apply_schema(snapshot_conn)
+					replayed_count = len(self._rotation_replay)
+					if (self._rotation_replay):
+						self._apply_batch(snapshot_conn, self._rotation_replay)
+					# 메모리 한도를 넘은 작업은 저널에서 한도만큼씩 꺼내 적용 (추가된 순서 유지)
+					while ((self._rotation_replay_journal != None) and (len(self._rotation_replay_journal) > 0)):
+						tasks = self._rotation_replay_journal.pop(self._ROTATION_REPLAY_MEMORY_LIMIT)
+						self._apply_batch(snapshot_conn, tasks)
+						replayed_count += len(tasks)
+				finally:
+					snapshot_conn.close()
+
+				# 비동기 복제 중이면 교체 전에 이전 메인 DB의 복제 로그를 모두 적용하고, 새 메인 DB의 로그는 처음부터 시작
+				with self._replica_lock, self._connection_lock:
+					self._catch_up_replica()
+					self._close_replica_connections()
+
+					if (hasattr(self._thread_local, 'main_conn')):
+						self._thread_local.main_conn.close()
+						delattr(self._thread_local, 'main_conn')
+
+					if (self._main_conn != None):
+						self._main_conn.close()
+						self._main_conn = None
+
+					self._reset_read_pool()
+					replace(snapshot_path, self.main_db_path)
+					self._main_conn = self._connect(self.main_db_path, check_same_thread=False)
+					self._prepare_replication_tables(self._main_conn, self._backup_conn, applied_seq=0)
+
+				self.logger.info(f"Main DB swapped with rotation snapshot ({replayed_count} tasks replayed)")
+				self._clear_rotation_replay()
+				self._rotation_finished.set()
+
+		except Exception as e:
+			self.logger.error(f"Failed to swap main DB: {e}")
+			raise
+		finally:
+			self._resume_read_pool()
+			with self._stats_lock:
+				self._stats['last_rotation_pause_ms'] = (perf_counter() - pause_start_time) * 1000.0
+
+
 	def _get_thread_connections(self) -> Tuple[sqlite3.Connection, sqlite3.Connection]:
 		"""스레드별 연결 반환"""
 		if not hasattr(self._thread_local, 'main_conn'):
-			self._thread_local.main_conn = sqlite3.connect(
-				self.main_db_path,
-				timeout=30.0
-			)
-			self._thread_local.main_conn.execute("PRAGMA journal_mode=WAL")
-			self._thread_local.main_conn.execute("PRAGMA synchronous=NORMAL")
+			self._thread_local.main_conn = self._connect(self.main_db_path)
 
 		if not hasattr(self._thread_local, 'backup_conn'):
-			self._thread_local.backup_conn = sqlite3.connect(
-				self.backup_db_path,
-				timeout=30.0
-			)
-			self._thread_local.backup_conn.execute("PRAGMA journal_mode=WAL")
-			self._thread_local.backup_conn.execute("PRAGMA synchronous=NORMAL")
+			self._thread_local.backup_conn = self._connect(self.backup_db_path)
 
 		return self._thread_local.main_conn, self._thread_local.backup_conn
 
 
+	def _increase_stat(self, name: str):
+		"""카운터 통계 증가"""
+		with self._stats_lock:
+			self._stats[name] += 1
+
+
 	def _initialize_connections(self):
 		"""데이터베이스 연결 초기화"""
 		with self._connection_lock:
@@ -268,19 +1209,16 @@ class SqliteReplicationManager:
 				self._get_thread_connections()
 				self._close_connections()
 
+				# 스키마는 큐 크기 제한과 무관하도록 연결에 직접 적용
 				if (self._main_conn == None):
-					self._main_conn = sqlite3.connect(self.main_db_path, check_same_thread=False, timeout=30.0)
-					self._main_conn.execute("PRAGMA journal_mode=WAL")
-					self._main_conn.execute("PRAGMA synchronous=NORMAL")
-					if (self.table_schema != None):
-						self.execute(self.table_schema)
+					self._main_conn = self._connect(self.main_db_path, check_same_thread=False)
+					self._apply_schema(self._main_conn)
 
 				if (self._backup_conn == None):
-					self._backup_conn = sqlite3.connect(self.backup_db_path, check_same_thread=False, timeout=30.0)
-					self._backup_conn.execute("PRAGMA journal_mode=WAL")
-					self._backup_conn.execute("PRAGMA synchronous=NORMAL")
-					if (self.table_schema != None):
-						self.execute(self.table_schema)
+					self._backup_conn = self._connect(self.backup_db_path, check_same_thread=False)
+					self._apply_schema(self._backup_conn)
+
+				self._prepare_replication_tables(self._main_conn, self._backup_conn)
 
 				self.logger.info(f"Database connections initialized: {self.main_db_path}, {self.backup_db_path}")
 
@@ -289,40 +1227,357 @@ class SqliteReplicationManager:
 				raise
 
 
+	@staticmethod
+	def _is_dml(sql: str) -> bool:
+		"""executemany()로 실행 가능한 DML 문인지 여부"""
+		return sql.lstrip()[:7].upper().startswith(('INSERT', 'UPDATE', 'DELETE', 'REPLACE'))
+
+
+	def _partition_paths(self, start: Union[date, datetime], end: Union[date, datetime]) -> List[str]:
+		"""기간에 해당하는 월별 백업 파일 경로 목록 (오래된 달부터, 없는 달은 제외)
+
+		현재 달은 사용 중인 백업 파일을, 이전 달은 압축되지 않은 파일이 있으면 그 파일을,
+		없으면 압축 파일(.db.gz, .db.zst, .db.lz4)을 캐시에 해제하여 사용합니다.
+		"""
+		partition_paths = []
+		year, month = start.year, start.month
+		while ((year, month) <= (end.year, end.month)):
+			db_path = path.join(self.backup_folder, f"{self.db_name}-{year:04d}{month:02d}.db")
+			compressed_paths = [f"{db_path}{extension}" for extension in COMPRESSED_EXTENSIONS if path.exists(f"{db_path}{extension}")]
+			if ((db_path == self.backup_db_path) or path.exists(db_path)):
+				partition_paths.append(db_path)
+			elif (compressed_paths):
+				partition_paths.append(self._partition_cache.get(compressed_paths[0]))
+			else:
+				self.logger.debug(f"No backup partition for {year:04d}{month:02d}")
+
+			year, month = (year + 1, 1) if (month == 12) else (year, month + 1)
+		return partition_paths
+
+
+	def _pause_read_pool(self, timeout: float) -> bool:
+		"""새 조회 연결 대여를 멈추고, 사용 중인 연결이 모두 반환될 때까지 대기
+
+		Returns:
+			bool: 제한 시간 안에 모든 연결이 반환되었는지 여부 (실패 시 대여 재개)
+		"""
+		with self._read_pool_condition:
+			self._read_pool_paused = True
+			if (self._read_pool_condition.wait_for(lambda: self._read_pool_in_use == 0, timeout)):
+				return True
+			self._read_pool_paused = False
+			self._read_pool_condition.notify_all()
+			return False
+
+
 	def _perform_monthly_rotation(self, current_month: str):
-		"""월별 로테이션 수행"""
+		"""월별 로테이션 시작 (온라인)
+
+		새 달의 백업 파일로 즉시 전환한 뒤, 이전 달 백업의 스냅샷 생성과 압축은 별도 스레드에서 수행합니다.
+		스냅샷이 준비되면 워커가 _finish_monthly_rotation()에서 메인 DB를 교체하므로,
+		로테이션 중에도 execute() 큐는 계속 처리됩니다.
+		"""
 		with self._lock:
 			try:
 				self.logger.info("Starting monthly rotation...")
 
-				# 기존 연결 종료
-				self._close_connections()
+				# 이전 로테이션의 압축 작업이 남아 있으면 완료 대기
+				if (self._rotation_thread != None):
+					self._rotation_thread.join()
+					self._rotation_thread = None
+
+				previous_backup_path = self.backup_db_path
+				self._rotation_finished.clear() # 백업 파일 경로를 바꾸기 전에 해제 (경로로 시작 여부를 확인하는 쪽을 위해)
+
+				# 새로운 백업 파일로 전환 (이전 백업 파일에 대한 연결은 모두 종료)
+				# 비동기 복제 중이면 이전 백업 파일에 복제 로그를 모두 적용한 뒤 전환
+				with self._replica_lock, self._connection_lock:
+					applied_seq = self._catch_up_replica()
+					self._close_replica_connections()
+
+					if (hasattr(self._thread_local, 'backup_conn')):
+						self._thread_local.backup_conn.close()
+						delattr(self._thread_local, 'backup_conn')
+
+					if (self._backup_conn != None):
+						self._backup_conn.close()
+						self._backup_conn = None
+
+					self.backup_db_path = path.join(self.backup_folder, f"{self.db_name}-{current_month}.db")
+					self._backup_conn = self._connect(self.backup_db_path, check_same_thread=False)
+					self._apply_schema(self._backup_conn)
+					self._prepare_replication_tables(backup_conn=self._backup_conn, applied_seq=applied_seq)
+
+				# 스냅샷이 준비될 때까지 처리되는 작업은 스냅샷에 다시 적용하기 위해 기록
+				self._rotation_replay = []
+				self._rotation_error = None
+				self._rotation_swap_wait_time = time() + self._ROTATION_SWAP_WAIT_INTERVAL
+				self._rotation_snapshot_ready.clear()
+				self._rotation_snapshot_path = f"{self.main_db_path}.rotating"
+				self._rotation_thread = Thread(
+					target=self._rotation_worker,
+					args=(previous_backup_path, self._rotation_snapshot_path),
+					daemon=True
+				)
+				self._rotation_thread.start()
+
+			except Exception as e:
+				self.logger.error(f"Monthly rotation failed: {e}")
+				raise
+
+
+	@staticmethod
+	def _percentile(sorted_values: List[float], percent: float) -> float:
+		"""정렬된 값 목록의 백분위 값"""
+		if (not sorted_values):
+			return 0.0
+		return sorted_values[round((percent / 100.0) * (len(sorted_values) - 1))]
+
+
+	def _prepare_replication_tables(self, main_conn: Optional[sqlite3.Connection] = None,
+									backup_conn: Optional[sqlite3.Connection] = None,
+									applied_seq: Optional[int] = None):
+		"""비동기 복제용 테이블 생성 (메인 DB: 복제 로그, 백업 DB: 적용 위치)
+
+		Args:
+			applied_seq: 지정 시 백업 DB의 적용 위치를 이 값으로 초기화
+		"""
+		if (self.replication_mode != ReplicationMode.ASYNC):
+			return
+
+		if (main_conn != None):
+			main_conn.execute(self._SQL_CREATE_REPLICATION_LOG)
+			main_conn.commit()
+
+		if (backup_conn != None):
+			backup_conn.execute(self._SQL_CREATE_REPLICATION_STATE)
+			if (applied_seq != None):
+				backup_conn.execute("INSERT OR REPLACE INTO _replication_state (id, applied_seq) VALUES (1, ?)", (applied_seq,))
+				self._replica_applied_seq = applied_seq
+				self._replication_log_truncated_seq = min(self._replication_log_truncated_seq, applied_seq)
+			backup_conn.commit()
+
+
+	def _replay_journal(self):
+		"""이전 실행에서 커밋되지 못한 작업을 저널 순서대로 다시 큐에 넣음"""
+		if (self._journal == None):
+			return
 
-				# 이전 달 백업 파일 압축
-				self._compress_previous_backup()
+		tasks = self._journal.take_pending()
+		if (not tasks):
+			return
 
-				# 메인 DB 파일 삭제
-				if path.exists(self.main_db_path):
-					remove(self.main_db_path)
+		self.logger.warning(f"Replaying {len(tasks)} uncommitted tasks from journal")
+		for task in tasks:
+			task['enqueued'] = perf_counter()
+			self._execute_queue.put(task)
+		with self._stats_lock:
+			self._stats['journal_replayed_count'] += len(tasks)
 
-				# 이전 달 백업을 메인으로 복사
-				if path.exists(self.backup_db_path):
-					copy2(self.backup_db_path, self.main_db_path)
 
-				# 새로운 백업 파일 경로 설정
-				self.backup_db_path = path.join(self.backup_folder, f"{self.db_name}-{current_month}.db")
+	def _query_partition(self, db_path: str, sql: str, parameters: Tuple) -> List[Tuple]:
+		"""월별 백업 파일 하나에 조회 실행"""
+		if (db_path == self.backup_db_path):
+			conn = sqlite3.connect(db_path, timeout=30.0)
+			conn.execute("PRAGMA query_only=ON")
+		else:
+			# 더 이상 변경되지 않는 이전 달 파일은 잠금 없이 읽기 전용으로 열기
+			conn = sqlite3.connect(f"file:{db_path}?immutable=1", uri=True, timeout=30.0)
 
-				self._initialize_connections()
-				self._start_background_worker()
+		try:
+			return conn.execute(sql, parameters).fetchall()
+		finally:
+			conn.close()
+
+
+	def _record_batch(self, tasks: List[Dict[str, Any]], latency_ms: float):
+		"""배치 처리 통계 기록"""
+		batch_size = len(tasks)
+		now = perf_counter()
+		with self._stats_lock:
+			self._commit_latencies.extend((now - task['enqueued']) * 1000.0 for task in tasks)
+			self._commit_history.append((now, batch_size))
+			while (self._commit_history and (self._commit_history[0][0] < (now - self._RATE_WINDOW))):
+				self._commit_history.popleft()
+
+			stats = self._stats
+			stats['batch_count'] += 1
+			stats['task_count'] += batch_size
+			stats['last_batch_size'] = batch_size
+			stats['last_batch_latency_ms'] = latency_ms
+			stats['max_batch_size'] = max(stats['max_batch_size'], batch_size)
+			stats['max_batch_latency_ms'] = max(stats['max_batch_latency_ms'], latency_ms)
+			stats['total_batch_latency_ms'] += latency_ms
+
+
+	def _record_rotation_replay(self, tasks: List[Dict[str, Any]]):
+		"""로테이션 중 처리된 작업을 교체될 메인 DB(스냅샷)에 다시 적용하기 위해 기록
+
+		스냅샷 생성이 오래 걸려도 메모리 사용량이 늘어나지 않도록, 메모리에는 _ROTATION_REPLAY_MEMORY_LIMIT 개까지만
+		보관하고 이후 작업은 (순서를 유지하도록) 모두 디스크 저널("{main_db_path}.replay")에 기록합니다.
+		"""
+		if ((self._rotation_replay_journal == None)
+				and (len(self._rotation_replay) + len(tasks) <= self._ROTATION_REPLAY_MEMORY_LIMIT)):
+			self._rotation_replay.extend(tasks)
+			return
 
-				# 오래된 백업 파일 정리
-				self._cleanup_old_backups()
+		if (self._rotation_replay_journal == None):
+			self._rotation_replay_journal = SpillJournal(f"{self.main_db_path}.replay")
+			self._rotation_replay_journal.clear() # 이전 실행에서 남은 파일은 교체되지 못한 스냅샷의 작업이므로 버림
+			self.logger.warning(f"Rotation replay exceeded {self._ROTATION_REPLAY_MEMORY_LIMIT} tasks, spilling to disk")
+		for task in tasks:
+			self._rotation_replay_journal.append({'sql': task['sql'], 'parameters': task['parameters']})
 
-				self.logger.info("Monthly rotation completed successfully")
 
+	def _refill_from_spill(self):
+		"""저널에 보관된 작업을 큐의 빈 자리만큼 순서대로 옮김"""
+		if ((self._spill_journal == None) or (len(self._spill_journal) == 0)):
+			return
+
+		with self._spill_lock:
+			if (self._execute_queue.maxsize > 0):
+				free_slots = self._execute_queue.maxsize - self._execute_queue.qsize()
+			else:
+				free_slots = len(self._spill_journal)
+
+			restored_count = self._spill_journal.restored_count
+			tasks = self._spill_journal.pop(free_slots)
+			if (restored_count > 0):
+				# 이전 실행에서 복구된 작업은 지연 시간 측정 기준을 현재 시각으로 맞춤
+				self._spill_journal.restored_count = max(0, restored_count - len(tasks))
+				for task in tasks[:restored_count]:
+					task['enqueued'] = perf_counter()
+
+			for task in tasks:
+				self._execute_queue.put_nowait(task)
+
+
+	def _release_read_connection(self, generation: int, conn: sqlite3.Connection):
+		"""빌려온 읽기 전용 연결을 풀에 반환 (풀이 초기화된 이후라면 연결 종료)"""
+		with self._read_pool_condition:
+			self._read_pool_in_use -= 1
+			self._read_pool_condition.notify_all()
+			if (generation == self._read_pool_generation):
+				self._read_pool.put((generation, conn))
+				return
+		conn.close()
+
+
+	def _replica_worker(self):
+		"""비동기 복제 스레드: 복제 로그를 백업 DB에 적용"""
+		self.logger.info("Replica worker started.")
+
+		while (not self._shutdown_event.is_set()):
+			try:
+				if (self._apply_replication_log() == 0):
+					self._replica_event.wait(0.5)
+					self._replica_event.clear()
 			except Exception as e:
-				self.logger.error(f"Monthly rotation failed: {e}")
-				raise
+				self.logger.error(f"Replica worker error: {e}")
+				self._close_replica_connections()
+				self._shutdown_event.wait(1.0)
+
+		self.logger.info("Replica worker stopped.")
+
+
+	def _reset_read_pool(self):
+		"""읽기 전용 연결 풀 초기화: 대기 중인 연결은 즉시 종료하고, 사용 중인 연결은 반환 시 종료"""
+		with self._read_pool_lock:
+			self._read_pool_generation += 1
+			self._read_pool_created = 0
+			while True:
+				try:
+					_, conn = self._read_pool.get_nowait()
+				except Empty:
+					break
+				conn.close()
+
+
+	def _resume_read_pool(self):
+		"""조회 연결 대여 재개"""
+		with self._read_pool_condition:
+			self._read_pool_paused = False
+			self._read_pool_condition.notify_all()
+
+
+	def _rotation_worker(self, previous_backup_path: str, snapshot_path: str):
+		"""로테이션 스레드: 이전 달 백업의 스냅샷 생성 후 압축 및 오래된 백업 정리
+
+		스냅샷은 sqlite3 backup API로 일정 페이지씩 나누어 복사하며,
+		더 이상 쓰기가 없는 이전 달 백업 파일을 대상으로 하므로 쓰기 락이 필요하지 않습니다.
+		"""
+		try:
+			if path.exists(snapshot_path):
+				remove(snapshot_path)
+
+			snapshot_conn = sqlite3.connect(snapshot_path)
+			try:
+				if path.exists(previous_backup_path):
+					source_conn = sqlite3.connect(previous_backup_path)
+					try:
+						source_conn.backup(snapshot_conn, pages=self._ROTATION_BACKUP_PAGES)
+					finally:
+						source_conn.close()
+			finally:
+				snapshot_conn.close()
+
+			self.logger.info(f"Rotation snapshot created: {snapshot_path}")
+
+		except Exception as e:
+			self._rotation_error = e
+		finally:
+			self._rotation_snapshot_ready.set()
+
+		# 이전 달 백업 파일 압축 및 오래된 백업 파일 정리
+		self._compress_previous_backup(previous_backup_path)
+		self._cleanup_old_backups()
+
+		self.logger.info("Monthly rotation completed successfully")
+
+
+	def _run_maintenance(self, replication_log_rows: int = 1):
+		"""쓰기 워커의 주기 작업: 저널 작업 보충, 복제 로그 정리, 월별 로테이션 시작 및 마무리
+
+		작업마다 예외를 기록만 하고 계속 진행하므로, 주기 작업의 실패로 쓰기 워커가 종료되지 않습니다.
+
+		Args:
+			replication_log_rows: 적용 완료된 복제 로그가 이 수 이상 쌓였을 때만 정리
+		"""
+		for name, args in (('_refill_from_spill', ()),
+						('_truncate_replication_log', (replication_log_rows,)),
+						('_check_monthly_rotation', ()),
+						('_finish_monthly_rotation', ())):
+			try:
+				getattr(self, name)(*args)
+			except Exception as e:
+				self.logger.error(f"Background worker maintenance error ({name}): {e}")
+
+
+	def _run_in_savepoint(self, conn: sqlite3.Connection, method, sql: str, parameters,
+						log_parameters: Optional[List[Any]] = None) -> bool:
+		"""SAVEPOINT 안에서 SQL을 실행하고, 실패 시 해당 SAVEPOINT까지만 되돌림
+
+		Args:
+			log_parameters: 지정 시 성공한 작업을 같은 SAVEPOINT 안에서 복제 로그에 기록
+
+		Returns:
+			bool: 실행 성공 여부
+		"""
+		conn.execute("SAVEPOINT batch_run")
+		try:
+			method(sql, parameters)
+			if (log_parameters != None):
+				self._append_replication_log(conn, sql, log_parameters)
+			conn.execute("RELEASE batch_run")
+			return True
+		except sqlite3.Error as e:
+			self.logger.error(f"Failed to execute DDL in batch: {e}")
+			if (conn.in_transaction):
+				conn.execute("ROLLBACK TO batch_run")
+				conn.execute("RELEASE batch_run")
+			else:
+				conn.execute("BEGIN")
+			return False
 
 
 	def _start_background_worker(self):
@@ -331,6 +1586,10 @@ class SqliteReplicationManager:
 			self._worker_thread = Thread(target=self._background_worker, daemon=True)
 			self._worker_thread.start()
 
+		if ((self.replication_mode == ReplicationMode.ASYNC) and (self._replica_thread == None)):
+			self._replica_thread = Thread(target=self._replica_worker, daemon=True)
+			self._replica_thread.start()
+
 
 	def _stop_background_worker(self):
 		"""백그라운드 워커 종료"""
@@ -340,27 +1599,93 @@ class SqliteReplicationManager:
 		if self._worker_thread.is_alive():
 			self._worker_thread.join(timeout=5.0)
 
+		if ((self._replica_thread != None) and self._replica_thread.is_alive()):
+			self._replica_event.set()
+			self._replica_thread.join(timeout=5.0)
+
 		self._worker_thread == None
 
 
+	def _truncate_replication_log(self, min_rows: int = 1):
+		"""백업 DB에 적용이 끝난 복제 로그 삭제 (쓰기 워커에서 호출)
+
+		Args:
+			min_rows: 적용 완료된 로그가 이 수 이상 쌓였을 때만 정리
+		"""
+		if (self.replication_mode != ReplicationMode.ASYNC):
+			return
+
+		applied_seq = self._replica_applied_seq
+		if ((applied_seq == None) or ((applied_seq - self._replication_log_truncated_seq) < min_rows)):
+			return
+
+		main_conn, _ = self._get_thread_connections()
+		with self._lock:
+			try:
+				main_conn.execute("DELETE FROM _replication_log WHERE seq <= ?", (applied_seq,))
+				main_conn.commit()
+			except sqlite3.Error as e:
+				# 열린 트랜잭션이 남으면 이후 배치의 BEGIN이 모두 실패하므로 되돌리고 다음 주기에 다시 정리
+				if (main_conn.in_transaction):
+					main_conn.rollback()
+				self.logger.error(f"Failed to truncate replication log: {e}")
+				return
+		self._replication_log_truncated_seq = applied_seq
+
+
 	def close(self):
 		"""매니저 종료"""
 		self.logger.info("Shutting down SqliteReplicationManager...")
 
 		self._stop_background_worker()
 
-		# 큐의 남은 작업 처리
+		# 진행 중인 로테이션 마무리
+		if (self._rotation_thread != None):
+			self._rotation_snapshot_ready.wait()
+			self._finish_monthly_rotation(swap_timeout=30.0)
+			self._rotation_thread.join()
+
+		# 큐(및 저널)의 남은 작업 처리
+		while True:
+			self._refill_from_spill()
+			try:
+				tasks = self._collect_batch(self._execute_queue.get_nowait())
+			except Empty:
+				break
+
+			try:
+				self._execute_batch(tasks)
+			except Exception as e:
+				self.logger.error(f"Failed to drain execute queue: {e}")
+			finally:
+				for _ in tasks:
+					self._execute_queue.task_done()
+
+		# 비동기 복제 중이면 남은 복제 로그를 모두 백업 DB에 적용
 		try:
-			while not self._execute_queue.empty():
-				task = self._execute_queue.get_nowait()
-				self._execute_ddl(task['sql'], task['parameters'])
-				self._execute_queue.task_done()
-		except Empty:
-			pass
+			self._catch_up_replica()
+		except Exception as e:
+			self.logger.error(f"Failed to catch up replica: {e}")
 
 		# 연결 종료
 		self._close_connections()
 
+		if (self._spill_journal != None):
+			self._spill_journal.close()
+			if (len(self._spill_journal) == 0):
+				remove(self._spill_journal.journal_path)
+
+		self._clear_rotation_replay() # 교체하지 못한 로테이션의 다시 적용할 작업 (스냅샷은 다음 로테이션에서 다시 생성)
+
+		if (self._journal != None):
+			self._journal.close()
+			if (len(self._journal) == 0):
+				remove(self._journal.journal_path)
+
+		self._partition_cache.clear()
+		if (self._owns_compressor):
+			self._compressor.close()
+
 		self.logger.info("SqliteReplicationManager shutdown completed")
 
 
@@ -368,31 +1693,180 @@ class SqliteReplicationManager:
 		"""
 		DDL 실행 (백그라운드에서 처리)
 
+		큐가 가득 찼을 때의 동작은 queue_full_policy를 따릅니다.
+
 		Args:
 			sql: 실행할 SQL 문
 			parameters: SQL 파라미터
+
+		Raises:
+			RuntimeError: BLOCK 정책에서 제한 시간 안에 큐에 넣지 못했거나, REJECT 정책에서 큐가 가득 찬 경우
 		"""
 		task = {
 			'sql': sql,
 			'parameters': parameters,
-			'timestamp': datetime.now()
+			'timestamp': datetime.now(),
+			'enqueued': perf_counter()
 		}
 
 		try:
-			self._execute_queue.put(task, timeout=self._execute_queue_timeout)
+			if (self._journal == None):
+				self._enqueue(task)
+			else:
+				# 저널 순번과 큐 순서가 같도록 저널 기록과 큐 입력을 함께 잠금
+				with self._journal_lock:
+					seq = self._journal.append(task)
+					try:
+						self._enqueue(task)
+					except Full:
+						self._journal.discard_last(seq)
+						raise
 			self.logger.debug(f"Queued DDL task: {sql[:50]}...")
 		except Full:
+			self._increase_stat('rejected_count')
 			self.logger.error("Execute queue is full, task rejected")
 			raise RuntimeError("Execute queue is full")
 
 
+	def execute_statement(self, name: str, parameters: Tuple = ()):
+		"""
+		register_statement()로 등록한 SQL 문 실행 (백그라운드에서 처리)
+
+		Args:
+			name: 등록된 SQL 문 이름
+			parameters: SQL 파라미터
+
+		Raises:
+			KeyError: 등록되지 않은 이름인 경우
+		"""
+		sql = self._statements.get(name)
+		if (sql == None):
+			raise KeyError(f"Statement not registered: {name}")
+		self.execute(sql, parameters)
+
+
+	def get_stats(self) -> Dict[str, Any]:
+		"""
+		쓰기 작업 처리 통계 반환
+
+		Returns:
+			Dict[str, Any]: 배치 수, 작업 수, 배치 크기 및 배치 처리 지연 시간(ms) 통계와
+				큐 깊이, 큐 입력 ~ 커밋 지연 시간(ms) 백분위, 초당 커밋 작업 수 게이지
+		"""
+		now = perf_counter()
+		with self._stats_lock:
+			stats = dict(self._stats)
+			latencies = sorted(self._commit_latencies)
+			recent_rows = sum(count for (committed, count) in self._commit_history if (committed >= (now - self._RATE_WINDOW)))
+
+		batch_count = stats.pop('batch_count')
+		total_latency_ms = stats.pop('total_batch_latency_ms')
+		stats['batch_count'] = batch_count
+		stats['avg_batch_size'] = (stats['task_count'] / batch_count) if batch_count else 0.0
+		stats['avg_batch_latency_ms'] = (total_latency_ms / batch_count) if batch_count else 0.0
+
+		stats['queue_depth'] = self._execute_queue.qsize()
+		stats['queue_max_size'] = self._execute_queue.maxsize
+		stats['spill_depth'] = len(self._spill_journal) if (self._spill_journal != None) else 0
+		stats['journal_depth'] = len(self._journal) if (self._journal != None) else 0
+		stats['commit_latency_ms'] = {
+			'p50': self._percentile(latencies, 50),
+			'p90': self._percentile(latencies, 90),
+			'p99': self._percentile(latencies, 99),
+			'max': latencies[-1] if latencies else 0.0,
+		}
+		stats['rows_per_second'] = recent_rows / max(min(self._RATE_WINDOW, now - self._started_time), 1e-3)
+
+		if (self.replication_mode == ReplicationMode.ASYNC):
+			applied_seq = self._replica_applied_seq or 0
+			with self.query("SELECT COUNT(*), MIN(created) FROM _replication_log WHERE seq > ?", (applied_seq,)) as cursor:
+				lag_statements, oldest_created = cursor.fetchone()
+			stats['replica_applied_seq'] = applied_seq
+			stats['replica_lag_statements'] = lag_statements
+			stats['replica_lag_seconds'] = max(0.0, datetime.now().timestamp() - oldest_created) if oldest_created else 0.0
+		return stats
+
+
+	def iter_query(self, sql: str, parameters: Tuple = (), fetch_size: int = 1000) -> Iterator[Tuple]:
+		"""
+		대량 조회 결과를 fetchmany()로 나누어 가져오는 반복자 (메인 DB에서만 조회)
+
+		Args:
+			sql: 실행할 SQL 문
+			parameters: SQL 파라미터
+			fetch_size: 한 번에 가져올 행 수
+
+		Yields:
+			Tuple: 조회 결과 행
+		"""
+		if (self._main_conn == None):
+			raise Exception('Main db not connected.')
+
+		generation, conn = self._acquire_read_connection()
+		cursor = None
+
+		try:
+			cursor = conn.execute(sql, parameters)
+			while True:
+				rows = cursor.fetchmany(fetch_size)
+				if (not rows):
+					break
+				yield from rows
+
+		except Exception as e:
+			self.logger.error(f"Query execution failed: {e}")
+			raise
+		finally:
+			if cursor:
+				cursor.close()
+			self._release_read_connection(generation, conn)
+
+
+	def query_range(self, sql: str, start: Union[date, datetime], end: Union[date, datetime],
+					parameters: Tuple = (), sort_key: Optional[Callable[[Tuple], Any]] = None) -> List[Tuple]:
+		"""
+		기간에 해당하는 월별 백업 파일들에 같은 조회를 병렬로 실행하고 결과를 병합 (로테이션된 달 포함)
+
+		압축된 이전 달 백업 파일은 필요할 때 압축을 해제하여 크기 제한 LRU 캐시에 보관합니다.
+		달 내부의 시간 조건은 sql과 parameters로 지정합니다.
+
+		Args:
+			sql: 각 월별 백업 파일에 실행할 SQL 문
+			start: 조회 시작 일자 (해당 달부터 포함)
+			end: 조회 종료 일자 (해당 달까지 포함)
+			parameters: SQL 파라미터
+			sort_key: 지정 시 병합된 결과를 이 키로 정렬 (생략 시 오래된 달부터 순서대로 연결)
+
+		Returns:
+			List[Tuple]: 병합된 조회 결과
+		"""
+		partition_paths = self._partition_paths(start, end)
+		if (not partition_paths):
+			return []
+
+		try:
+			with ThreadPoolExecutor(max_workers=min(len(partition_paths), self._read_pool_size)) as executor:
+				partition_rows = list(executor.map(lambda db_path: self._query_partition(db_path, sql, parameters), partition_paths))
+		except Exception as e:
+			self.logger.error(f"Partition query failed: {e}")
+			raise
+
+		rows = [row for result in partition_rows for row in result]
+		if (sort_key != None):
+			rows.sort(key=sort_key)
+		return rows
+
+
 	@contextmanager
-	def query(self, sql: str) -> Generator[sqlite3.Cursor, None, None]:
+	def query(self, sql: str, parameters: Tuple = ()) -> Generator[sqlite3.Cursor, None, None]:
 		"""
 		DML 실행 (메인 DB에서만 조회)
 
+		읽기 전용 연결 풀의 연결을 사용하므로, 여러 조회가 서로 및 쓰기 워커와 병렬로 수행됩니다.
+
 		Args:
 			sql: 실행할 SQL 문
+			parameters: SQL 파라미터
 
 		Yields:
 			sqlite3.Cursor: 쿼리 결과 커서
@@ -400,12 +1874,12 @@ class SqliteReplicationManager:
 		if (self._main_conn == None):
 			raise Exception('Main db not connected.')
 
+		generation, conn = self._acquire_read_connection()
 		cursor = None
 
 		try:
-			with self._lock:
-				cursor = self._main_conn.execute(sql)
-				yield cursor
+			cursor = conn.execute(sql, parameters)
+			yield cursor
 
 		except Exception as e:
 			self.logger.error(f"Query execution failed: {e}")
@@ -413,6 +1887,26 @@ class SqliteReplicationManager:
 		finally:
 			if cursor:
 				cursor.close()
+			self._release_read_connection(generation, conn)
+
+
+	def register_statement(self, name: str, sql: str):
+		"""
+		이름 있는 SQL 문 등록
+
+		등록된 SQL 문은 같은 문자열 객체로 실행되므로 연결의 SQL 문 캐시에서 다시 파싱하지 않고 재사용됩니다.
+
+		Args:
+			name: SQL 문 이름
+			sql: SQL 문
+
+		Raises:
+			ValueError: 같은 이름으로 다른 SQL 문이 이미 등록된 경우
+		"""
+		registered = self._statements.get(name)
+		if ((registered != None) and (registered != sql)):
+			raise ValueError(f"Statement already registered with different SQL: {name}")
+		self._statements[name] = sql
 
 
 
@@ -5,10 +5,14 @@
 
 # Original Packages
 from abc import ABC, abstractmethod
-from asyncio import Queue, Task, StreamReader, StreamWriter
+from asyncio import Queue, QueueFull, Task, StreamReader, StreamWriter
+from heapq import heappop, heappush
+from itertools import count
 from logging import getLogger, Logger
-from time import time
-from typing import Final, Optional, Dict, Any, Set, Type, Union
+from os import stat
+from random import uniform
+from time import perf_counter, time
+from typing import Callable, Final, Optional, Dict, Any, List, Set, Tuple, Type, Union
 from uuid import uuid4, UUID
 
 import asyncio
@@ -28,6 +32,9 @@ if (not project_folder in sys_path):
 
 # User's Package
 from lib.base_parser import BaseParser
+from lib.packet_dispatcher import PacketDispatcher, PacketDispatcherDef
+from lib.tls_tcp6_logging import ConnectionLoggerAdapter, TlsTcp6LoggingDef
+from lib.tls_tcp6_metrics import TlsTcp6Hooks
 
 
 
@@ -38,13 +45,178 @@ class TlsTcp6Def:
 	LOGGER_LEVEL: Final			= 20 # logging.INFO
 	LOGGER_NAME: Final			= 'tls_tcp6'
 	IDLE_TIMEOUT: Final			= 60
+	KEEPALIVE_INTERVAL: Final	= 0 # 유휴 시간이 이 값을 넘으면 ping 송신 (0: 사용 안 함)
+	KEEPALIVE_PING: Final		= b'PING'
+	KEEPALIVE_PONG: Final		= b'PONG'
 	PORT: Final					= 15118
+	RECONNECT_MIN_DELAY: Final	= 0.5 # 재연결 대기 시간 최솟값 (초)
+	RECONNECT_MAX_DELAY: Final	= 30.0 # 재연결 대기 시간 최댓값 (초)
+	TLS_TICKETS: Final			= 2 # 서버가 연결마다 발급하는 TLS 1.3 세션 티켓 수
+	TX_MAX_BATCH: Final			= 64 # 한 번에 모아 송신할 최대 메시지 수
+	TX_LINGER: Final			= 0.0 # 메시지를 더 모으기 위해 대기하는 최대 시간 (초)
+	TX_HIGH_WATER: Final		= 1024 * 1024 # 송신 대기 바이트가 이 값 이상이면 send()가 대기
+	TX_LOW_WATER: Final			= 256 * 1024 # 송신 대기 바이트가 이 값 이하로 내려가면 send() 대기 해제
 
 
 
 class TlsTcp6Key:
 	SOCKET_CLASS: Final			= 'socket_class'
 	IDLE_TIMEOUT: Final			= 'idle_timeout'
+	KEEPALIVE_INTERVAL: Final	= 'keepalive_interval'
+	KEEPALIVE_PING: Final		= 'keepalive_ping'
+	KEEPALIVE_PONG: Final		= 'keepalive_pong'
+	DIRECT_PARSE: Final			= 'direct_parse'
+	TX_MAX_BATCH: Final			= 'tx_max_batch'
+	TX_LINGER: Final			= 'tx_linger'
+	TX_HIGH_WATER: Final		= 'tx_high_water'
+	TX_LOW_WATER: Final			= 'tx_low_water'
+	REUSE_PORT: Final			= 'reuse_port'
+	RECONNECT_MIN_DELAY: Final	= 'reconnect_min_delay'
+	RECONNECT_MAX_DELAY: Final	= 'reconnect_max_delay'
+	TLS_TICKETS: Final			= 'tls_tickets'
+	HOOKS: Final				= 'hooks'
+	LOG_PACKET_SAMPLE: Final	= 'log_packet_sample'
+	DISPATCH: Final				= 'dispatch'
+	DISPATCH_CONCURRENCY: Final	= 'dispatch_concurrency'
+	DISPATCH_LANE_SIZE: Final	= 'dispatch_lane_size'
+	PACKET_HANDLER: Final		= 'packet_handler'
+	PACKET_ROUTER: Final		= 'packet_router'
+
+
+
+class TlsSessionContext(ssl.SSLContext):
+	"""접속한 호스트별 TLS 세션을 보관하고, 다음 연결 시 세션을 재사용(resumption)하는 클라이언트용 SSLContext입니다.<br />
+	asyncio는 wrap_bio()에 session을 전달하지 않으므로, wrap_bio()에서 server_hostname으로 보관된 세션을 찾아 넣습니다.
+	"""
+	def __init__(self, protocol: int = ssl.PROTOCOL_TLS_CLIENT):
+		super().__init__() # 프로토콜은 ssl.SSLContext.__new__()에서 설정됨
+		self.sessions: Dict[str, ssl.SSLSession] = {} # server_hostname -> 최근 세션
+
+
+	def wrap_bio(self, incoming, outgoing, server_side=False, server_hostname=None, session=None):
+		if ((session == None) and (server_hostname != None)):
+			session = self.sessions.get(server_hostname)
+		return super().wrap_bio(incoming, outgoing, server_side=server_side, server_hostname=server_hostname, session=session)
+
+
+
+class _AcceptTimedStreamReader(StreamReader):
+	"""서버가 TCP 연결을 수락한 시각(TLS 핸드셰이크 전)을 기록하는 StreamReader입니다. (서버 핸드셰이크 시간 측정용)"""
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.accepted_time: float = perf_counter()
+
+
+
+class TlsTcp6Protocol(asyncio.BufferedProtocol):
+	"""
+	direct_parse 모드에서 사용하는 프로토콜 클래스입니다.<br />
+	수신 데이터를 이벤트 루프의 수신 버퍼(get_buffer/buffer_updated)에서 바로 소켓의 파서로 전달하여
+	수신 큐와 파서 태스크를 거치지 않습니다.<br />
+	송신은 StreamWriter와 같은 인터페이스(write, drain, close, wait_closed)를 제공하므로 소켓의 _tx_stream으로 사용합니다.
+	"""
+	def __init__(self, on_connected: Callable[['TlsTcp6Protocol'], Optional['TlsTcp6Socket']], buffer_size: int=TlsTcp6Def.BUFFER_SIZE):
+		"""TlsTcp6Protocol 클래스의 생성자입니다.
+
+		Args:
+			on_connected: 연결되었을 때 호출되어 수신 데이터를 처리할 소켓 객체를 반환하는 함수입니다. (None이면 연결 종료)
+			buffer_size: 수신 버퍼 크기입니다.
+		"""
+		self._on_connected = on_connected
+		self._buffer = bytearray(buffer_size)
+		self._view = memoryview(self._buffer)
+		self._transport: Optional[asyncio.Transport] = None
+		self._socket: Optional[TlsTcp6Socket] = None
+		self._paused = False
+		self._drain_waiter: Optional[asyncio.Future] = None
+		self._closed: asyncio.Future = asyncio.get_running_loop().create_future()
+		self.accepted_time: float = perf_counter() # 서버에서는 TCP 연결 수락 시각 (TLS 핸드셰이크 전에 생성됨)
+
+
+	def buffer_updated(self, nbytes: int):
+		if (self._socket != None):
+			self._socket._on_data(self._view[:nbytes])
+
+
+	def connection_lost(self, exc: Optional[Exception]):
+		if (not self._closed.done()):
+			self._closed.set_result(None)
+		if ((self._drain_waiter != None) and (not self._drain_waiter.done())):
+			if (exc == None):
+				self._drain_waiter.set_result(None)
+			else:
+				self._drain_waiter.set_exception(exc)
+		if (self._socket != None):
+			self._socket._on_connection_lost(exc)
+
+
+	def connection_made(self, transport: asyncio.Transport):
+		self._transport = transport
+		self._socket = self._on_connected(self)
+		if (self._socket == None):
+			transport.close()
+
+
+	def get_buffer(self, sizehint: int) -> memoryview:
+		if (sizehint > len(self._buffer)):
+			self._buffer = bytearray(sizehint)
+			self._view = memoryview(self._buffer)
+		return self._view
+
+
+	def pause_writing(self):
+		self._paused = True
+
+
+	def resume_writing(self):
+		self._paused = False
+		if ((self._drain_waiter != None) and (not self._drain_waiter.done())):
+			self._drain_waiter.set_result(None)
+
+
+	def close(self):
+		if ((self._transport != None) and (not self._transport.is_closing())):
+			self._transport.close()
+
+
+	async def drain(self):
+		"""송신 버퍼가 상한을 넘은 경우 하한 아래로 내려갈 때까지 대기합니다."""
+		if (self._closed.done()):
+			raise ConnectionResetError("Connection lost")
+		if (not self._paused):
+			return
+		self._drain_waiter = asyncio.get_running_loop().create_future()
+		await self._drain_waiter
+
+
+	def get_extra_info(self, name: str, default: Any=None) -> Any:
+		return self._transport.get_extra_info(name, default) if (self._transport != None) else default
+
+
+	def is_closing(self) -> bool:
+		return (self._transport == None) or self._transport.is_closing()
+
+
+	def pause_reading(self):
+		if (self._transport != None):
+			self._transport.pause_reading()
+
+
+	def resume_reading(self):
+		if ((self._transport != None) and (not self._transport.is_closing())):
+			self._transport.resume_reading()
+
+
+	async def wait_closed(self):
+		await self._closed
+
+
+	def write(self, data: bytes):
+		self._transport.write(data)
+
+
+	def writelines(self, data: List[bytes]):
+		self._transport.writelines(data)
 
 
 
@@ -53,6 +225,9 @@ class TlsTcp6Socket:
 	TLS 기반 IPv6 TCP 통신을 위한 공통 기능을 제공하는 부모 클래스입니다.<br />
 	서버와 클라이언트 클래스가 이 클래스를 상속받습니다.
 	"""
+	# (서버 여부, 설정, 인증서/키/CA 파일 경로와 수정 시각) -> SSLContext
+	_ssl_context_cache: Dict[Tuple, ssl.SSLContext] = {}
+
 	def __init__(self,
 					cert_file: str,
 					key_file: str,
@@ -76,6 +251,14 @@ class TlsTcp6Socket:
 				- rx_stream (StreamReader): (서버용) 연결된 클라이언트의 StreamReader.
 				- tx_stream (StreamWriter): (서버용) 연결된 클라이언트의 StreamWriter.
 				- server (TlsTcp6Server): (서버용) 서버 객체 참조.
+				- direct_parse (bool): 수신 큐와 파서 태스크 없이 수신 콜백에서 바로 파싱할지 여부 (TlsTcp6Protocol 사용).
+				- tx_max_batch (int): 송신 큐에서 한 번에 모아 writelines()로 송신할 최대 메시지 수.
+				- tx_linger (float): 메시지를 더 모으기 위해 대기하는 최대 시간 (초).
+				- tx_high_water (int): 송신 대기 바이트가 이 값 이상이면 send()가 대기합니다.
+				- tx_low_water (int): 송신 대기 바이트가 이 값 이하로 내려가면 send() 대기를 해제합니다.
+				- tls_tickets (int): (서버용) 연결마다 발급하는 TLS 1.3 세션 티켓 수 (0: 세션 재사용 안 함).
+				- hooks (TlsTcp6Hooks): 계측/추적 훅 (예: MetricsHooks). None이면 호출하지 않습니다.
+				- log_packet_sample (int): N개의 패킷마다 1개를 DEBUG 레벨로 기록합니다. (0: 기록 안 함)
 		"""
 		self.host = host
 		self.port = port
@@ -96,10 +279,36 @@ class TlsTcp6Socket:
 		self._parser: Optional[BaseParser] = None
 
 		self._rx_stream: Optional[StreamReader] = kwargs.get('rx_stream')
-		self._tx_stream: Optional[StreamWriter] = kwargs.get('tx_stream')
+		self._tx_stream: Optional[Union[StreamWriter, TlsTcp6Protocol]] = kwargs.get('tx_stream')
+		self._direct_parse: bool = kwargs.get(TlsTcp6Key.DIRECT_PARSE, False)
+		self._close_task: Optional[Task] = None
+
+		# 송신 배치 및 흐름 제어
+		self._tx_max_batch: int = max(1, kwargs.get(TlsTcp6Key.TX_MAX_BATCH, TlsTcp6Def.TX_MAX_BATCH))
+		self._tx_linger: float = kwargs.get(TlsTcp6Key.TX_LINGER, TlsTcp6Def.TX_LINGER)
+		self._tx_high_water: int = kwargs.get(TlsTcp6Key.TX_HIGH_WATER, TlsTcp6Def.TX_HIGH_WATER)
+		self._tx_low_water: int = min(kwargs.get(TlsTcp6Key.TX_LOW_WATER, TlsTcp6Def.TX_LOW_WATER), self._tx_high_water)
+		self._tx_pending_bytes: int = 0
+		self._tx_writable = asyncio.Event()
+		self._tx_writable.set()
+		self._tx_stats: Dict[str, int] = {
+			'flush_count': 0,
+			'bytes': 0,
+			'records': 0,
+			'max_bytes_per_flush': 0,
+			'max_records_per_flush': 0,
+			'send_wait_count': 0,
+		}
 
 		self._connected_time: float = 0.0
 		self._last_received_time: float = 0.0
+		self._last_ping_time: float = 0.0
+		self._idle_timeout: float = kwargs.get(TlsTcp6Key.IDLE_TIMEOUT, TlsTcp6Def.IDLE_TIMEOUT) # (서버용) 0: 유휴 종료 안 함
+		self._timer_seq: int = -1 # (서버용) 서버 타이머 힙에서 유효한 항목의 순번
+		self._tls_tickets: int = kwargs.get(TlsTcp6Key.TLS_TICKETS, TlsTcp6Def.TLS_TICKETS)
+		self._closed_event = asyncio.Event()
+		self._hooks: Optional[TlsTcp6Hooks] = kwargs.get(TlsTcp6Key.HOOKS)
+		self._log_packet_sample: int = kwargs.get(TlsTcp6Key.LOG_PACKET_SAMPLE, TlsTcp6LoggingDef.PACKET_SAMPLE)
 
 		self._tasks: Set[Task] = set()
 		self._is_closing: bool = False
@@ -110,28 +319,44 @@ class TlsTcp6Socket:
 	def _init_socket(self):
 		"""소켓 관련 내부 변수를 초기화합니다."""
 		self.uuid = uuid4()
-		self.logger.name = f"{self.logger.name}.{self.uuid}"
+		# 공유 로거의 이름을 바꾸지 않고 연결별 어댑터로 uuid를 붙임
+		self.logger = ConnectionLoggerAdapter(getLogger(self.logger.name), self.uuid, packet_sample=self._log_packet_sample)
 
 		if (self.packet_queue is None):
 			self.packet_queue = Queue()
 			self.logger.info("패킷 큐가 내부적으로 생성되었습니다.")
 
+		self._create_parser()
+
+
+	def _create_parser(self):
+		"""수신 데이터 큐와 패킷 큐를 사용하는 파서 객체를 생성합니다."""
 		self._parser = self._parser_class(
 			parser_uuid=self.uuid,
 			data_queue=self._rx_queue,
 			packet_queue=self.packet_queue
 		)
+		if (self._hooks != None):
+			self._parser.observer = self._on_parsed
 		self.logger.info(f"'{self._parser.__class__.__name__}' 파서 객체가 생성되었습니다.")
 
 
 	def _create_ssl_context(self) -> ssl.SSLContext:
-		"""상호 인증을 위한 SSLContext 객체를 생성하고 반환합니다.
+		"""상호 인증을 위한 SSLContext 객체를 생성하고 반환합니다.<br />
+		서버는 TLS 1.3 세션 티켓을 발급하고, 클라이언트는 받은 세션을 재사용하는 TlsSessionContext를 사용합니다.
 
 		Returns:
 			설정이 완료된 SSLContext 객체.
 		"""
 		purpose = ssl.Purpose.CLIENT_AUTH if self._is_server else ssl.Purpose.SERVER_AUTH
-		context = ssl.create_default_context(purpose=purpose, cafile=self.ca_file)
+		if (self._is_server):
+			context = ssl.create_default_context(purpose=purpose, cafile=self.ca_file)
+			context.num_tickets = self._tls_tickets
+		else:
+			# ssl.create_default_context(Purpose.SERVER_AUTH)와 같은 검증 설정
+			context = TlsSessionContext(ssl.PROTOCOL_TLS_CLIENT)
+			context.load_verify_locations(cafile=self.ca_file)
+			context.check_hostname = getattr(self, 'check_hostname', True)
 		context.load_cert_chain(certfile=self.cert_file, keyfile=self.key_file)
 		context.minimum_version = ssl.TLSVersion.TLSv1_3
 		context.verify_mode = ssl.CERT_REQUIRED
@@ -139,6 +364,92 @@ class TlsTcp6Socket:
 		return context
 
 
+	def _get_ssl_context(self) -> ssl.SSLContext:
+		"""같은 설정과 인증서/키/CA 파일이면 캐시된 SSLContext를 반환합니다.<br />
+		연결마다 인증서 파일을 다시 읽지 않으며, 파일이 바뀌면(수정 시각 변경) 새로 생성합니다.
+		"""
+		files = (self.cert_file, self.key_file, self.ca_file)
+		options = self._tls_tickets if self._is_server else getattr(self, 'check_hostname', True)
+		key = (self._is_server, options) + tuple((file, stat(file).st_mtime_ns) for file in files)
+
+		context = TlsTcp6Socket._ssl_context_cache.get(key)
+		if (context == None):
+			context = TlsTcp6Socket._ssl_context_cache[key] = self._create_ssl_context()
+		return context
+
+
+	@staticmethod
+	def clear_ssl_context_cache():
+		"""캐시된 SSLContext(와 클라이언트가 보관한 TLS 세션)를 모두 제거합니다."""
+		TlsTcp6Socket._ssl_context_cache.clear()
+
+
+	def _attach_protocol(self, protocol: TlsTcp6Protocol) -> 'TlsTcp6Socket':
+		"""direct_parse 모드에서 연결된 프로토콜을 송신 스트림으로 설정합니다."""
+		self._tx_stream = protocol
+		return self
+
+
+	def _on_connection_lost(self, exc: Optional[Exception]):
+		"""direct_parse 모드에서 연결이 끊어졌을 때 호출됩니다."""
+		if (self._is_closing):
+			return
+		if (exc == None):
+			self.logger.warning("연결이 원격 호스트에 의해 종료되었습니다.")
+		else:
+			self.logger.warning(f"연결이 비정상적으로 끊어졌습니다: {exc}")
+		self._close_task = asyncio.create_task(self.close())
+
+
+	def _on_data(self, data: memoryview):
+		"""direct_parse 모드에서 수신된 데이터를 바로 파싱하여 패킷 큐에 넣습니다.<br />
+		process_received_data()를 재정의하지 않았으면 수신 버퍼를 복사 없이 파서에 전달합니다.
+		"""
+		self._last_received_time = time()
+		try:
+			if (type(self).process_received_data is not TlsTcp6Socket.process_received_data):
+				data = self.process_received_data(bytes(data))
+			if (self._hooks == None):
+				packets = self._parser.feed(data)
+			else:
+				self._hooks.on_receive(self, len(data))
+				start_time = perf_counter()
+				packets = self._parser.feed(data)
+				self._hooks.on_parse(self, len(data), len(packets) if packets else 0, perf_counter() - start_time)
+		except Exception as e:
+			self.logger.error(f"수신 데이터 파싱 중 예외 발생: {e}", exc_info=True)
+			self._on_connection_lost(e)
+			return
+
+		if (packets):
+			self._put_packets(packets)
+
+
+	def _on_parsed(self, nbytes: int, npackets: int, seconds: float):
+		"""파서의 계측 콜백을 훅으로 전달합니다. (hooks 지정 시에만 설정됨)"""
+		self._hooks.on_parse(self, nbytes, npackets, seconds)
+
+
+	def _put_packets(self, packets: List[Any]):
+		"""파싱된 패킷들을 패킷 큐에 넣습니다. 큐가 가득 차면 수신을 멈추고 남은 패킷을 비동기로 넣습니다."""
+		for index, packet in enumerate(packets):
+			try:
+				self.packet_queue.put_nowait((self.uuid, packet))
+			except QueueFull:
+				self._tx_stream.pause_reading()
+				task = asyncio.create_task(self._put_packets_later(packets[index:]))
+				self._tasks.add(task)
+				task.add_done_callback(self._tasks.discard)
+				return
+
+
+	async def _put_packets_later(self, packets: List[Any]):
+		"""패킷 큐에 자리가 생길 때까지 기다려 패킷을 넣은 뒤 수신을 재개합니다."""
+		for packet in packets:
+			await self.packet_queue.put((self.uuid, packet))
+		self._tx_stream.resume_reading()
+
+
 	async def _rx_handler(self):
 		"""데이터 수신을 처리하는 코루틴 핸들러입니다.<br />
 		StreamReader로부터 데이터를 읽어 파서의 데이터 큐에 넣습니다.
@@ -159,6 +470,8 @@ class TlsTcp6Socket:
 					break
 
 				self._last_received_time = time()
+				if (self._hooks != None):
+					self._hooks.on_receive(self, len(data))
 				processed_data = self.process_received_data(data)
 				await self._rx_queue.put(processed_data)
 
@@ -189,9 +502,49 @@ class TlsTcp6Socket:
 		return data
 
 
+	async def _collect_tx_batch(self, first: bytes) -> List[bytes]:
+		"""송신 큐에 쌓인 메시지를 최대 tx_max_batch 개까지 모읍니다.<br />
+		tx_linger가 0보다 크면 큐가 비어 있어도 그 시간 동안 메시지를 더 기다립니다.
+		"""
+		batch = [first]
+		deadline = asyncio.get_running_loop().time() + self._tx_linger
+		while (len(batch) < self._tx_max_batch):
+			if (not self._tx_queue.empty()):
+				batch.append(self._tx_queue.get_nowait())
+				continue
+
+			remain = deadline - asyncio.get_running_loop().time()
+			if (remain <= 0):
+				break
+			try:
+				batch.append(await asyncio.wait_for(self._tx_queue.get(), timeout=remain))
+			except asyncio.TimeoutError:
+				break
+		return batch
+
+
+	def _record_tx_flush(self, batch: List[bytes], size: int):
+		"""송신 배치 처리 후 대기 바이트를 줄이고 통계를 기록합니다."""
+		for _ in batch:
+			self._tx_queue.task_done()
+
+		self._tx_pending_bytes -= size
+		if (self._tx_pending_bytes <= self._tx_low_water):
+			self._tx_writable.set()
+
+		stats = self._tx_stats
+		stats['flush_count'] += 1
+		stats['bytes'] += size
+		stats['records'] += len(batch)
+		stats['max_bytes_per_flush'] = max(stats['max_bytes_per_flush'], size)
+		stats['max_records_per_flush'] = max(stats['max_records_per_flush'], len(batch))
+		if (self._hooks != None):
+			self._hooks.on_send(self, size, len(batch))
+
+
 	async def _tx_handler(self):
 		"""데이터 송신을 처리하는 코루틴 핸들러입니다.<br />
-		송신 큐(_tx_queue)에서 데이터를 가져와 StreamWriter로 전송합니다.
+		송신 큐(_tx_queue)에 쌓인 메시지를 모아 writelines()로 한 번에 전송하고 drain()은 한 번만 기다립니다.
 		"""
 		if not self._tx_stream:
 			self.logger.error("TX 핸들러: StreamWriter가 설정되지 않았습니다.")
@@ -200,12 +553,13 @@ class TlsTcp6Socket:
 		self.logger.info("송신 핸들러가 시작되었습니다.")
 		while not self._is_closing:
 			try:
-				data: bytes = await self._tx_queue.get()
+				batch = await self._collect_tx_batch(await self._tx_queue.get())
+				size = sum(len(data) for data in batch)
 				try:
-					self._tx_stream.write(data)
+					self._tx_stream.writelines(batch)
 					await self._tx_stream.drain()
 				finally:
-					self._tx_queue.task_done()
+					self._record_tx_flush(batch, size)
 			except asyncio.CancelledError:
 				self.logger.info("송신 핸들러가 취소되었습니다.")
 				break
@@ -216,6 +570,21 @@ class TlsTcp6Socket:
 		await self.close()
 
 
+	def get_tx_stats(self) -> Dict[str, Union[int, float]]:
+		"""송신 배치 통계를 반환합니다.
+
+		Returns:
+			송신 횟수(flush_count), 송신 바이트/메시지 수, 송신 1회당 평균/최대 바이트 및 메시지 수,
+			현재 송신 대기 바이트(pending_bytes), send() 대기 횟수(send_wait_count)
+		"""
+		stats: Dict[str, Union[int, float]] = dict(self._tx_stats)
+		flush_count = stats['flush_count']
+		stats['bytes_per_flush'] = (stats['bytes'] / flush_count) if flush_count else 0.0
+		stats['records_per_flush'] = (stats['records'] / flush_count) if flush_count else 0.0
+		stats['pending_bytes'] = self._tx_pending_bytes
+		return stats
+
+
 	async def send(self, data: bytes):
 		"""외부에서 데이터를 송신할 때 사용하는 공개 메소드입니다.<br />
 		내부 송신 큐에 데이터를 추가합니다.
@@ -226,11 +595,26 @@ class TlsTcp6Socket:
 		if self._is_closing:
 			self.logger.warning("연결이 종료되는 중이므로 데이터를 전송할 수 없습니다.")
 			return
+
+		# 송신 대기 바이트가 상한을 넘었으면 하한 아래로 내려갈 때까지 대기
+		if (not self._tx_writable.is_set()):
+			self._tx_stats['send_wait_count'] += 1
+			await self._tx_writable.wait()
+			if self._is_closing:
+				return
+
+		self._tx_pending_bytes += len(data)
+		if (self._tx_pending_bytes >= self._tx_high_water):
+			self._tx_writable.clear()
 		await self._tx_queue.put(data)
 
 
 	async def _start_handlers(self):
 		"""내부 핸들러 및 파서 태스크를 시작합니다."""
+		if (self._direct_parse):
+			self._start_direct_handlers()
+			return
+
 		if self._parser:
 			self._parser.start()
 
@@ -238,6 +622,19 @@ class TlsTcp6Socket:
 		tx_task = asyncio.create_task(self._tx_handler())
 		self._tasks.add(rx_task)
 		self._tasks.add(tx_task)
+		if (self._hooks != None):
+			self._hooks.on_connect(self)
+
+
+	def _start_direct_handlers(self):
+		"""direct_parse 모드: 수신은 프로토콜 콜백에서 처리하므로 송신 핸들러만 시작합니다."""
+		self._connected_time = time()
+		self._last_received_time = self._connected_time
+
+		tx_task = asyncio.create_task(self._tx_handler())
+		self._tasks.add(tx_task)
+		if (self._hooks != None):
+			self._hooks.on_connect(self)
 
 
 	async def close(self):
@@ -245,6 +642,7 @@ class TlsTcp6Socket:
 		if self._is_closing:
 			return
 		self._is_closing = True
+		self._tx_writable.set() # send()에서 대기 중인 호출 해제
 
 		self.logger.info(f"{self.uuid} 연결 종료를 시작합니다.")
 
@@ -273,6 +671,10 @@ class TlsTcp6Socket:
 		if (self.server and (self.uuid in self.server._clients)):
 			self.server.remove_client(self.uuid)
 
+		if (self._hooks != None):
+			self._hooks.on_disconnect(self)
+		self._closed_event.set()
+
 		self.logger.info(f"{self.uuid} 연결이 완전히 종료되었습니다.")
 
 
@@ -289,18 +691,62 @@ class TlsTcp6Server(TlsTcp6Socket):
 			args: 부모 클래스에 전달될 위치 인자입니다.
 			kwargs: 부모 클래스에 전달될 키워드 인자입니다.
 				- socket_class (Type[TlsTcp6Socket]): 클라이언트 연결 시 생성할 소켓 클래스.
-				- idle_timeout (int): 클라이언트 유휴 상태 타임아웃 (초).
+				- idle_timeout (int): 클라이언트 유휴 상태 타임아웃 (초). (클라이언트별 변경: set_idle_timeout())
+				- keepalive_interval (float): 유휴 시간이 이 값을 넘으면 클라이언트에게 ping을 송신합니다. (0: 사용 안 함)
+				- keepalive_ping (bytes): keepalive ping 데이터. 파서의 build_keepalive()로 프레임을 만들어 송신합니다.
+				- keepalive_pong (bytes): keepalive pong 데이터. handle_packet()은 이 패킷을 처리하지 않고 버립니다.
+				- tls_tickets (int): 연결마다 발급하는 TLS 1.3 세션 티켓 수. (세션 티켓 키는 프로세스별이므로 다중 프로세스에서는 같은 작업 프로세스로 재연결해야 재사용됨)
+				- direct_parse (bool): 클라이언트 연결을 TlsTcp6Protocol로 받아 수신 콜백에서 바로 파싱할지 여부.
+				- reuse_port (bool): SO_REUSEPORT로 바인딩하여 여러 프로세스가 같은 포트를 공유할지 여부.
+				- dispatch (bool): 하나의 패킷 큐 대신 PacketDispatcher로 클라이언트별 순서를 보장하며 병렬 처리할지 여부.
+				- dispatch_concurrency (int): (dispatch) 동시에 처리하는 클라이언트(레인) 수.
+				- dispatch_lane_size (int): (dispatch) 클라이언트별 최대 대기 패킷 수 (0: 무제한).
+				- packet_handler (Callable): (dispatch) 패킷 처리 함수 (uuid, packet) -> 응답. 일반 함수이면 스레드 풀에서 실행됩니다.
+					(기본: handle_packet(), 응답이 None이 아니면 해당 클라이언트로 송신)
+				- packet_router (Callable): (dispatch) 패킷의 처리 순서 단위(레인) 키를 정하는 함수 (uuid, packet) -> 키. (기본: uuid)
 		"""
 		super().__init__(*args, **kwargs)
 
 		self._socket_class: Type[TlsTcp6Socket] = kwargs.get(TlsTcp6Key.SOCKET_CLASS, TlsTcp6Socket)
 		self._idle_timeout: int = kwargs.get(TlsTcp6Key.IDLE_TIMEOUT, TlsTcp6Def.IDLE_TIMEOUT)
+		self._keepalive_interval: float = kwargs.get(TlsTcp6Key.KEEPALIVE_INTERVAL, TlsTcp6Def.KEEPALIVE_INTERVAL)
+		self._keepalive_ping: bytes = kwargs.get(TlsTcp6Key.KEEPALIVE_PING, TlsTcp6Def.KEEPALIVE_PING)
+		self._keepalive_pong: bytes = kwargs.get(TlsTcp6Key.KEEPALIVE_PONG, TlsTcp6Def.KEEPALIVE_PONG)
+		self._socket_kwargs: Dict[str, Any] = {
+			TlsTcp6Key.IDLE_TIMEOUT: self._idle_timeout,
+			TlsTcp6Key.HOOKS: self._hooks,
+			TlsTcp6Key.LOG_PACKET_SAMPLE: self._log_packet_sample,
+			TlsTcp6Key.DIRECT_PARSE: self._direct_parse,
+			TlsTcp6Key.TX_MAX_BATCH: self._tx_max_batch,
+			TlsTcp6Key.TX_LINGER: self._tx_linger,
+			TlsTcp6Key.TX_HIGH_WATER: self._tx_high_water,
+			TlsTcp6Key.TX_LOW_WATER: self._tx_low_water,
+		}
+		self._reuse_port: bool = kwargs.get(TlsTcp6Key.REUSE_PORT, False)
+		self._accepted_count: int = 0
+		self._resumed_count: int = 0 # TLS 세션을 재사용한 연결 수
+
+		self._dispatcher: Optional[PacketDispatcher] = None
+		if (kwargs.get(TlsTcp6Key.DISPATCH, False)):
+			self._dispatcher = PacketDispatcher(
+				handler=kwargs.get(TlsTcp6Key.PACKET_HANDLER) or self.handle_packet,
+				on_result=self._send_result,
+				router=kwargs.get(TlsTcp6Key.PACKET_ROUTER),
+				concurrency=kwargs.get(TlsTcp6Key.DISPATCH_CONCURRENCY, PacketDispatcherDef.CONCURRENCY),
+				lane_max_size=kwargs.get(TlsTcp6Key.DISPATCH_LANE_SIZE, PacketDispatcherDef.LANE_MAX_SIZE),
+				logger_name=f'{TlsTcp6Def.LOGGER_NAME}.dispatcher'
+			)
 
 		self._clients: Dict[UUID, TlsTcp6Socket] = {}
 		self._server_task: Optional[asyncio.Server] = None
 		self._packet_handler_task: Optional[Task] = None
 		self._reaper_task: Optional[Task] = None
 
+		# 유휴 연결 타이머: (만료 시각, 순번, uuid) 최소 힙. 수신 시마다 갱신하지 않고 만료 시점에 실제 마지막 수신 시각으로 다시 계산
+		self._timer_heap: List[Tuple[float, int, UUID]] = []
+		self._timer_counter = count()
+		self._timer_wakeup = asyncio.Event()
+
 		self.logger.info("서버가 초기화되었습니다.")
 
 
@@ -312,6 +758,60 @@ class TlsTcp6Server(TlsTcp6Socket):
 		self._is_server = True
 
 
+	def _count_accepted(self, stream: Union[StreamWriter, TlsTcp6Protocol]):
+		"""연결 수와 TLS 세션 재사용 연결 수를 기록합니다."""
+		self._accepted_count += 1
+		ssl_object = stream.get_extra_info('ssl_object')
+		if ((ssl_object != None) and ssl_object.session_reused):
+			self._resumed_count += 1
+
+
+	def _create_client_socket(self, **kwargs) -> TlsTcp6Socket:
+		"""연결된 클라이언트의 소켓 객체를 생성하고 관리 목록에 추가합니다."""
+		client_socket = self._socket_class(
+			cert_file=self.cert_file,
+			key_file=self.key_file,
+			ca_file=self.ca_file,
+			host=self.host,
+			port=self.port,
+			logger_name=TlsTcp6Def.LOGGER_NAME,
+			packet_queue=self._dispatcher or self.packet_queue,
+			parser_class=self._parser_class,
+			server=self, # 자기 자신을 서버로 참조
+			**self._socket_kwargs,
+			**kwargs
+		)
+		self._clients[client_socket.uuid] = client_socket
+		client_socket._last_received_time = time()
+		self._schedule_timer(client_socket)
+		return client_socket
+
+
+	def _direct_accept_handler(self, protocol: TlsTcp6Protocol) -> Optional[TlsTcp6Socket]:
+		"""
+		direct_parse 모드에서 새로운 클라이언트가 연결되었을 때 호출되는 콜백 메소드입니다.
+
+		Args:
+			protocol: 연결된 클라이언트의 프로토콜 객체입니다.
+
+		Returns:
+			수신 데이터를 처리할 클라이언트 소켓 객체입니다. (생성 실패 시 None)
+		"""
+		self.logger.info(f"새로운 클라이언트 연결됨: {protocol.get_extra_info('peername')}")
+
+		try:
+			self._count_accepted(protocol)
+			client_socket = self._create_client_socket(tx_stream=protocol)
+			client_socket._start_direct_handlers()
+			self._observe_handshake(client_socket, protocol.accepted_time)
+			self.logger.info(f"클라이언트 {client_socket.uuid} 핸들러 시작됨. 현재 클라이언트 수: {len(self._clients)}")
+			return client_socket
+
+		except Exception as e:
+			self.logger.error(f"클라이언트 소켓 생성 중 오류 발생: {e}", exc_info=True)
+			return None
+
+
 	async def _accept_handler(self, reader: StreamReader, writer: StreamWriter):
 		"""
 		새로운 클라이언트가 연결되었을 때 호출되는 콜백 메소드입니다.<br />
@@ -325,22 +825,10 @@ class TlsTcp6Server(TlsTcp6Socket):
 		self.logger.info(f"새로운 클라이언트 연결됨: {peer_info}")
 
 		try:
-			client_socket = self._socket_class(
-				cert_file=self.cert_file,
-				key_file=self.key_file,
-				ca_file=self.ca_file,
-				host=self.host,
-				port=self.port,
-				logger_name=TlsTcp6Def.LOGGER_NAME,
-				packet_queue=self.packet_queue,
-				parser_class=self._parser_class,
-				rx_stream=reader,
-				tx_stream=writer,
-				server=self, # 자기 자신을 서버로 참조
-			)
-
-			self._clients[client_socket.uuid] = client_socket
+			self._count_accepted(writer)
+			client_socket = self._create_client_socket(rx_stream=reader, tx_stream=writer)
 			await client_socket._start_handlers()
+			self._observe_handshake(client_socket, getattr(reader, 'accepted_time', None))
 			self.logger.info(f"클라이언트 {client_socket.uuid} 핸들러 시작됨. 현재 클라이언트 수: {len(self._clients)}")
 
 		except Exception as e:
@@ -349,27 +837,19 @@ class TlsTcp6Server(TlsTcp6Socket):
 			await writer.wait_closed()
 
 
+	def _observe_handshake(self, client_socket: TlsTcp6Socket, accepted_time: Optional[float]):
+		"""TCP 연결 수락부터 TLS 핸드셰이크를 거쳐 클라이언트 핸들러가 시작될 때까지의 시간을 훅에 전달합니다."""
+		if ((self._hooks != None) and (accepted_time != None)):
+			self._hooks.on_handshake(client_socket, perf_counter() - accepted_time)
+
+
 	async def _packet_handler(self):
-		"""메시지 패킷 큐에서 패킷을 꺼내 처리하는 기본 핸들러입니다.<br />
-		받은 메시지를 로그로 출력하고 클라이언트에게 다시 전송합니다(에코).
-		"""
+		"""메시지 패킷 큐에서 패킷을 꺼내 handle_packet()으로 처리하는 기본 핸들러입니다. (dispatch 모드가 아닐 때)"""
 		self.logger.info("서버 패킷 핸들러가 시작되었습니다.")
 		while True:
 			try:
 				uuid, packet = await self.packet_queue.get()
-				self.logger.info(f"패킷 수신됨 [from: {uuid}]: {packet}")
-
-				# 에코 기능: 해당 클라이언트로 다시 전송
-				if (uuid in self._clients):
-					client_socket = self._clients[uuid]
-					# response_data = str(packet).encode('utf-8')
-					if (type(packet) is str):
-						packet = packet.encode('utf-8')
-					await client_socket.send(packet)
-					self.logger.info(f"패킷 에코됨 [to: {uuid}]")
-				else:
-					self.logger.warning(f"패킷을 보낸 클라이언트({uuid})를 찾을 수 없습니다.")
-
+				await self.handle_packet(uuid, packet)
 				self.packet_queue.task_done()
 			except asyncio.CancelledError:
 				self.logger.info("서버 패킷 핸들러가 취소되었습니다.")
@@ -380,21 +860,37 @@ class TlsTcp6Server(TlsTcp6Socket):
 
 
 	async def _reaper_handler(self):
-		"""일정 시간 이상 데이터 수신이 없는 비활성 클라이언트를 정리하는 핸들러입니다."""
-		self.logger.info(f"클라이언트 연결 관리자(Reaper) 시작. 유휴 제한시간: {self._idle_timeout}초")
+		"""유휴 클라이언트의 keepalive ping 송신과 연결 종료를 처리하는 핸들러입니다.<br />
+		타이머 힙에서 가장 이른 만료 시각까지만 대기하므로, 전체 클라이언트를 주기적으로 훑지 않고 정확한 시각에 처리합니다.
+		"""
+		self.logger.info(f"클라이언트 연결 관리자(Reaper) 시작. 유휴 제한시간: {self._idle_timeout}초, keepalive: {self._keepalive_interval}초")
 		while True:
-			await asyncio.sleep(self._idle_timeout)
 			try:
+				delay = (self._timer_heap[0][0] - time()) if self._timer_heap else None
+				if ((delay == None) or (delay > 0)):
+					self._timer_wakeup.clear()
+					try:
+						await asyncio.wait_for(self._timer_wakeup.wait(), timeout=delay)
+					except asyncio.TimeoutError:
+						pass
+					continue
+
+				_, seq, uuid = heappop(self._timer_heap)
+				client = self._clients.get(uuid)
+				if ((client == None) or (client._timer_seq != seq) or client._is_closing):
+					continue # 제거되었거나 다시 예약된 항목
+
 				now = time()
-				# To avoid "dictionary changed size during iteration"
-				idle_clients = [
-					client for client in self._clients.values()
-					if (now - client._last_received_time) > self._idle_timeout
-				]
+				idle = now - client._last_received_time
+				if ((client._idle_timeout > 0) and (idle >= client._idle_timeout)):
+					self.logger.warning(f"클라이언트 {uuid}가 {client._idle_timeout}초 이상 비활성 상태이므로 연결을 종료합니다.")
+					self._run_task(client.close())
+					continue
 
-				for client in idle_clients:
-					self.logger.warning(f"클라이언트 {client.uuid}가 {self._idle_timeout}초 이상 비활성 상태이므로 연결을 종료합니다.")
-					await client.close()
+				if (self._is_ping_due(client, now)):
+					client._last_ping_time = now
+					self._run_task(client.send(client._parser.build_keepalive(self._keepalive_ping)))
+				self._schedule_timer(client)
 
 			except asyncio.CancelledError:
 				self.logger.info("클라이언트 연결 관리자가 취소되었습니다.")
@@ -403,6 +899,94 @@ class TlsTcp6Server(TlsTcp6Socket):
 				self.logger.error(f"클라이언트 연결 관리자에서 예외 발생: {e}", exc_info=True)
 
 
+	def _is_ping_due(self, client: TlsTcp6Socket, now: float) -> bool:
+		"""마지막 수신 이후 아직 ping을 보내지 않았고 keepalive 간격이 지났으면 True"""
+		return ((self._keepalive_interval > 0)
+				and (client._last_ping_time < client._last_received_time)
+				and ((now - client._last_received_time) >= self._keepalive_interval))
+
+
+	def _run_task(self, coro):
+		"""reaper가 대기하지 않도록 코루틴을 별도 태스크로 실행합니다."""
+		task = asyncio.create_task(coro)
+		self._tasks.add(task)
+		task.add_done_callback(self._tasks.discard)
+
+
+	def _schedule_timer(self, client: TlsTcp6Socket):
+		"""클라이언트의 다음 만료 시각(keepalive ping 또는 유휴 종료)을 타이머 힙에 넣습니다. 이전 항목은 무효화됩니다."""
+		deadlines = []
+		if (client._idle_timeout > 0):
+			deadlines.append(client._last_received_time + client._idle_timeout)
+		if ((self._keepalive_interval > 0) and (client._last_ping_time < client._last_received_time)):
+			deadlines.append(client._last_received_time + self._keepalive_interval)
+		if (not deadlines):
+			client._timer_seq = -1
+			return
+
+		deadline = min(deadlines)
+		client._timer_seq = next(self._timer_counter)
+		if ((not self._timer_heap) or (deadline < self._timer_heap[0][0])):
+			self._timer_wakeup.set() # 더 이른 만료 시각이므로 reaper를 깨움
+		heappush(self._timer_heap, (deadline, client._timer_seq, client.uuid))
+
+
+	def _is_keepalive_pong(self, packet: Any) -> bool:
+		"""keepalive pong 패킷인지 확인합니다. (str 패킷은 UTF-8로 변환하여 비교)"""
+		return ((self._keepalive_interval > 0) and self._parser.is_keepalive(packet, self._keepalive_pong))
+
+
+	def get_stats(self) -> Dict[str, Any]:
+		"""서버의 연결 및 송신 통계를 반환합니다.
+
+		Returns:
+			현재 클라이언트 수(clients), 누적 연결 수(accepted), TLS 세션 재사용 연결 수(tls_resumed), 클라이언트 송신 통계 합계(tx_bytes, tx_records, tx_flush_count),
+			전체 대기 패킷 수(queue_size), (dispatch) 클라이언트별 대기 패킷 수(queue_depth: {str(uuid 또는 레인 키): 개수}),
+			(dispatch) 처리 패킷 수(dispatched), 처리 예외 수(dispatch_errors)
+		"""
+		stats = {'clients': len(self._clients), 'accepted': self._accepted_count, 'tls_resumed': self._resumed_count,
+				'timers': len(self._timer_heap),
+				'tx_bytes': 0, 'tx_records': 0, 'tx_flush_count': 0}
+		for client in self._clients.values():
+			tx_stats = client.get_tx_stats()
+			stats['tx_bytes'] += tx_stats['bytes']
+			stats['tx_records'] += tx_stats['records']
+			stats['tx_flush_count'] += tx_stats['flush_count']
+
+		if (self._dispatcher != None):
+			dispatch_stats = self._dispatcher.get_stats()
+			stats['queue_size'] = dispatch_stats['queue_size']
+			stats['queue_depth'] = dispatch_stats['queue_depth']
+			stats['dispatched'] = dispatch_stats['dispatched']
+			stats['dispatch_errors'] = dispatch_stats['errors']
+		else:
+			stats['queue_size'] = self.packet_queue.qsize() # 모든 클라이언트가 하나의 큐를 공유하므로 클라이언트별 구분 없음
+			stats['queue_depth'] = {}
+		return stats
+
+
+	async def handle_packet(self, uuid: UUID, packet: Any) -> None:
+		"""수신한 패킷을 처리하는 기본 메소드입니다. 받은 메시지를 로그로 출력하고 클라이언트에게 다시 전송합니다(에코).<br />
+		하위 클래스에서 재정의하여 패킷 처리 방식을 바꿀 수 있습니다.
+
+		Args:
+			uuid: 패킷을 보낸 클라이언트의 UUID입니다.
+			packet: 파서가 만든 패킷입니다.
+		"""
+		if (self._is_keepalive_pong(packet)):
+			return
+
+		# 에코 기능: 해당 클라이언트로 다시 전송 (패킷 기록은 샘플링하여 DEBUG 레벨로만 기록)
+		client_socket = self._clients.get(uuid)
+		if (client_socket != None):
+			client_socket.logger.packet('echo', packet)
+			if (type(packet) is str):
+				packet = packet.encode('utf-8')
+			await client_socket.send(packet)
+		else:
+			self.logger.warning("패킷을 보낸 클라이언트(%s)를 찾을 수 없습니다.", uuid)
+
+
 	def remove_client(self, uuid: UUID):
 		"""클라이언트 관리 목록에서 특정 클라이언트를 제거합니다.
 
@@ -411,24 +995,42 @@ class TlsTcp6Server(TlsTcp6Socket):
 		"""
 		if uuid in self._clients:
 			del self._clients[uuid]
+			if ((self._dispatcher != None) and (self._dispatcher.router == None)):
+				self._dispatcher.remove(uuid)
 			self.logger.info(f"클라이언트 {uuid}가 목록에서 제거되었습니다. 현재 클라이언트 수: {len(self._clients)}")
 
 
 	async def start(self):
 		"""서버를 시작합니다."""
-		ssl_context = self._create_ssl_context()
-		self._server_task = await asyncio.start_server(
-			self._accept_handler,
-			self.host,
-			self.port,
-			ssl=ssl_context,
-			family=socket.AF_INET6
-		)
+		ssl_context = self._get_ssl_context()
+		if (self._direct_parse):
+			self._server_task = await asyncio.get_running_loop().create_server(
+				lambda: TlsTcp6Protocol(self._direct_accept_handler),
+				self.host,
+				self.port,
+				ssl=ssl_context,
+				family=socket.AF_INET6,
+				reuse_port=self._reuse_port
+			)
+		else:
+			# asyncio.start_server()와 같지만, 핸드셰이크 시간 측정을 위해 TCP 연결 수락 시각을 기록하는 StreamReader 사용
+			loop = asyncio.get_running_loop()
+			self._server_task = await loop.create_server(
+				lambda: asyncio.StreamReaderProtocol(_AcceptTimedStreamReader(loop=loop), self._accept_handler, loop=loop),
+				self.host,
+				self.port,
+				ssl=ssl_context,
+				family=socket.AF_INET6,
+				reuse_port=self._reuse_port
+			)
 
 		addr = self._server_task.sockets[0].getsockname()
 		self.logger.info(f"서버가 [{addr[0]}]:{addr[1]} 에서 실행 중입니다...")
 
-		self._packet_handler_task = asyncio.create_task(self._packet_handler())
+		if (self._dispatcher != None):
+			self._dispatcher.start()
+		else:
+			self._packet_handler_task = asyncio.create_task(self._packet_handler())
 		self._reaper_task = asyncio.create_task(self._reaper_handler())
 
 		try:
@@ -437,6 +1039,42 @@ class TlsTcp6Server(TlsTcp6Socket):
 			self.logger.warning(f"서버가 취소되었습니다.")
 
 
+	async def _send_result(self, uuid: UUID, data: Union[bytes, str]):
+		"""(dispatch) packet_handler가 반환한 응답을 해당 클라이언트로 송신합니다."""
+		client_socket = self._clients.get(uuid)
+		if (client_socket == None):
+			self.logger.warning(f"응답을 보낼 클라이언트({uuid})를 찾을 수 없습니다.")
+			return
+		if (type(data) is str):
+			data = data.encode('utf-8')
+		await client_socket.send(data)
+
+
+	def set_idle_timeout(self, uuid: UUID, timeout: float) -> bool:
+		"""클라이언트별 유휴 종료 시간을 변경합니다.
+
+		Args:
+			uuid: 클라이언트의 UUID입니다.
+			timeout: 유휴 종료 시간 (초)입니다. (0: 유휴 종료 안 함)
+
+		Returns:
+			클라이언트가 있으면 True
+		"""
+		client = self._clients.get(uuid)
+		if (client == None):
+			return False
+		client._idle_timeout = timeout
+		self._schedule_timer(client)
+		return True
+
+
+	async def stop_accepting(self):
+		"""새로운 연결 수락만 중지합니다. 이미 연결된 클라이언트는 유지됩니다. (graceful 종료용)"""
+		if self._server_task:
+			self._server_task.close()
+			self.logger.info("새로운 연결 수락을 중지했습니다.")
+
+
 	async def stop(self):
 		"""서버를 중지하고 모든 리소스를 정리합니다."""
 		self.logger.info("서버 종료를 시작합니다.")
@@ -448,6 +1086,7 @@ class TlsTcp6Server(TlsTcp6Socket):
 
 		# 내부 태스크 종료
 		if self._packet_handler_task: self._packet_handler_task.cancel()
+		if self._dispatcher: await self._dispatcher.stop()
 		if self._reaper_task: self._reaper_task.cancel()
 
 		if self._server_task:
@@ -469,11 +1108,29 @@ class TlsTcp6Client(TlsTcp6Socket):
 			args: 부모 클래스에 전달될 위치 인자입니다.
 			kwargs: 부모 클래스에 전달될 키워드 인자입니다.
 				- check_hostname (bool): 서버 호스트 이름 검증 여부.
+				- reconnect_min_delay (float): (run_forever) 재연결 대기 시간 최솟값 (초).
+				- reconnect_max_delay (float): (run_forever) 재연결 대기 시간 최댓값 (초).
+				- keepalive_ping (bytes): 서버의 keepalive ping 데이터. 수신하면 패킷 큐에 넣지 않고 pong으로 자동 응답합니다. (None: 자동 응답 안 함)
+				- keepalive_pong (bytes): ping에 응답할 keepalive pong 데이터.
 		"""
 		super().__init__(*args, **kwargs)
 
 		self.check_hostname: bool = kwargs.get('check_hostname', True)
+		self._keepalive_ping: Optional[bytes] = kwargs.get(TlsTcp6Key.KEEPALIVE_PING, TlsTcp6Def.KEEPALIVE_PING)
+		self._keepalive_pong: bytes = kwargs.get(TlsTcp6Key.KEEPALIVE_PONG, TlsTcp6Def.KEEPALIVE_PONG)
 		self._packet_handler_task: Optional[Task] = None
+		self._reconnect_min_delay: float = kwargs.get(TlsTcp6Key.RECONNECT_MIN_DELAY, TlsTcp6Def.RECONNECT_MIN_DELAY)
+		self._reconnect_max_delay: float = kwargs.get(TlsTcp6Key.RECONNECT_MAX_DELAY, TlsTcp6Def.RECONNECT_MAX_DELAY)
+		self._is_stopped: bool = False
+		self._connection_stats: Dict[str, float] = {
+			'connect_count': 0,
+			'connect_failures': 0,
+			'reconnect_count': 0,
+			'tls_resumed': 0,
+			'handshake_ms_total': 0.0,
+			'last_handshake_ms': 0.0,
+			'max_handshake_ms': 0.0,
+		}
 		self.logger.info("클라이언트가 초기화되었습니다.")
 
 
@@ -483,6 +1140,68 @@ class TlsTcp6Client(TlsTcp6Socket):
 		self._is_server = False
 
 
+	def _create_parser(self):
+		"""파서 객체를 생성하고 keepalive ping 자동 응답을 설정합니다."""
+		super()._create_parser()
+		self._parser.intercept = self._answer_keepalive
+
+
+	def _answer_keepalive(self, packet: Any) -> bool:
+		"""서버의 keepalive ping이면 pong을 송신하고 True를 반환합니다. (패킷 큐에 넣지 않음)"""
+		if (not self._parser.is_keepalive(packet, self._keepalive_ping)):
+			return False
+		task = asyncio.create_task(self.send(self._parser.build_keepalive(self._keepalive_pong)))
+		self._tasks.add(task)
+		task.add_done_callback(self._tasks.discard)
+		return True
+
+
+	def _reconnect_delay(self, attempt: int) -> float:
+		"""지수 백오프에 jitter를 더한 재연결 대기 시간 (최댓값의 절반 ~ 최댓값 사이에서 무작위)"""
+		delay = min(self._reconnect_max_delay, self._reconnect_min_delay * (2 ** attempt))
+		return uniform(delay / 2, delay)
+
+
+	def _record_handshake(self, elapsed_ms: float):
+		"""연결 소요 시간과 TLS 세션 재사용 여부를 기록합니다."""
+		stats = self._connection_stats
+		stats['connect_count'] += 1
+		stats['handshake_ms_total'] += elapsed_ms
+		stats['last_handshake_ms'] = elapsed_ms
+		stats['max_handshake_ms'] = max(stats['max_handshake_ms'], elapsed_ms)
+
+		ssl_object = self._tx_stream.get_extra_info('ssl_object')
+		if ((ssl_object != None) and ssl_object.session_reused):
+			stats['tls_resumed'] += 1
+		self._save_tls_session()
+		if (self._hooks != None):
+			self._hooks.on_handshake(self, elapsed_ms / 1000.0)
+
+
+	def _reset_connection(self):
+		"""연결 종료 후 다시 연결할 수 있도록 내부 상태를 초기화합니다. (송신 큐에 남은 메시지는 재연결 후 송신)"""
+		self._is_closing = False
+		self._closed_event.clear()
+		self._tasks.clear()
+		self._rx_stream = None
+		self._tx_stream = None
+		self._rx_queue = Queue()
+		self._create_parser()
+
+
+	def _save_tls_session(self):
+		"""재연결 시 재사용할 수 있도록 현재 연결의 TLS 세션을 SSLContext에 보관합니다.<br />
+		TLS 1.3 세션 티켓은 핸드셰이크 이후에 수신되므로 연결 종료 시점에도 다시 보관합니다.
+		"""
+		ssl_object = self._tx_stream.get_extra_info('ssl_object') if self._tx_stream else None
+		if (ssl_object == None):
+			return
+		session = ssl_object.session
+		context = ssl_object.context
+		if ((session != None) and session.has_ticket and isinstance(context, TlsSessionContext)):
+			context.sessions[ssl_object.server_hostname] = session
+
+
 	# async def _packet_handler(self):
 	# 	"""메시지 패킷 큐에서 패킷을 꺼내 처리하는 기본 핸들러입니다.<br />
 	# 	받은 메시지를 로그로 출력합니다.
@@ -501,29 +1220,90 @@ class TlsTcp6Client(TlsTcp6Socket):
 	# 			break
 
 
-	async def start(self):
-		"""서버에 연결하고 통신을 시작합니다."""
-		ssl_context = self._create_ssl_context()
-		ssl_context.check_hostname = self.check_hostname
+	async def close(self):
+		"""TLS 세션을 보관한 뒤 연결을 종료합니다."""
+		if (not self._is_closing):
+			self._save_tls_session()
+		await super().close()
+
+
+	def get_connection_stats(self) -> Dict[str, float]:
+		"""연결 및 TLS 핸드셰이크 통계를 반환합니다.
+
+		Returns:
+			연결 성공/실패 수(connect_count, connect_failures), 재연결 시도 수(reconnect_count),
+			TLS 세션 재사용 연결 수(tls_resumed), 연결(TCP + TLS 핸드셰이크) 소요 시간(last/avg/max_handshake_ms)
+		"""
+		stats = dict(self._connection_stats)
+		stats['avg_handshake_ms'] = (stats['handshake_ms_total'] / stats['connect_count']) if stats['connect_count'] else 0.0
+		return stats
+
+
+	async def run_forever(self):
+		"""서버에 연결하고, 연결이 끊어지면 jitter를 더한 지수 백오프로 다시 연결합니다.<br />
+		stop()을 호출하거나 태스크를 취소하면 종료합니다.
+		"""
+		self._is_stopped = False
+		attempt = 0
+		while (not self._is_stopped):
+			if (self._is_closing):
+				self._reset_connection()
+
+			if (await self.start()):
+				attempt = 0
+				await self._closed_event.wait()
+			if (self._is_stopped):
+				break
+
+			delay = self._reconnect_delay(attempt)
+			attempt += 1
+			self._connection_stats['reconnect_count'] += 1
+			self.logger.warning(f"{delay:.2f}초 후 서버에 다시 연결합니다. (시도: {attempt})")
+			await asyncio.sleep(delay)
+
+
+	async def start(self) -> bool:
+		"""서버에 연결하고 통신을 시작합니다.
+
+		Returns:
+			연결에 성공하면 True
+		"""
+		ssl_context = self._get_ssl_context()
 
 		try:
 			self.logger.info(f"서버 [{self.host}]:{self.port} 에 연결을 시도합니다...")
-			self._rx_stream, self._tx_stream = await asyncio.open_connection(
-				self.host, self.port, ssl=ssl_context, family=socket.AF_INET6
-			)
+			start_time = perf_counter()
+			if (self._direct_parse):
+				await asyncio.get_running_loop().create_connection(
+					lambda: TlsTcp6Protocol(self._attach_protocol),
+					self.host, self.port, ssl=ssl_context, family=socket.AF_INET6
+				)
+			else:
+				self._rx_stream, self._tx_stream = await asyncio.open_connection(
+					self.host, self.port, ssl=ssl_context, family=socket.AF_INET6
+				)
+			self._record_handshake((perf_counter() - start_time) * 1000.0)
 			self.logger.info("서버에 성공적으로 연결되었습니다.")
 
 			# 핸들러 시작
 			await self._start_handlers()
 			# self._packet_handler_task = asyncio.create_task(self._packet_handler())
 			# self._tasks.add(self._packet_handler_task)
+			return True
 
 		except ConnectionRefusedError:
 			self.logger.error("연결이 거부되었습니다. 서버가 실행 중인지 확인하세요.")
-			await self.close()
 		except ssl.SSLError as e:
 			self.logger.error(f"SSL 오류 발생: {e}. 인증서가 올바른지 확인하세요.")
-			await self.close()
 		except Exception as e:
 			self.logger.error(f"연결 중 예외 발생: {e}", exc_info=True)
-			await self.close()
+
+		self._connection_stats['connect_failures'] += 1
+		await self.close()
+		return False
+
+
+	async def stop(self):
+		"""재연결(run_forever)을 멈추고 연결을 종료합니다."""
+		self._is_stopped = True
+		await self.close()
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# tls_tcp6 연결별 로거 어댑터 및 이벤트 루프 밖에서 로그를 기록하는 QueueHandler 기반 로그 기록기
+# made : hbesthee@naver.com
+# date : 2026-10-18
+
+# Original Packages
+from logging import DEBUG, Formatter, Handler, Logger, LoggerAdapter, LogRecord, StreamHandler, getLogger
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+from typing import Any, Dict, Final, Iterable, List, MutableMapping, Optional, Tuple
+
+
+
+
+class TlsTcp6LoggingDef:
+	PACKET_SAMPLE: Final		= 1 # N개의 패킷마다 1개를 DEBUG로 기록 (0: 기록 안 함)
+	PACKET_DUMP_SIZE: Final		= 64 # 패킷 기록 시 최대 바이트(문자) 수
+	QUEUE_MAX_SIZE: Final		= 10000 # 로그 기록기 큐의 최대 레코드 수 (가득 차면 버림)
+	LOG_FORMAT: Final			= '%(asctime)s %(levelname)s %(name)s] %(message)s'
+
+
+
+class ConnectionLoggerAdapter(LoggerAdapter):
+	"""연결별 로거 어댑터입니다.<br />
+	공유 로거의 이름을 바꾸지 않고 메시지 앞에 연결 uuid를 붙이며, 레코드의 conn 속성으로도 uuid를 전달합니다.
+	(예: Formatter('%(conn)s %(message)s')로 구조화된 로그 구성)
+	LoggerAdapter는 로그 레벨을 먼저 검사하므로, %-형식 인자를 사용하면 비활성 레벨의 메시지는 만들지 않습니다.
+	"""
+	def __init__(self, logger: Logger, conn: Any,
+				packet_sample: int = TlsTcp6LoggingDef.PACKET_SAMPLE,
+				packet_dump_size: int = TlsTcp6LoggingDef.PACKET_DUMP_SIZE):
+		"""
+		Args:
+			logger: 공유 로거
+			conn: 연결 식별자 (uuid)
+			packet_sample: N개의 패킷마다 1개를 packet()으로 기록 (0: 기록 안 함)
+			packet_dump_size: 패킷 기록 시 최대 바이트(문자) 수
+		"""
+		super().__init__(logger, {'conn': str(conn)})
+		self._prefix = f'[{conn}] '
+		self.packet_sample = packet_sample
+		self.packet_dump_size = packet_dump_size
+		self._packet_count: int = 0
+
+
+	def packet(self, direction: str, packet: Any):
+		"""패킷을 샘플링하여 DEBUG로 기록합니다. 기록하지 않는 패킷의 비용은 카운터 증가와 비교뿐입니다.
+
+		Args:
+			direction: 방향 (예: 'rx', 'tx', 'echo')
+			packet: 기록할 패킷 (bytes 또는 str, packet_dump_size까지만 기록)
+		"""
+		if (self.packet_sample <= 0):
+			return
+		self._packet_count += 1
+		if (((self._packet_count % self.packet_sample) != 0) or (not self.logger.isEnabledFor(DEBUG))):
+			return
+		self.log(DEBUG, '패킷 %s #%d (%d): %r', direction, self._packet_count, len(packet), packet[:self.packet_dump_size],
+				extra={'direction': direction})
+
+
+	def process(self, msg: Any, kwargs: MutableMapping[str, Any]) -> Tuple[Any, MutableMapping[str, Any]]:
+		extra = kwargs.get('extra')
+		kwargs['extra'] = self.extra if (extra == None) else {**self.extra, **extra}
+		return self._prefix + str(msg), kwargs
+
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+	"""큐가 가득 차면 기다리지 않고 레코드를 버리는 QueueHandler입니다.<br />
+	같은 프로세스의 리스너 스레드로만 전달하므로 prepare()에서 메시지를 만들지 않고, 형식화는 리스너 스레드에서 합니다.
+	"""
+	def __init__(self, queue: Queue):
+		super().__init__(queue)
+		self.dropped: int = 0
+
+
+	def enqueue(self, record: LogRecord):
+		try:
+			self.queue.put_nowait(record)
+		except Full:
+			self.dropped += 1
+
+
+	def prepare(self, record: LogRecord) -> LogRecord:
+		return record
+
+
+
+class QueueLogWriter:
+	"""지정한 로거들의 핸들러를 리스너 스레드로 옮기고, 로거에는 QueueHandler만 남겨
+	이벤트 루프에서의 로그 호출이 파일/콘솔 I/O나 메시지 형식화로 막히지 않게 합니다.
+	사용법:
+		writer = QueueLogWriter(['tls_tcp6'])
+		writer.start()
+		...
+		writer.stop()
+	"""
+	def __init__(self, logger_names: Iterable[str] = ('tls_tcp6',),
+				handlers: Optional[List[Handler]] = None,
+				queue_max_size: int = TlsTcp6LoggingDef.QUEUE_MAX_SIZE):
+		"""
+		Args:
+			logger_names: 적용할 로거 이름 목록
+			handlers: 리스너 스레드에서 실행할 핸들러 (None: 로거들에 기록하면 실행되던 핸들러(상위 로거 포함), 없으면 StreamHandler 생성)
+			queue_max_size: 큐의 최대 레코드 수 (가득 차면 레코드를 버리고 dropped를 증가)
+		"""
+		self.logger_names = list(logger_names)
+		self.handlers = handlers
+		self._queue: Queue = Queue(queue_max_size)
+		self._queue_handler = _NonBlockingQueueHandler(self._queue)
+		self._listener: Optional[QueueListener] = None
+		self._saved_handlers: Dict[str, Tuple[List[Handler], bool]] = {} # 로거 이름 -> (기존 핸들러, propagate)
+
+
+	@staticmethod
+	def _get_effective_handlers(logger: Logger) -> List[Handler]:
+		"""로거와 propagate로 이어지는 상위 로거들의 핸들러 (로거에 기록하면 실행되는 핸들러 목록)"""
+		handlers: List[Handler] = []
+		current: Optional[Logger] = logger
+		while (current != None):
+			handlers.extend(current.handlers)
+			if (not current.propagate):
+				break
+			current = current.parent
+		return handlers
+
+
+	@property
+	def dropped(self) -> int:
+		"""큐가 가득 차서 버린 레코드 수"""
+		return self._queue_handler.dropped
+
+
+	def start(self):
+		"""로거들의 핸들러를 QueueHandler로 교체하고 리스너 스레드를 시작합니다."""
+		if (self._listener != None):
+			return
+
+		handlers: List[Handler] = []
+		for name in self.logger_names:
+			logger = getLogger(name)
+			self._saved_handlers[name] = (list(logger.handlers), logger.propagate)
+			for handler in self._get_effective_handlers(logger):
+				if (handler not in handlers):
+					handlers.append(handler)
+
+		if (self.handlers != None):
+			handlers = list(self.handlers)
+		elif (not handlers):
+			handler = StreamHandler()
+			handler.setFormatter(Formatter(TlsTcp6LoggingDef.LOG_FORMAT))
+			handlers = [handler]
+
+		for name in self.logger_names:
+			logger = getLogger(name)
+			for handler in list(logger.handlers):
+				logger.removeHandler(handler)
+			logger.addHandler(self._queue_handler)
+			logger.propagate = False # 상위 로거의 핸들러는 리스너 스레드에서 실행됨
+
+		self._listener = QueueListener(self._queue, *handlers, respect_handler_level=True)
+		self._listener.start()
+
+
+	def stop(self):
+		"""남은 레코드를 모두 기록하고 리스너 스레드를 종료한 뒤, 로거들의 기존 핸들러를 복원합니다."""
+		if (self._listener == None):
+			return
+		self._listener.stop()
+		self._listener = None
+
+		for name, (handlers, propagate) in self._saved_handlers.items():
+			logger = getLogger(name)
+			logger.removeHandler(self._queue_handler)
+			for handler in handlers:
+				logger.addHandler(handler)
+			logger.propagate = propagate
+		self._saved_handlers.clear()
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+# tls_tcp6 연결 계측(metrics) 훅 및 Prometheus / JSON 내보내기
+# made : hbesthee@naver.com
+# date : 2026-10-18
+
+# Original Packages
+from asyncio import StreamReader, StreamWriter
+from bisect import bisect_left
+from logging import getLogger
+from os import replace
+from time import time
+from typing import Any, Dict, Final, List, Optional, Tuple
+
+import asyncio
+import json
+
+
+
+
+class TlsTcp6MetricsDef:
+	LOGGER_NAME: Final			= 'tls_tcp6.metrics'
+	PREFIX: Final				= 'tls_tcp6'
+	# 파싱 시간 히스토그램 구간 (초)
+	PARSE_BUCKETS: Final		= (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05)
+	# 연결(TCP + TLS 핸드셰이크) 시간 히스토그램 구간 (초)
+	HANDSHAKE_BUCKETS: Final	= (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+	SNAPSHOT_INTERVAL: Final	= 10.0 # JSON 스냅샷 저장 주기 (초)
+
+
+
+class Histogram:
+	"""고정 구간 누적 히스토그램 (Prometheus histogram 형식)"""
+	__slots__ = ('buckets', 'counts', 'sum', 'count')
+
+	def __init__(self, buckets: Tuple[float, ...]):
+		self.buckets = buckets
+		self.counts: List[int] = [0] * (len(buckets) + 1) # 마지막은 +Inf 구간
+		self.sum: float = 0.0
+		self.count: int = 0
+
+
+	def merge(self, other: 'Histogram'):
+		for index, value in enumerate(other.counts):
+			self.counts[index] += value
+		self.sum += other.sum
+		self.count += other.count
+
+
+	def observe(self, value: float):
+		self.counts[bisect_left(self.buckets, value)] += 1
+		self.sum += value
+		self.count += 1
+
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""구간별 누적 개수(cumulative)를 포함한 사전 반환"""
+		cumulative, total = {}, 0
+		for bound, value in zip(self.buckets + (float('inf'),), self.counts):
+			total += value
+			cumulative['+Inf' if (bound == float('inf')) else repr(bound)] = total
+		return {'buckets': cumulative, 'sum': self.sum, 'count': self.count}
+
+
+
+class ConnectionMetrics:
+	"""연결 하나의 계측 값"""
+	__slots__ = ('bytes_in', 'bytes_out', 'packets_in', 'packets_out', 'flushes', 'parse_time', 'connected_time')
+
+	def __init__(self):
+		self.bytes_in: int = 0
+		self.bytes_out: int = 0
+		self.packets_in: int = 0
+		self.packets_out: int = 0
+		self.flushes: int = 0
+		self.parse_time = Histogram(TlsTcp6MetricsDef.PARSE_BUCKETS)
+		self.connected_time: float = time()
+
+
+
+class TlsTcp6Hooks:
+	"""tls_tcp6 소켓의 계측/추적 훅 기본 클래스입니다. 필요한 메소드만 재정의하여 사용합니다.<br />
+	소켓의 hooks 인자가 None(기본)이면 호출 지점에서 None 검사만 하므로 비용이 거의 없습니다.
+	모든 훅은 이벤트 루프 스레드에서 호출되므로 오래 걸리는 작업을 하면 안 됩니다.
+	"""
+	def on_connect(self, socket: Any):
+		"""연결이 수립되고 핸들러가 시작되었을 때"""
+
+
+	def on_disconnect(self, socket: Any):
+		"""연결이 종료되었을 때"""
+
+
+	def on_handshake(self, socket: Any, seconds: float):
+		"""연결(TCP + TLS 핸드셰이크)이 완료되었을 때
+		(클라이언트: 연결 시작부터 완료까지, 서버: TCP 연결 수락부터 TLS 핸드셰이크를 거쳐 핸들러가 시작될 때까지)
+		"""
+
+
+	def on_parse(self, socket: Any, nbytes: int, npackets: int, seconds: float):
+		"""수신 데이터 nbytes를 파싱하여 npackets 개의 패킷을 만들었을 때"""
+
+
+	def on_receive(self, socket: Any, nbytes: int):
+		"""데이터를 수신했을 때"""
+
+
+	def on_send(self, socket: Any, nbytes: int, records: int):
+		"""송신 큐의 메시지 records 개(nbytes)를 한 번에 송신했을 때"""
+
+
+
+class MetricsHooks(TlsTcp6Hooks):
+	"""연결별 송수신 바이트/패킷 수, 파싱 시간, 연결 시간을 수집하고 합산하는 훅입니다.<br />
+	서버에 지정하면 서버가 만드는 모든 클라이언트 소켓에 적용되며, 종료된 연결의 값은 누적 합계에 더해집니다.
+	"""
+	def __init__(self):
+		self.connections: Dict[Any, Tuple[Any, ConnectionMetrics]] = {} # uuid -> (소켓, 계측 값)
+		self.closed = ConnectionMetrics() # 종료된 연결들의 누적 합계
+		self.handshake_time = Histogram(TlsTcp6MetricsDef.HANDSHAKE_BUCKETS)
+		self.connect_count: int = 0
+		self.disconnect_count: int = 0
+
+
+	def _get(self, socket: Any) -> ConnectionMetrics:
+		entry = self.connections.get(socket.uuid)
+		if (entry == None):
+			entry = self.connections[socket.uuid] = (socket, ConnectionMetrics())
+		return entry[1]
+
+
+	def on_connect(self, socket: Any):
+		self.connect_count += 1
+		self._get(socket)
+
+
+	def on_disconnect(self, socket: Any):
+		entry = self.connections.pop(socket.uuid, None)
+		if (entry == None):
+			return
+		self.disconnect_count += 1
+		metrics = entry[1]
+		closed = self.closed
+		closed.bytes_in += metrics.bytes_in
+		closed.bytes_out += metrics.bytes_out
+		closed.packets_in += metrics.packets_in
+		closed.packets_out += metrics.packets_out
+		closed.flushes += metrics.flushes
+		closed.parse_time.merge(metrics.parse_time)
+
+
+	def on_handshake(self, socket: Any, seconds: float):
+		self.handshake_time.observe(seconds)
+
+
+	def on_parse(self, socket: Any, nbytes: int, npackets: int, seconds: float):
+		metrics = self._get(socket)
+		metrics.packets_in += npackets
+		metrics.parse_time.observe(seconds)
+
+
+	def on_receive(self, socket: Any, nbytes: int):
+		self._get(socket).bytes_in += nbytes
+
+
+	def on_send(self, socket: Any, nbytes: int, records: int):
+		metrics = self._get(socket)
+		metrics.bytes_out += nbytes
+		metrics.packets_out += records
+		metrics.flushes += 1
+
+
+	def snapshot(self, per_connection: bool = False) -> Dict[str, Any]:
+		"""현재 계측 값을 합산한 사전을 반환합니다.
+
+		Args:
+			per_connection: 연결별 값(connections_detail)을 포함할지 여부
+
+		Returns:
+			연결 수, 송수신 바이트/패킷 합계, 큐 깊이(합계/최대), 파싱 시간 및 연결 시간 히스토그램
+		"""
+		total = ConnectionMetrics()
+		total.parse_time.merge(self.closed.parse_time)
+		for name in ('bytes_in', 'bytes_out', 'packets_in', 'packets_out', 'flushes'):
+			setattr(total, name, getattr(self.closed, name))
+
+		depth = {'rx_queue': [0, 0], 'tx_queue': [0, 0], 'tx_pending_bytes': [0, 0]} # [합계, 최대]
+		detail = []
+		for uuid, (socket, metrics) in self.connections.items():
+			for name in ('bytes_in', 'bytes_out', 'packets_in', 'packets_out', 'flushes'):
+				setattr(total, name, getattr(total, name) + getattr(metrics, name))
+			total.parse_time.merge(metrics.parse_time)
+
+			queues = {
+				'rx_queue': socket._rx_queue.qsize(),
+				'tx_queue': socket._tx_queue.qsize(),
+				'tx_pending_bytes': socket._tx_pending_bytes,
+			}
+			for name, value in queues.items():
+				depth[name][0] += value
+				depth[name][1] = max(depth[name][1], value)
+			if (per_connection):
+				detail.append(dict(uuid=str(uuid), bytes_in=metrics.bytes_in, bytes_out=metrics.bytes_out,
+						packets_in=metrics.packets_in, packets_out=metrics.packets_out, **queues))
+
+		result = {
+			'timestamp': time(),
+			'connections': len(self.connections),
+			'connect_count': self.connect_count,
+			'disconnect_count': self.disconnect_count,
+			'bytes_in': total.bytes_in,
+			'bytes_out': total.bytes_out,
+			'packets_in': total.packets_in,
+			'packets_out': total.packets_out,
+			'flushes': total.flushes,
+			'queue_depth': {name: {'sum': value[0], 'max': value[1]} for name, value in depth.items()},
+			'parse_seconds': total.parse_time.to_dict(),
+			'handshake_seconds': self.handshake_time.to_dict(),
+		}
+		if (per_connection):
+			result['connections_detail'] = detail
+		return result
+
+
+
+def to_prometheus(snapshot: Dict[str, Any], prefix: str = TlsTcp6MetricsDef.PREFIX,
+		extra: Optional[Dict[str, float]] = None) -> str:
+	"""MetricsHooks.snapshot() 결과를 Prometheus text exposition 형식으로 변환
+
+	Args:
+		snapshot: MetricsHooks.snapshot() 결과
+		prefix: 지표 이름 접두사
+		extra: 추가로 내보낼 gauge 값 (예: 서버의 get_stats() 중 숫자 값)
+	"""
+	lines = []
+	def add(name: str, kind: str, value: float, help_text: str):
+		lines.append(f'# HELP {prefix}_{name} {help_text}')
+		lines.append(f'# TYPE {prefix}_{name} {kind}')
+		lines.append(f'{prefix}_{name} {value}')
+
+	add('connections', 'gauge', snapshot['connections'], 'Current number of connections')
+	add('connects_total', 'counter', snapshot['connect_count'], 'Total number of established connections')
+	add('disconnects_total', 'counter', snapshot['disconnect_count'], 'Total number of closed connections')
+	add('received_bytes_total', 'counter', snapshot['bytes_in'], 'Total bytes received')
+	add('sent_bytes_total', 'counter', snapshot['bytes_out'], 'Total bytes sent')
+	add('received_packets_total', 'counter', snapshot['packets_in'], 'Total packets parsed from received data')
+	add('sent_packets_total', 'counter', snapshot['packets_out'], 'Total messages sent')
+	add('send_flushes_total', 'counter', snapshot['flushes'], 'Total batched writes')
+
+	lines.append(f'# HELP {prefix}_queue_depth Queue depth summed over connections')
+	lines.append(f'# TYPE {prefix}_queue_depth gauge')
+	for name, value in snapshot['queue_depth'].items():
+		lines.append(f'{prefix}_queue_depth{{queue="{name}",stat="sum"}} {value["sum"]}')
+		lines.append(f'{prefix}_queue_depth{{queue="{name}",stat="max"}} {value["max"]}')
+
+	for name, help_text in (('parse_seconds', 'Time spent parsing received data'),
+			('handshake_seconds', 'Client connect and TLS handshake time')):
+		histogram = snapshot[name]
+		lines.append(f'# HELP {prefix}_{name} {help_text}')
+		lines.append(f'# TYPE {prefix}_{name} histogram')
+		for bound, value in histogram['buckets'].items():
+			lines.append(f'{prefix}_{name}_bucket{{le="{bound}"}} {value}')
+		lines.append(f'{prefix}_{name}_sum {histogram["sum"]}')
+		lines.append(f'{prefix}_{name}_count {histogram["count"]}')
+
+	for name, value in (extra or {}).items():
+		if (isinstance(value, (int, float)) and not isinstance(value, bool)):
+			lines.append(f'# TYPE {prefix}_server_{name} gauge')
+			lines.append(f'{prefix}_server_{name} {value}')
+	return '\n'.join(lines) + '\n'
+
+
+
+class MetricsExporter:
+	"""MetricsHooks의 값을 HTTP(Prometheus text / JSON) 또는 주기적인 JSON 파일로 내보냅니다."""
+	def __init__(self, hooks: MetricsHooks, server: Any = None, logger_name: str = TlsTcp6MetricsDef.LOGGER_NAME):
+		"""
+		Args:
+			hooks: 값을 수집하는 MetricsHooks
+			server: 지정하면 server.get_stats()의 숫자 값도 함께 내보냄
+			logger_name: 사용할 로거의 이름
+		"""
+		self.hooks = hooks
+		self.server = server
+		self.logger = getLogger(logger_name)
+		self._http_server: Optional[asyncio.Server] = None
+
+
+	async def _http_handler(self, reader: StreamReader, writer: StreamWriter):
+		"""GET /metrics (Prometheus text) 또는 GET /metrics.json 요청 처리"""
+		try:
+			request_line = await reader.readline()
+			while ((await reader.readline()) not in (b'\r\n', b'\n', b'')):
+				pass # 헤더는 사용하지 않음
+
+			parts = request_line.decode('latin-1').split()
+			target = parts[1] if (len(parts) > 1) else '/'
+			if (target.startswith('/metrics.json')):
+				status, content_type, body = '200 OK', 'application/json', json.dumps(self.snapshot()).encode()
+			elif (target.startswith('/metrics')):
+				status, content_type, body = '200 OK', 'text/plain; version=0.0.4', self.prometheus().encode()
+			else:
+				status, content_type, body = '404 Not Found', 'text/plain', b'not found\n'
+
+			writer.write((f'HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n'
+					f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n').encode() + body)
+			await writer.drain()
+		except Exception as e:
+			self.logger.warning(f"metrics 요청 처리 중 예외 발생: {e}")
+		finally:
+			writer.close()
+
+
+	def prometheus(self) -> str:
+		"""Prometheus text exposition 형식 문자열"""
+		extra = self.server.get_stats() if (self.server != None) else None
+		return to_prometheus(self.hooks.snapshot(), extra=extra)
+
+
+	async def run_json_snapshots(self, file_path: str, interval: float = TlsTcp6MetricsDef.SNAPSHOT_INTERVAL):
+		"""interval 초마다 JSON 스냅샷을 파일에 저장합니다. (임시 파일에 쓴 뒤 교체하므로 읽는 쪽에서 잘린 파일을 보지 않음)"""
+		temp_path = f'{file_path}.tmp'
+		while True:
+			try:
+				with open(temp_path, 'w', encoding='utf-8') as f:
+					json.dump(self.snapshot(), f)
+				replace(temp_path, file_path)
+			except OSError as e:
+				self.logger.error(f"metrics 스냅샷 저장 실패: {e}")
+			await asyncio.sleep(interval)
+
+
+	def snapshot(self) -> Dict[str, Any]:
+		"""MetricsHooks 스냅샷 (server 지정 시 server.get_stats() 포함)"""
+		result = self.hooks.snapshot()
+		if (self.server != None):
+			result['server'] = self.server.get_stats()
+		return result
+
+
+	async def start_http(self, host: str = '::1', port: int = 9108) -> asyncio.Server:
+		"""Prometheus가 수집할 수 있는 HTTP 엔드포인트를 시작합니다. (/metrics, /metrics.json)"""
+		self._http_server = await asyncio.start_server(self._http_handler, host, port)
+		self.logger.info(f"metrics HTTP 엔드포인트 시작: [{host}]:{port}")
+		return self._http_server
+
+
+	async def stop_http(self):
+		if (self._http_server != None):
+			self._http_server.close()
+			await self._http_server.wait_closed()
+			self._http_server = None
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+# SO_REUSEPORT 기반 다중 프로세스 TlsTcp6Server 관리자 (Supervisor)
+# made : hbesthee@naver.com
+# date : 2026-10-18
+
+# Original Packages
+from logging import getLogger
+from multiprocessing import get_context
+from os import cpu_count, getpid
+from queue import Empty
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Any, Dict, Final, List, Optional, Type
+
+import asyncio
+import signal
+import socket
+
+
+
+# User's Package 들을 포함시키기 위한 sys.path에 프로젝트 폴더 추가하기
+from os import getcwd
+from sys import path as sys_path
+project_folder = getcwd()
+if (not project_folder in sys_path):
+	sys_path.append(str(project_folder))
+
+
+# User's Package
+from lib.tls_tcp6 import TlsTcp6Key, TlsTcp6Server
+
+
+
+
+class TlsTcp6SupervisorDef:
+	LOGGER_NAME: Final			= 'tls_tcp6.supervisor'
+	STATS_INTERVAL: Final		= 1.0 # 작업 프로세스가 통계를 보고하는 주기 (초)
+	DRAIN_TIMEOUT: Final		= 10.0 # graceful 종료 시 기존 연결이 끊어지기를 기다리는 최대 시간 (초)
+	READY_TIMEOUT: Final		= 10.0 # 작업 프로세스가 포트 바인딩을 완료하기를 기다리는 최대 시간 (초)
+
+
+
+def _run_worker(worker_id: int, server_class: Type[TlsTcp6Server], server_kwargs: Dict[str, Any],
+		stats_queue, stop_event, stats_interval: float, drain_timeout: float):
+	"""작업 프로세스 진입점: 자체 이벤트 루프에서 SO_REUSEPORT 서버를 실행합니다."""
+	asyncio.run(_serve_worker(worker_id, server_class, server_kwargs, stats_queue, stop_event, stats_interval, drain_timeout))
+
+
+async def _serve_worker(worker_id: int, server_class: Type[TlsTcp6Server], server_kwargs: Dict[str, Any],
+		stats_queue, stop_event, stats_interval: float, drain_timeout: float):
+	"""stop_event가 설정될 때까지 서버를 실행하며 주기적으로 통계를 보고한 뒤, 기존 연결을 정리하고 종료합니다."""
+	logger = getLogger(TlsTcp6SupervisorDef.LOGGER_NAME)
+	loop = asyncio.get_running_loop()
+	server = server_class(**server_kwargs, **{TlsTcp6Key.REUSE_PORT: True})
+	server_task = asyncio.create_task(server.start())
+
+	def report():
+		stats = server.get_stats()
+		stats['listening'] = (server._server_task != None) and server._server_task.is_serving()
+		stats_queue.put((worker_id, getpid(), stats))
+
+	try:
+		while (not server_task.done()):
+			if (server._server_task != None):
+				report()
+			if (await loop.run_in_executor(None, stop_event.wait, stats_interval)):
+				break
+
+		if (server_task.done() and (server_task.exception() != None)):
+			logger.error(f"작업 프로세스 {worker_id} 서버 시작 실패: {server_task.exception()}")
+			return
+
+		# graceful 종료: 새로운 연결은 다른 작업 프로세스가 받도록 수락을 중지하고, 기존 연결이 끊어지기를 대기
+		await server.stop_accepting()
+		deadline = loop.time() + drain_timeout
+		while (server._clients and (loop.time() < deadline)):
+			await asyncio.sleep(0.05)
+		report()
+
+	finally:
+		await server.stop()
+		server_task.cancel()
+		try:
+			await server_task
+		except (asyncio.CancelledError, Exception):
+			pass
+
+
+
+class _WorkerProcess:
+	"""작업 프로세스 하나의 상태"""
+	def __init__(self, worker_id: int, process, stop_event):
+		self.worker_id = worker_id
+		self.process = process
+		self.stop_event = stop_event
+
+
+
+class TlsTcp6Supervisor:
+	"""SO_REUSEPORT로 같은 IPv6 포트를 공유하는 TlsTcp6Server 작업 프로세스 N개를 관리합니다.<br />
+	각 작업 프로세스는 자체 이벤트 루프와 클라이언트 목록을 가지므로 TLS 처리가 CPU 코어 수만큼 분산됩니다.
+	관리자는 작업 프로세스의 통계를 모으고, 종료된 작업 프로세스를 다시 시작하며, 순차 재시작(graceful restart)을 처리합니다.
+	"""
+	def __init__(self, server_kwargs: Dict[str, Any], workers: int = 0,
+			server_class: Type[TlsTcp6Server] = TlsTcp6Server,
+			stats_interval: float = TlsTcp6SupervisorDef.STATS_INTERVAL,
+			drain_timeout: float = TlsTcp6SupervisorDef.DRAIN_TIMEOUT,
+			logger_name: str = TlsTcp6SupervisorDef.LOGGER_NAME):
+		"""TlsTcp6Supervisor 클래스의 생성자입니다.
+
+		Args:
+			server_kwargs: 작업 프로세스에서 서버를 생성할 때 전달할 키워드 인자입니다. (spawn 방식이므로 pickle 가능해야 함)
+			workers: 작업 프로세스 수입니다. (0: CPU 코어 수)
+			server_class: 작업 프로세스에서 실행할 서버 클래스입니다. (모듈 최상위에 정의되어야 함)
+			stats_interval: 작업 프로세스가 통계를 보고하는 주기 (초)입니다.
+			drain_timeout: 작업 프로세스 종료 시 기존 연결이 끊어지기를 기다리는 최대 시간 (초)입니다.
+			logger_name: 사용할 로거의 이름입니다.
+		"""
+		self.logger = getLogger(logger_name)
+		self.server_kwargs = server_kwargs
+		self.server_class = server_class
+		self.stats_interval = stats_interval
+		self.drain_timeout = drain_timeout
+
+		self.workers = workers if (workers > 0) else (cpu_count() or 1)
+		if ((self.workers > 1) and (not hasattr(socket, 'SO_REUSEPORT'))):
+			self.logger.warning("SO_REUSEPORT를 지원하지 않는 플랫폼이므로 작업 프로세스 1개로 실행합니다.")
+			self.workers = 1
+
+		self._context = get_context('spawn')
+		self._stats_queue = self._context.Queue()
+		self._workers: Dict[int, _WorkerProcess] = {}
+		self._stats: Dict[int, Dict[str, Any]] = {} # pid -> 최근 보고된 통계
+		self._lock = Lock()
+		self._restart_count: int = 0
+		self._is_running: bool = False
+		self._stop_event = Event()
+		self._restart_event = Event()
+		self._collector: Optional[Thread] = None
+
+
+	def _collect_stats(self):
+		"""작업 프로세스가 보고하는 통계를 수집하는 스레드"""
+		while (self._is_running or not self._stats_queue.empty()):
+			try:
+				worker_id, pid, stats = self._stats_queue.get(timeout=0.2)
+			except Empty:
+				continue
+			except (EOFError, OSError):
+				break
+			stats['worker_id'] = worker_id
+			with self._lock:
+				self._stats[pid] = stats
+
+
+	def _spawn_worker(self, worker_id: int) -> _WorkerProcess:
+		"""작업 프로세스를 시작합니다."""
+		stop_event = self._context.Event()
+		process = self._context.Process(
+			target=_run_worker,
+			args=(worker_id, self.server_class, self.server_kwargs, self._stats_queue, stop_event,
+					self.stats_interval, self.drain_timeout),
+			name=f'TlsTcp6Worker-{worker_id}',
+			daemon=True
+		)
+		process.start()
+		self.logger.info(f"작업 프로세스 {worker_id} 시작: pid={process.pid}")
+		return _WorkerProcess(worker_id, process, stop_event)
+
+
+	def _stop_worker(self, worker: _WorkerProcess, timeout: Optional[float] = None):
+		"""작업 프로세스에 graceful 종료를 요청하고 종료될 때까지 대기합니다."""
+		worker.stop_event.set()
+		worker.process.join(self.drain_timeout + 5.0 if (timeout == None) else timeout)
+		if (worker.process.is_alive()):
+			self.logger.warning(f"작업 프로세스 {worker.worker_id}(pid={worker.process.pid})가 종료되지 않아 강제 종료합니다.")
+			worker.process.terminate()
+			worker.process.join()
+		with self._lock:
+			self._stats.pop(worker.process.pid, None)
+		self.logger.info(f"작업 프로세스 {worker.worker_id} 종료: pid={worker.process.pid}")
+
+
+	def _wait_ready(self, worker: _WorkerProcess, timeout: float = TlsTcp6SupervisorDef.READY_TIMEOUT) -> bool:
+		"""작업 프로세스가 포트 바인딩을 마치고 통계를 보고할 때까지 대기합니다."""
+		deadline = perf_counter() + timeout
+		while (perf_counter() < deadline):
+			with self._lock:
+				stats = self._stats.get(worker.process.pid)
+			if (stats and stats.get('listening')):
+				return True
+			if (not worker.process.is_alive()):
+				return False
+			self._stop_event.wait(0.05)
+		return False
+
+
+	def get_stats(self) -> Dict[str, Any]:
+		"""실행 중인 작업 프로세스들의 통계를 합산하여 반환합니다.
+
+		Returns:
+			작업 프로세스 수(workers), 실행 중인 작업 프로세스 수(alive), 재시작 횟수(restarts),
+			통계 합계(clients, accepted, tx_bytes, tx_records, tx_flush_count), 작업 프로세스별 통계 목록(per_worker)
+		"""
+		with self._lock:
+			workers = list(self._workers.values())
+			per_worker: List[Dict[str, Any]] = []
+			for worker in workers:
+				stats = dict(self._stats.get(worker.process.pid, {}))
+				stats.update(worker_id=worker.worker_id, pid=worker.process.pid, alive=worker.process.is_alive())
+				per_worker.append(stats)
+
+		totals = {'workers': len(workers), 'alive': sum(1 for stats in per_worker if stats['alive']),
+				'restarts': self._restart_count}
+		for key in ('clients', 'accepted', 'tx_bytes', 'tx_records', 'tx_flush_count'):
+			totals[key] = sum(stats.get(key, 0) for stats in per_worker)
+		totals['per_worker'] = per_worker
+		return totals
+
+
+	def restart(self) -> bool:
+		"""작업 프로세스를 하나씩 순차 재시작합니다.<br />
+		새 작업 프로세스가 같은 포트에 바인딩을 마친 뒤 기존 작업 프로세스를 graceful 종료하므로 연결 수락이 중단되지 않습니다.
+
+		Returns:
+			모든 새 작업 프로세스가 정상적으로 시작되었으면 True
+		"""
+		self.logger.info("작업 프로세스 순차 재시작을 시작합니다.")
+		result = True
+		for worker_id in list(self._workers.keys()):
+			new_worker = self._spawn_worker(worker_id)
+			if (not self._wait_ready(new_worker)):
+				self.logger.error(f"새 작업 프로세스 {worker_id}가 시작되지 않아 기존 작업 프로세스를 유지합니다.")
+				self._stop_worker(new_worker, timeout=1.0)
+				result = False
+				continue
+
+			with self._lock:
+				old_worker = self._workers[worker_id]
+				self._workers[worker_id] = new_worker
+			self._stop_worker(old_worker)
+		self._restart_count += 1
+		return result
+
+
+	def serve_forever(self, check_interval: float = 0.5):
+		"""관리자를 실행합니다. (메인 스레드에서 호출)<br />
+		SIGHUP 수신 시 순차 재시작하고, SIGINT/SIGTERM 수신 시 모든 작업 프로세스를 종료합니다.
+		비정상 종료된 작업 프로세스는 다시 시작합니다.
+		"""
+		if (not self._is_running):
+			self.start()
+
+		signal.signal(signal.SIGINT, lambda signum, frame: self._stop_event.set())
+		signal.signal(signal.SIGTERM, lambda signum, frame: self._stop_event.set())
+		if (hasattr(signal, 'SIGHUP')):
+			signal.signal(signal.SIGHUP, lambda signum, frame: self._restart_event.set())
+
+		try:
+			while (not self._stop_event.wait(check_interval)):
+				if (self._restart_event.is_set()):
+					self._restart_event.clear()
+					self.restart()
+
+				for worker_id, worker in list(self._workers.items()):
+					if (not worker.process.is_alive()):
+						self.logger.warning(f"작업 프로세스 {worker_id}(pid={worker.process.pid})가 종료되어 다시 시작합니다. (exitcode={worker.process.exitcode})")
+						with self._lock:
+							self._stats.pop(worker.process.pid, None)
+							self._workers[worker_id] = self._spawn_worker(worker_id)
+		finally:
+			self.stop()
+
+
+	def start(self, wait_ready: bool = True) -> bool:
+		"""작업 프로세스들을 시작합니다.
+
+		Args:
+			wait_ready: 모든 작업 프로세스가 포트 바인딩을 마칠 때까지 대기할지 여부
+
+		Returns:
+			wait_ready가 True이면 모든 작업 프로세스가 정상적으로 시작되었는지 여부, 아니면 True
+		"""
+		if (self._is_running):
+			return True
+		self._is_running = True
+		self._stop_event.clear()
+		self._collector = Thread(target=self._collect_stats, name='TlsTcp6SupervisorStats', daemon=True)
+		self._collector.start()
+
+		with self._lock:
+			for worker_id in range(self.workers):
+				self._workers[worker_id] = self._spawn_worker(worker_id)
+
+		if (not wait_ready):
+			return True
+		return all([self._wait_ready(worker) for worker in list(self._workers.values())])
+
+
+	def stop(self, timeout: Optional[float] = None):
+		"""모든 작업 프로세스를 graceful 종료합니다.
+
+		Args:
+			timeout: 작업 프로세스 하나의 종료를 기다리는 최대 시간 (초) (None: drain_timeout + 5초)
+		"""
+		if (not self._is_running):
+			return
+		self._stop_event.set()
+
+		workers = list(self._workers.values())
+		for worker in workers:
+			worker.stop_event.set() # 모든 작업 프로세스가 동시에 종료를 시작하도록 먼저 알림
+		for worker in workers:
+			self._stop_worker(worker, timeout)
+		with self._lock:
+			self._workers.clear()
+
+		self._is_running = False
+		if (self._collector != None):
+			self._collector.join()
+			self._collector = None
+		self.logger.info("모든 작업 프로세스가 종료되었습니다.")
+
+
+
+# 사용 예제
+if (__name__ == "__main__"):
+	import logging
+	logging.basicConfig(level=logging.INFO,
+						format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s')
+
+	supervisor = TlsTcp6Supervisor(
+		server_kwargs={
+			'cert_file': "conf/server.crt",
+			'key_file': "conf/server.key",
+			'ca_file': "conf/root.crt",
+		},
+	)
+	supervisor.serve_forever()
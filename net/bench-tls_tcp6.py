@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+# TlsTcp6Server 부하 생성 벤치마크 (연결 수/초, 메시지 수/초, 지연 시간, 연결당 메모리)
+# made : hbesthee@naver.com
+# date : 2026-10-18
+#
+# 사용 예:
+#	python net/bench-tls_tcp6.py --processes 4 --clients 2000 --messages 50 --payload-size 64 --output result.json
+#	python net/bench-tls_tcp6.py --generate-ca --clients 500 --direct-parse
+#
+# 서버는 현재 프로세스에서, 클라이언트는 --processes 개의 작업 프로세스에서 실행됩니다.
+# 각 단계(연결 → 에코 → 단방향 송신 → 종료)는 모든 작업 프로세스가 이전 단계를 마친 뒤 동시에 시작합니다.
+# 인증서는 conftest와 같은 ./conf 폴더의 파일을 사용하며, 없거나 --generate-ca를 지정하면
+# openssl로 임시 루프백(::1) 인증 기관과 서버/클라이언트 인증서를 생성합니다.
+# 결과는 JSON으로 출력되므로 커밋 사이의 결과를 비교할 수 있습니다.
+
+# Original Packages
+from argparse import ArgumentParser, Namespace
+from datetime import datetime
+from multiprocessing import get_context
+from os import path, sysconf
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Dict, List
+from uuid import UUID
+
+import asyncio
+import json
+import logging
+import platform
+import struct
+import subprocess
+
+
+
+# User's Package 들을 포함시키기 위한 sys.path에 프로젝트 폴더 추가하기
+from pathlib import Path
+from sys import path as sys_path
+project_folder = str(Path(__file__).parent.parent)
+if (not project_folder in sys_path):
+	sys_path.append(str(project_folder))
+
+
+# User's Package
+from lib.base_parser import BaseParser, LengthPrefixFramer
+from lib.tls_tcp6 import TlsTcp6Client, TlsTcp6Server
+
+
+
+CERT_FILES = ('root.crt', 'server.crt', 'server.key', 'client.crt', 'client.key')
+CERT_EXTENSIONS = "subjectAltName=IP:::1,DNS:localhost\nbasicConstraints=CA:FALSE\n"
+LOGGER_NAMES = ('tls_tcp6', 'base_parser')
+
+KIND_ECHO = b'E' # 서버가 그대로 돌려보내는 메시지
+KIND_ONEWAY = b'O' # 서버가 응답하지 않는 메시지
+HEADER = struct.Struct('!I')
+
+
+
+class BenchParser(BaseParser):
+	"""[4바이트 길이값][종류 1바이트][데이터] 형식의 벤치마크 메시지 파서"""
+	framer = LengthPrefixFramer('!I', include_header=True)
+
+
+
+class BenchServer(TlsTcp6Server):
+	"""에코 메시지는 돌려보내고 단방향 메시지는 개수만 세는 벤치마크 서버"""
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.oneway_count: int = 0
+		self.oneway_bytes: int = 0
+
+
+	async def handle_packet(self, uuid: UUID, packet: Any) -> None:
+		if (packet[HEADER.size:HEADER.size + 1] == KIND_ONEWAY):
+			self.oneway_count += 1
+			self.oneway_bytes += len(packet)
+			return
+		client_socket = self._clients.get(uuid)
+		if (client_socket != None):
+			await client_socket.send(packet)
+
+
+
+def create_loopback_ca(folder: str) -> Dict[str, str]:
+	"""openssl로 임시 루프백 인증 기관(root.crt)과 이 기관이 서명한 서버/클라이언트 인증서 생성"""
+	def openssl(*args: str):
+		subprocess.run(['openssl', *args], cwd=folder, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+	with open(path.join(folder, 'ext.cnf'), 'w', encoding='utf-8') as f:
+		f.write(CERT_EXTENSIONS)
+	openssl('req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1', '-subj', '/CN=BenchLoopbackRoot',
+			'-keyout', 'root.key', '-out', 'root.crt')
+	for name in ('server', 'client'):
+		openssl('req', '-newkey', 'rsa:2048', '-nodes', '-subj', '/CN=localhost',
+				'-keyout', f'{name}.key', '-out', f'{name}.csr')
+		openssl('x509', '-req', '-in', f'{name}.csr', '-CA', 'root.crt', '-CAkey', 'root.key', '-CAcreateserial',
+				'-days', '1', '-extfile', 'ext.cnf', '-out', f'{name}.crt')
+	return get_cert_files(folder)
+
+
+def get_cert_files(folder: str) -> Dict[str, str]:
+	return {name: path.join(folder, name) for name in CERT_FILES}
+
+
+def get_git_revision() -> str:
+	"""현재 커밋 해시 (git 저장소가 아니면 빈 문자열)"""
+	try:
+		return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_folder,
+				stderr=subprocess.DEVNULL).decode().strip()
+	except Exception:
+		return ''
+
+
+def get_rss_bytes() -> int:
+	"""현재 프로세스의 RSS (bytes, /proc이 없으면 최대 RSS)"""
+	try:
+		with open('/proc/self/statm') as f:
+			return int(f.read().split()[1]) * sysconf('SC_PAGE_SIZE')
+	except (OSError, ValueError):
+		pass
+	try:
+		import resource
+		return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+	except ImportError:
+		return 0
+
+
+def make_message(kind: bytes, payload: bytes) -> bytes:
+	return HEADER.pack(len(kind) + len(payload)) + kind + payload
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+	"""지연 시간 목록의 백분위 (ms)"""
+	if (not values):
+		return {'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+	values = sorted(values)
+	pick = lambda percent: values[min(len(values) - 1, int(len(values) * percent / 100))]
+	return {'p50': pick(50), 'p90': pick(90), 'p99': pick(99), 'max': values[-1]}
+
+
+def raise_open_file_limit():
+	"""열 수 있는 파일(소켓) 수 제한을 최댓값으로 올림 (수천 개의 연결용)"""
+	try:
+		import resource
+		soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+		if (soft < hard):
+			resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+	except (ImportError, ValueError, OSError):
+		pass
+
+
+def set_log_level(verbose: bool):
+	for name in LOGGER_NAMES:
+		logging.getLogger(name).setLevel(logging.INFO if verbose else logging.ERROR)
+
+
+
+async def run_clients(worker_id: int, config: Dict[str, Any], port: int, events: Dict[str, Any], result_queue: Any):
+	"""작업 프로세스 하나의 클라이언트들을 연결하고, 단계별 신호에 맞추어 에코/단방향 송신 후 결과를 보고"""
+	loop = asyncio.get_running_loop()
+	certs = config['certs']
+	payload = b'x' * config['payload_size']
+	echo_message = make_message(KIND_ECHO, payload)
+	oneway_message = make_message(KIND_ONEWAY, payload)
+
+	async def wait_event(name: str):
+		await loop.run_in_executor(None, events[name].wait)
+
+	def report(phase: str, result: Dict[str, Any]):
+		result_queue.put((phase, worker_id, result))
+
+	rss_before = get_rss_bytes()
+	clients = [TlsTcp6Client(cert_file=certs['client.crt'], key_file=certs['client.key'], ca_file=certs['root.crt'],
+			host='::1', port=port, parser_class=BenchParser, check_hostname=False, direct_parse=config['direct_parse'])
+			for _ in range(config['clients'])]
+
+	# 1. 연결
+	semaphore = asyncio.Semaphore(config['connect_concurrency'])
+	connect_ms: List[float] = []
+	async def connect(client: TlsTcp6Client) -> bool:
+		async with semaphore:
+			start_time = perf_counter()
+			if (not await client.start()):
+				return False
+			connect_ms.append((perf_counter() - start_time) * 1000.0)
+			return True
+
+	start_time = perf_counter()
+	connected = [client for client, ok in zip(clients, await asyncio.gather(*(connect(client) for client in clients))) if ok]
+	report('connect', {
+		'connected': len(connected),
+		'failures': len(clients) - len(connected),
+		'seconds': perf_counter() - start_time,
+		'latency_ms': connect_ms,
+		'tls_resumed': sum(client.get_connection_stats()['tls_resumed'] for client in connected),
+		'rss_bytes': get_rss_bytes() - rss_before,
+	})
+
+	# 2. 에코 (클라이언트마다 메시지 하나씩 왕복)
+	await wait_event('echo')
+	echo_ms: List[float] = []
+	async def echo(client: TlsTcp6Client):
+		for _ in range(config['messages']):
+			start_time = perf_counter()
+			await client.send(echo_message)
+			await client.packet_queue.get()
+			echo_ms.append((perf_counter() - start_time) * 1000.0)
+
+	start_time = perf_counter()
+	await asyncio.gather(*(echo(client) for client in connected))
+	report('echo', {'messages': len(echo_ms), 'seconds': perf_counter() - start_time, 'latency_ms': echo_ms})
+
+	# 3. 단방향 송신 (응답을 기다리지 않고 송신 후, 마지막 에코 응답으로 서버 처리 완료 확인)
+	await wait_event('oneway')
+	async def oneway(client: TlsTcp6Client):
+		for _ in range(config['messages']):
+			await client.send(oneway_message)
+		await client.send(echo_message)
+		await client.packet_queue.get()
+
+	start_time = perf_counter()
+	await asyncio.gather(*(oneway(client) for client in connected))
+	report('oneway', {'messages': len(connected) * config['messages'], 'seconds': perf_counter() - start_time})
+
+	# 4. 종료
+	await wait_event('close')
+	await asyncio.gather(*(client.close() for client in clients))
+	report('close', {})
+
+
+def run_client_worker(worker_id: int, config: Dict[str, Any], port: int, events: Dict[str, Any], result_queue: Any):
+	"""(작업 프로세스) 클라이언트 부하 생성"""
+	raise_open_file_limit()
+	set_log_level(config['verbose'])
+	try:
+		asyncio.run(run_clients(worker_id, config, port, events, result_queue))
+	except Exception as e:
+		result_queue.put(('error', worker_id, {'error': repr(e)}))
+
+
+
+async def collect_phase(result_queue: Any, phase: str, workers: int, timeout: float) -> List[Dict[str, Any]]:
+	"""모든 작업 프로세스가 phase 단계의 결과를 보고할 때까지 대기"""
+	loop = asyncio.get_running_loop()
+	results = []
+	while (len(results) < workers):
+		received_phase, worker_id, result = await loop.run_in_executor(None, result_queue.get, True, timeout)
+		if (received_phase == 'error'):
+			raise RuntimeError(f"작업 프로세스 {worker_id} 오류: {result['error']}")
+		if (received_phase != phase):
+			raise RuntimeError(f"작업 프로세스 {worker_id}에서 예상하지 않은 단계 결과: {received_phase} (대기 중: {phase})")
+		results.append(result)
+	return results
+
+
+async def run_benchmark(args: Namespace, certs: Dict[str, str]) -> Dict[str, Any]:
+	"""서버를 시작하고 작업 프로세스들로 부하를 생성하여 결과 반환"""
+	server = BenchServer(cert_file=certs['server.crt'], key_file=certs['server.key'], ca_file=certs['root.crt'],
+			host='::1', port=args.port, parser_class=BenchParser, idle_timeout=0, direct_parse=args.direct_parse,
+			dispatch=args.dispatch)
+	server_task = asyncio.create_task(server.start())
+	while ((server._server_task == None) or (not server._server_task.sockets)):
+		await asyncio.sleep(0.01)
+	port = server._server_task.sockets[0].getsockname()[1]
+
+	per_worker = [args.clients // args.processes + (1 if (index < args.clients % args.processes) else 0)
+			for index in range(args.processes)]
+	config = {
+		'certs': certs,
+		'messages': args.messages,
+		'payload_size': args.payload_size,
+		'connect_concurrency': args.connect_concurrency,
+		'direct_parse': args.direct_parse,
+		'verbose': args.verbose,
+	}
+
+	context = get_context('spawn')
+	result_queue = context.Queue()
+	events = {name: context.Event() for name in ('echo', 'oneway', 'close')}
+	processes = [context.Process(target=run_client_worker, args=(worker_id, dict(config, clients=count), port, events, result_queue),
+			daemon=True) for worker_id, count in enumerate(per_worker) if (count > 0)]
+
+	try:
+		rss_before = get_rss_bytes()
+		start_time = perf_counter()
+		for process in processes:
+			process.start()
+		connect_results = await collect_phase(result_queue, 'connect', len(processes), args.timeout)
+		connect_seconds = perf_counter() - start_time # 작업 프로세스 시작 시간 포함
+		connected = sum(result['connected'] for result in connect_results)
+		while (len(server._clients) < connected): # 서버의 수락 처리 완료 대기
+			await asyncio.sleep(0.01)
+		server_rss = get_rss_bytes() - rss_before
+		client_rss = sum(result['rss_bytes'] for result in connect_results)
+
+		events['echo'].set()
+		echo_results = await collect_phase(result_queue, 'echo', len(processes), args.timeout)
+		events['oneway'].set()
+		oneway_results = await collect_phase(result_queue, 'oneway', len(processes), args.timeout)
+		server_stats = server.get_stats()
+		events['close'].set()
+		await collect_phase(result_queue, 'close', len(processes), args.timeout)
+
+	finally:
+		for name in events:
+			events[name].set()
+		for process in processes:
+			process.join(timeout=5)
+			if (process.is_alive()):
+				process.kill()
+		await server.stop()
+		server_task.cancel()
+		await asyncio.gather(server_task, return_exceptions=True)
+
+	echo_messages = sum(result['messages'] for result in echo_results)
+	echo_seconds = max(result['seconds'] for result in echo_results)
+	oneway_messages = sum(result['messages'] for result in oneway_results)
+	oneway_seconds = max(result['seconds'] for result in oneway_results)
+	message_size = HEADER.size + 1 + args.payload_size
+	return {
+		'connections': connected,
+		'connect_failures': sum(result['failures'] for result in connect_results),
+		'connect_seconds': connect_seconds,
+		'connections_per_second': connected / max(result['seconds'] for result in connect_results) if connected else 0.0,
+		'connect_latency_ms': percentiles([value for result in connect_results for value in result['latency_ms']]),
+		'tls_resumed': sum(result['tls_resumed'] for result in connect_results),
+		'echo_messages': echo_messages,
+		'echo_messages_per_second': echo_messages / echo_seconds if echo_seconds else 0.0,
+		'echo_latency_ms': percentiles([value for result in echo_results for value in result['latency_ms']]),
+		'oneway_messages': oneway_messages,
+		'oneway_received': server.oneway_count,
+		'oneway_messages_per_second': oneway_messages / oneway_seconds if oneway_seconds else 0.0,
+		'oneway_megabytes_per_second': (oneway_messages * message_size) / oneway_seconds / (1024 * 1024) if oneway_seconds else 0.0,
+		'server_rss_per_connection': server_rss / connected if connected else 0,
+		'client_rss_per_connection': client_rss / connected if connected else 0,
+		'server_tx_flush_count': server_stats['tx_flush_count'],
+		'server_tx_records': server_stats['tx_records'],
+	}
+
+
+def main():
+	parser = ArgumentParser(description="TlsTcp6Server load-generation benchmark")
+	parser.add_argument('--processes', type=int, default=2, help='클라이언트를 실행하는 작업 프로세스 수')
+	parser.add_argument('--clients', type=int, default=1000, help='전체 클라이언트(연결) 수')
+	parser.add_argument('--messages', type=int, default=20, help='클라이언트 하나가 단계(에코, 단방향)마다 송신하는 메시지 수')
+	parser.add_argument('--payload-size', type=int, default=64, help='메시지 하나의 데이터 크기 (bytes)')
+	parser.add_argument('--connect-concurrency', type=int, default=100, help='작업 프로세스별 동시 연결 시도 수')
+	parser.add_argument('--direct-parse', action='store_true', help='서버/클라이언트를 direct_parse(TlsTcp6Protocol)로 실행')
+	parser.add_argument('--dispatch', action='store_true', help='서버 패킷 처리에 PacketDispatcher 사용')
+	parser.add_argument('--port', type=int, default=0, help='서버 포트 (0: 임의의 빈 포트)')
+	parser.add_argument('--cert-dir', default=path.join(project_folder, 'conf'), help='인증서 폴더 (root.crt, server/client.crt/.key)')
+	parser.add_argument('--generate-ca', action='store_true', help='openssl로 임시 루프백 인증 기관과 인증서를 생성하여 사용')
+	parser.add_argument('--timeout', type=float, default=300.0, help='단계별 최대 대기 시간 (초)')
+	parser.add_argument('--repeat', type=int, default=1, help='반복 실행 횟수')
+	parser.add_argument('--verbose', action='store_true', help='tls_tcp6 로그 출력')
+	parser.add_argument('--output', help='결과 JSON 파일 경로 (생략 시 표준 출력)')
+	args = parser.parse_args()
+	args.processes = max(1, args.processes)
+
+	raise_open_file_limit()
+	set_log_level(args.verbose)
+
+	with TemporaryDirectory() as temp_dir:
+		certs = get_cert_files(args.cert_dir)
+		if (args.generate_ca or not all(path.exists(file_path) for file_path in certs.values())):
+			certs = create_loopback_ca(temp_dir)
+
+		report = {
+			'timestamp': datetime.now().isoformat(),
+			'revision': get_git_revision(),
+			'python': platform.python_version(),
+			'config': {key: value for key, value in vars(args).items() if (key != 'output')},
+			'runs': [asyncio.run(run_benchmark(args, certs)) for _ in range(max(1, args.repeat))],
+		}
+
+	text = json.dumps(report, indent=2)
+	if (args.output):
+		with open(args.output, 'w', encoding='utf-8') as f:
+			f.write(text)
+	else:
+		print(text)
+
+
+if __name__ == "__main__":
+	main()
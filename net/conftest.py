@@ -79,6 +79,7 @@ async def server(certs: Dict[str, str], unused_tcp_port: int, request) -> AsyncG
 	# request.param을 통해 테스트별로 다른 파라미터(파서 등)를 받을 수 있음
 	parser_class = getattr(request, "param", {}).get("parser_class", BaseParser)
 	idle_timeout = getattr(request, "param", {}).get("idle_timeout", 5) # 테스트를 위해 타임아웃 단축
+	direct_parse = getattr(request, "param", {}).get("direct_parse", False)
 
 	server_instance = TlsTcp6Server(
 		cert_file=certs["server_cert"],
@@ -88,6 +89,9 @@ async def server(certs: Dict[str, str], unused_tcp_port: int, request) -> AsyncG
 		port=unused_tcp_port,
 		parser_class=parser_class,
 		idle_timeout=idle_timeout,
+		direct_parse=direct_parse,
+		**{key: value for key, value in getattr(request, "param", {}).items()
+				if (key not in ("parser_class", "idle_timeout", "direct_parse"))}
 	)
 
 	server_task = asyncio.create_task(server_instance.start())
@@ -111,7 +115,7 @@ async def client_factory(certs: Dict[str, str]):
 	"""테스트용 클라이언트 인스턴스를 생성하는 팩토리 Fixture"""
 	created_clients = []
 
-	async def _create_client(port: int, parser_class: Type[BaseParser] = BaseParser) -> TlsTcp6Client:
+	async def _create_client(port: int, parser_class: Type[BaseParser] = BaseParser, **kwargs) -> TlsTcp6Client:
 		client_instance = TlsTcp6Client(
 			cert_file=certs["client_cert"],
 			key_file=certs["client_key"],
@@ -120,6 +124,7 @@ async def client_factory(certs: Dict[str, str]):
 			port=port,
 			parser_class=parser_class,
 			check_hostname=False,
+			**kwargs
 		)
 		created_clients.append(client_instance)
 		return client_instance
@@ -3,9 +3,15 @@
 # made : hbesthee@naver.com
 # date : 2026-05-11
 
-from typing import Final
+from array import array
+from typing import Final, List, Union
 import os
 
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
 
 
 
@@ -16,18 +22,84 @@ class FrameIdLfsr:
 	2^32-1 개의 완전 순열을 보장한다 (0 제외).
 	탭 다항식: x^32 + x^31 + x^29 + x + 1 (0xD0000001).
 
+	한 단계 진행은 GF(2) 위의 32x32 선형 변환이므로, 변환 행렬의 거듭제곱으로
+	k 단계를 O(log k)에 건너뛸 수 있다 (jump). 이를 이용해 주기를 겹치지 않는 구간으로 나눈
+	하위 스트림(substream)을 만들면, 여러 프로세스/워커가 잠금 없이 서로 다른 ID를 발급할 수 있다.
+
 	Args:
 		seed: 시작 상태. 0이 아닌 32비트 정수.
 	"""
 
 	_TAP: Final[int] = 0xD0000001
 	_MASK: Final[int] = 0xFFFFFFFF
+	PERIOD: Final[int] = 0xFFFFFFFF # 주기 (2^32-1)
+
+	_jump_matrices: List[List[int]] = [] # _jump_matrices[i] : 2^i 단계 변환 행렬 (열 목록, 필요할 때 생성)
 
 	def __init__(self, seed: int = 0x90ABCDEF) -> None:
 		assert (seed != 0), "LFSR seed must not be 0"
 		self._state: int = seed & self._MASK
-		self._start: int = self._state
-		self._exhausted: bool = False
+		self._remaining: int = self.PERIOD
+
+
+	@staticmethod
+	def _apply(matrix: List[int], state: int) -> int:
+		"""GF(2) 행렬(열 목록)을 상태 벡터에 곱한다."""
+		result = 0
+		column = 0
+		while (state):
+			if (state & 1):
+				result ^= matrix[column]
+			state >>= 1
+			column += 1
+		return result
+
+
+	@classmethod
+	def _get_jump_matrix(cls, power: int) -> List[int]:
+		"""2^power 단계를 한 번에 진행하는 변환 행렬."""
+		matrices = cls._jump_matrices
+		if (not matrices):
+			# 한 단계 변환: 비트 0은 탭으로, 나머지 비트는 오른쪽으로 한 칸 이동
+			matrices.append([cls._TAP] + [1 << (bit - 1) for bit in range(1, 32)])
+		while (len(matrices) <= power):
+			last = matrices[-1]
+			matrices.append([cls._apply(last, column) for column in last])
+		return matrices[power]
+
+
+	@classmethod
+	def _advance(cls, state: int, steps: int) -> int:
+		"""state에서 steps 단계 진행한 상태."""
+		power = 0
+		while (steps):
+			if (steps & 1):
+				state = cls._apply(cls._get_jump_matrix(power), state)
+			steps >>= 1
+			power += 1
+		return state
+
+
+	def _reserve(self, count: int) -> None:
+		if (count < 0):
+			raise ValueError(f"count must not be negative: {count}")
+		if (count > self._remaining):
+			raise OverflowError("LFSR 32-bit period exhausted")
+		self._remaining -= count
+
+
+	def jump(self, steps: int) -> None:
+		"""next()를 steps 번 호출한 것과 같은 상태로 O(log steps)에 건너뛴다.
+
+		Args:
+			steps: 건너뛸 ID 개수.
+
+		Raises:
+			OverflowError: 남은 ID 개수보다 많이 건너뛸 때.
+		"""
+		self._reserve(steps)
+		self._state = self._advance(self._state, steps)
+
 
 	def next(self) -> int:
 		"""다음 고유 ID를 반환한다.
@@ -36,19 +108,104 @@ class FrameIdLfsr:
 			int: 유사 랜덤 순서의 고유 32비트 정수.
 
 		Raises:
-			OverflowError: 2^32-1 주기 소진 시.
+			OverflowError: 2^32-1 주기 (하위 스트림은 할당된 구간) 소진 시.
 		"""
-		if (self._exhausted):
+		if (self._remaining == 0):
 			raise OverflowError("LFSR 32-bit period exhausted")
+		self._remaining -= 1
 		val = self._state
 		lsb = self._state & 1
 		self._state = (self._state >> 1) ^ (self._TAP if lsb else 0)
 		self._state &= self._MASK
-		if (self._state == self._start):
-			self._exhausted = True
 		return val
 
 
+	def next_many(self, count: int, use_numpy: bool = False) -> Union[array, 'np.ndarray']:
+		"""다음 count 개의 ID를 한 번에 생성한다. (next()를 count 번 호출한 것과 같은 순서)
+
+		use_numpy가 True이면 주기를 여러 레인으로 나누어 (레인 시작 상태는 jump 행렬로 계산)
+		모든 레인을 벡터 연산으로 동시에 진행한다.
+
+		Args:
+			count: 생성할 ID 개수.
+			use_numpy: True이면 numpy.ndarray(uint32), False이면 array('I')로 반환.
+
+		Returns:
+			array('I') 또는 numpy.ndarray: 생성한 ID 목록.
+
+		Raises:
+			OverflowError: 남은 ID 개수보다 많이 요청할 때.
+			ImportError: use_numpy가 True인데 numpy가 설치되지 않았을 때.
+		"""
+		if (use_numpy and (np == None)):
+			raise ImportError("numpy is required for use_numpy=True")
+		self._reserve(count)
+
+		if (use_numpy):
+			return self._next_many_numpy(count)
+
+		result = array('I', [0]) * count
+		state = self._state
+		tap = self._TAP
+		for index in range(count):
+			result[index] = state
+			state = (state >> 1) ^ tap if (state & 1) else (state >> 1)
+		self._state = state
+		return result
+
+
+	def _next_many_numpy(self, count: int) -> 'np.ndarray':
+		lanes = max(1, min(1024, int(count ** 0.5))) # 레인 수 x 레인 길이 ≒ count
+		length = -(-count // lanes)
+
+		# 레인마다 length 단계씩 떨어진 시작 상태
+		columns = [self._advance(1 << bit, length) for bit in range(32)]
+		starts = [self._state]
+		for _ in range(lanes - 1):
+			starts.append(self._apply(columns, starts[-1]))
+
+		state = np.array(starts, dtype=np.uint32)
+		tap = np.uint32(self._TAP)
+		one = np.uint32(1)
+		output = np.empty((lanes, length), dtype=np.uint32)
+		for step in range(length):
+			output[:, step] = state
+			state = (state >> one) ^ (tap * (state & one))
+		self._state = self._advance(self._state, count)
+		return output.reshape(-1)[:count]
+
+
+	@property
+	def remaining(self) -> int:
+		"""남은 ID 개수."""
+		return self._remaining
+
+
+	def substream(self, index: int, count: int) -> "FrameIdLfsr":
+		"""남은 주기를 count 개의 겹치지 않는 구간으로 나눈 index 번째 하위 스트림을 반환한다.
+
+		같은 seed로 만든 생성기에서 각 워커가 자신의 index로 하위 스트림을 만들면,
+		서로 조율하거나 잠금을 걸지 않아도 ID가 겹치지 않는다. (이 생성기의 상태는 바꾸지 않음)
+
+		사용법:
+			frame_id_gen = FrameIdLfsr(seed).substream(worker_index, worker_count)
+
+		Args:
+			index: 하위 스트림 번호 (0 ~ count-1).
+			count: 하위 스트림 개수.
+
+		Returns:
+			FrameIdLfsr: 할당된 구간만 발급하는 생성기 (구간 소진 시 OverflowError).
+		"""
+		if (not (0 <= index < count)):
+			raise ValueError(f"index must be in [0, {count}): {index}")
+		size = self._remaining // count
+		stream = FrameIdLfsr.__new__(FrameIdLfsr)
+		stream._state = self._advance(self._state, size * index)
+		stream._remaining = (self._remaining - size * index) if (index == count - 1) else size
+		return stream
+
+
 
 if __name__ == "__main__":
 	seed = int.from_bytes(os.urandom(4), 'big') or 0xABCD
@@ -57,3 +214,13 @@ if __name__ == "__main__":
 	for frame_index in range(10):
 		frame_id = frame_id_gen.next()
 		print(f"{frame_index + 1} : {frame_id=}")
+
+	print(f"next_many(5) : {list(frame_id_gen.next_many(5))}")
+
+	frame_id_gen.jump(1_000_000)
+	print(f"jump(1_000_000) -> {frame_id_gen.next()=}, {frame_id_gen.remaining=}")
+
+	worker_count = 4
+	for worker_index in range(worker_count):
+		worker_gen = FrameIdLfsr().substream(worker_index, worker_count)
+		print(f"worker {worker_index} : {worker_gen.remaining=}, first={worker_gen.next()}")
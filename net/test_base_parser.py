@@ -8,6 +8,7 @@ from asyncio import Queue
 from typing import Any
 
 import asyncio
+import struct
 import uuid
 
 
@@ -27,7 +28,7 @@ if (not project_folder in sys_path):
 
 
 # User's Package
-from lib.base_parser import BaseParser
+from lib.base_parser import BaseParser, ChunkBuffer, DelimiterFramer, FixedHeaderFramer, LengthPrefixFramer
 
 
 
@@ -664,6 +665,127 @@ class TestBaseParser:
 		await crashing_parser.stop()
 
 
+	@pytest.mark.asyncio
+	async def test_30_length_prefix_framer_split_and_coalesced(self):
+		"""
+		30. 길이 프리픽스 프레이머가 여러 청크로 나뉜 패킷과 한 청크에 합쳐진 여러 패킷을 모두 파싱하는지 확인합니다.
+		"""
+		class LengthParser(BaseParser):
+			framer = LengthPrefixFramer('!H')
+
+		data_queue = Queue()
+		packet_queue = Queue()
+		parser = LengthParser(uuid.uuid4(), data_queue, packet_queue)
+		parser.start()
+
+		messages = [f"packet_{i}".encode() * (i + 1) for i in range(50)]
+		stream = b''.join(struct.pack('!H', len(message)) + message for message in messages)
+		await data_queue.put(stream[:3]) # 첫 패킷의 헤더 중간에서 분할
+		await data_queue.put(stream[3:500])
+		await data_queue.put(bytearray(stream[500:]))
+		await data_queue.join()
+
+		received = []
+		while (not packet_queue.empty()):
+			_, packet = await packet_queue.get()
+			received.append(packet)
+		assert received == messages
+		assert len(parser._chunks) == 0
+		await parser.stop()
+
+	@pytest.mark.asyncio
+	async def test_31_delimiter_framer(self):
+		"""
+		31. 구분자 프레이머가 청크 경계에 걸친 구분자를 찾고, 최대 길이를 넘는 프레임은 파서를 종료하는지 확인합니다.
+		"""
+		class LineParser(BaseParser):
+			framer = DelimiterFramer(b'\r\n', max_length=64)
+
+			def handle_frame(self, frame: memoryview) -> Any:
+				return str(frame, 'utf-8')
+
+		data_queue = Queue()
+		packet_queue = Queue()
+		parser = LineParser(uuid.uuid4(), data_queue, packet_queue)
+		parser.start()
+
+		for chunk in (b"first\r", b"\nsecond\r\nthi", b"rd\r\n\r\n"):
+			await data_queue.put(chunk)
+		await data_queue.join()
+
+		received = []
+		while (not packet_queue.empty()):
+			_, packet = await packet_queue.get()
+			received.append(packet)
+		assert received == ["first", "second", "third", ""]
+
+		await data_queue.put(b"x" * 100)
+		await data_queue.join()
+		await asyncio.sleep(0.05)
+		assert parser._parse_task.done()
+
+	@pytest.mark.asyncio
+	async def test_32_fixed_header_framer_zero_copy(self):
+		"""
+		32. 고정 헤더 프레이머가 한 청크 안의 프레임을 복사 없이 memoryview로 전달하는지 확인합니다.
+		"""
+		framer = FixedHeaderFramer(3, lambda header: header[2])
+		buffer = ChunkBuffer()
+		chunk = b"\x01\x02\x03abc\x01\x02\x01z\x01"
+		buffer.append(chunk)
+
+		frame = framer.next_frame(buffer)
+		assert isinstance(frame, memoryview)
+		assert frame.obj is chunk # 수신 청크를 그대로 참조
+		assert bytes(frame) == b"\x01\x02\x03abc"
+		assert bytes(framer.next_frame(buffer)) == b"\x01\x02\x01z"
+		assert framer.next_frame(buffer) == None # 헤더가 아직 완성되지 않음
+		assert len(buffer) == 1
+
+		buffer.append(b"\x02\x00")
+		assert bytes(framer.next_frame(buffer)) == b"\x01\x02\x00"
+		assert len(buffer) == 0
+
+
+	@pytest.mark.asyncio
+	async def test_33_keepalive_build_and_intercept(self):
+		"""
+		33. build_keepalive()가 프레이머 형식의 데이터를 만들고, intercept가 True를 반환한 패킷은 패킷 큐에 넣지 않는지 확인합니다.
+		"""
+		class LengthParser(BaseParser):
+			framer = LengthPrefixFramer('!H', include_header=True)
+
+		plain = BaseParser(uuid.uuid4(), Queue(), Queue())
+		assert plain.build_keepalive(b"PING") == b"PING"
+		assert plain.is_keepalive("PING", b"PING")
+		assert not plain.is_keepalive("PONG", b"PING")
+		assert not plain.is_keepalive("PING", None)
+		assert DelimiterFramer(b'\r\n').encode(b"PING") == b"PING\r\n"
+		with pytest.raises(NotImplementedError):
+			FixedHeaderFramer(3, lambda header: header[2]).encode(b"PING")
+
+		data_queue = Queue()
+		packet_queue = Queue()
+		parser = LengthParser(uuid.uuid4(), data_queue, packet_queue)
+		ping = parser.build_keepalive(b"PING")
+		assert ping == struct.pack('!H', 4) + b"PING"
+		assert parser.is_keepalive(ping, b"PING")
+
+		intercepted = []
+		parser.intercept = lambda packet: parser.is_keepalive(packet, b"PING") and (intercepted.append(packet) or True)
+		parser.start()
+		await data_queue.put(parser.build_keepalive(b"first") + ping + parser.build_keepalive(b"second"))
+		await data_queue.join()
+
+		received = []
+		while (not packet_queue.empty()):
+			_, packet = await packet_queue.get()
+			received.append(packet[2:])
+		assert received == [b"first", b"second"]
+		assert intercepted == [ping]
+		await parser.stop()
+
+
 
 # 이 스크립트를 직접 실행하면 pytest를 통해 테스트를 실행합니다.
 if (__name__ == "__main__"):
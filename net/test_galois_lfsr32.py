@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# PyTest : FrameIdLfsr (galois_lfsr32_demo)
+# made : hbesthee@naver.com
+# date : 2026-10-18
+
+# Original Packages
+from array import array
+
+
+
+# Third-party Packages
+import pytest
+
+
+
+# User's Package 들을 포함시키기 위한 sys.path에 모듈 폴더 추가하기
+from pathlib import Path
+from sys import path as sys_path
+module_folder = str(Path(__file__).parent)
+if (not module_folder in sys_path):
+	sys_path.append(str(module_folder))
+
+
+# User's Package
+from galois_lfsr32_demo import FrameIdLfsr
+
+
+
+
+def next_ids(lfsr: FrameIdLfsr, count: int) -> list:
+	"""next()를 count 번 호출한 결과"""
+	return [lfsr.next() for _ in range(count)]
+
+
+
+class TestFrameIdLfsr:
+	"""
+	FrameIdLfsr의 jump, next_many, substream이 next()를 반복 호출한 것과 같은 순서를 만드는지 검증합니다.
+	"""
+
+	@pytest.mark.parametrize('steps', [0, 1, 2, 31, 32, 33, 1000, 65537])
+	def test_01_jump_matches_next(self, steps):
+		"""
+		01. jump(n) 후의 상태와 남은 개수가 next()를 n 번 호출한 것과 같은지 확인합니다.
+		"""
+		jumped = FrameIdLfsr(0x12345678)
+		stepped = FrameIdLfsr(0x12345678)
+		jumped.jump(steps)
+		for _ in range(steps):
+			stepped.next()
+
+		assert jumped.remaining == stepped.remaining == FrameIdLfsr.PERIOD - steps
+		assert next_ids(jumped, 5) == next_ids(stepped, 5)
+
+
+	def test_02_jump_full_period(self):
+		"""
+		02. 주기(2^32-1)만큼 진행하면 처음 상태로 돌아오고, 남은 ID가 없으면 OverflowError가 발생하는지 확인합니다.
+		"""
+		lfsr = FrameIdLfsr()
+		first = FrameIdLfsr().next()
+		assert FrameIdLfsr._advance(first, FrameIdLfsr.PERIOD) == first
+
+		lfsr.jump(FrameIdLfsr.PERIOD - 1)
+		lfsr.next()
+		assert lfsr.remaining == 0
+		with pytest.raises(OverflowError):
+			lfsr.next()
+		with pytest.raises(OverflowError):
+			lfsr.jump(1)
+		with pytest.raises(ValueError):
+			lfsr.jump(-1)
+
+
+	@pytest.mark.parametrize('count', [0, 1, 7, 1000, 4099])
+	def test_03_next_many_array(self, count):
+		"""
+		03. next_many(k)가 array('I')로 next()를 k 번 호출한 것과 같은 ID를 반환하는지 확인합니다.
+		"""
+		lfsr = FrameIdLfsr(0xCAFEBABE)
+		expected_lfsr = FrameIdLfsr(0xCAFEBABE)
+
+		result = lfsr.next_many(count)
+
+		assert isinstance(result, array)
+		assert list(result) == next_ids(expected_lfsr, count)
+		assert lfsr.remaining == expected_lfsr.remaining
+		assert lfsr.next() == expected_lfsr.next()
+
+
+	@pytest.mark.parametrize('count', [1, 2, 7, 1000, 4099, 70001])
+	def test_04_next_many_numpy(self, count):
+		"""
+		04. next_many(k, use_numpy=True)가 레인으로 나누어 계산해도 next()를 k 번 호출한 것과 같은 순서인지 확인합니다.
+		"""
+		np = pytest.importorskip('numpy')
+		lfsr = FrameIdLfsr(0xCAFEBABE)
+		expected_lfsr = FrameIdLfsr(0xCAFEBABE)
+
+		result = lfsr.next_many(count, use_numpy = True)
+
+		assert isinstance(result, np.ndarray)
+		assert result.dtype == np.uint32
+		assert result.tolist() == next_ids(expected_lfsr, count)
+		assert lfsr.remaining == expected_lfsr.remaining
+		assert lfsr.next() == expected_lfsr.next()
+
+
+	def test_05_next_many_overflow(self):
+		"""
+		05. 남은 개수보다 많이 요청하면 상태를 바꾸지 않고 OverflowError가 발생하는지 확인합니다.
+		"""
+		lfsr = FrameIdLfsr().substream(0, 1 << 20)
+		remaining = lfsr.remaining
+		with pytest.raises(OverflowError):
+			lfsr.next_many(remaining + 1)
+		assert lfsr.remaining == remaining
+		assert len(lfsr.next_many(remaining)) == remaining
+
+
+	@pytest.mark.parametrize('count', [1, 2, 3, 7, 64])
+	def test_06_substreams_do_not_overlap(self, count):
+		"""
+		06. 하위 스트림들이 주기를 빈틈없이 나누고 (각 구간의 끝이 다음 구간의 시작), 발급한 ID가 겹치지 않는지 확인합니다.
+		"""
+		base = FrameIdLfsr(0x0BADF00D)
+		streams = [base.substream(index, count) for index in range(count)]
+
+		assert sum(stream.remaining for stream in streams) == base.remaining
+		assert base.remaining == FrameIdLfsr.PERIOD # 원래 생성기의 상태는 바뀌지 않음
+		for index, stream in enumerate(streams):
+			following = streams[(index + 1) % count]
+			assert FrameIdLfsr._advance(stream._state, stream.remaining) == following._state
+
+		issued = [stream.next_many(min(1000, stream.remaining)).tolist() for stream in streams]
+		assert issued[0][:10] == next_ids(FrameIdLfsr(0x0BADF00D), 10)
+		assert len(set().union(*issued)) == sum(len(ids) for ids in issued)
+
+
+	def test_07_substream_exhausted(self):
+		"""
+		07. 하위 스트림은 할당된 구간을 모두 발급하면 OverflowError가 발생하고, 잘못된 index는 ValueError인지 확인합니다.
+		"""
+		stream = FrameIdLfsr().substream(2, 5)
+		stream.jump(stream.remaining)
+		with pytest.raises(OverflowError):
+			stream.next()
+		with pytest.raises(ValueError):
+			FrameIdLfsr().substream(5, 5)
@@ -12,6 +12,7 @@ import logging
 import os
 import ssl
 import struct
+import threading
 
 
 
@@ -30,8 +31,12 @@ if (not project_folder in sys_path):
 
 
 # User's Package
-from lib.base_parser import BaseParser
+from lib.base_parser import BaseParser, LengthPrefixFramer
+from lib.packet_dispatcher import PacketDispatcher
 from lib.tls_tcp6 import TlsTcp6Client, TlsTcp6Def, TlsTcp6Key, TlsTcp6Server, TlsTcp6Socket
+from lib.tls_tcp6_logging import QueueLogWriter
+from lib.tls_tcp6_metrics import MetricsExporter, MetricsHooks, to_prometheus
+from lib.tls_tcp6_supervisor import TlsTcp6Supervisor
 
 
 
@@ -344,24 +349,7 @@ class TestResourceManagement:
 ### 테스트를 위한 커스텀 파서 정의
 class LengthPrefixedParser(BaseParser):
 	"""[4바이트 길이값][데이터] 형식의 메시지를 파싱하는 커스텀 파서"""
-	def parse(self) -> list[bytes] | None:
-		packets = []
-		while True:
-			if len(self._buf) < 4:
-				break # 길이 정보를 읽을 수 없음
-
-			msg_len = struct.unpack('!I', self._buf[:4])[0]
-
-			if len(self._buf) < 4 + msg_len:
-				break # 전체 메시지가 아직 도착하지 않음
-
-			packet = self._buf[:4 + msg_len]
-			packets.append(bytes(packet))
-
-			# 처리된 메시지를 버퍼에서 제거
-			del self._buf[:4 + msg_len]
-
-		return packets if packets else None
+	framer = LengthPrefixFramer('!I', include_header=True)
 
 
 
@@ -578,6 +566,452 @@ class TestExtraCases:
 
 
 
+@pytest.mark.parametrize("server", [{"parser_class": LengthPrefixedParser, "direct_parse": True}], indirect=True)
+class TestDirectParse:
+	"""수신 큐와 파서 태스크 없이 수신 콜백에서 바로 파싱하는 direct_parse 모드 검증"""
+
+	@pytest.mark.asyncio
+	async def test_direct_parse_echo(self, server: TlsTcp6Server, client_factory):
+		"""30. direct_parse 모드의 서버/클라이언트 사이에서 나뉘거나 합쳐진 패킷이 정상적으로 에코되는지 검증"""
+		client = await client_factory(server.port, parser_class=LengthPrefixedParser, direct_parse=True)
+		await client.start()
+		await wait_for_client_count(server, 1)
+		assert client._rx_stream is None
+		assert client._parser._parse_task is None # 파서 태스크를 사용하지 않음
+
+		packets = [struct.pack('!I', len(message)) + message for message in (b"first", b"second" * 1000, b"third")]
+		stream = b''.join(packets)
+		await client.send(stream[:3])
+		await asyncio.sleep(0.05)
+		await client.send(stream[3:])
+
+		received = [(await asyncio.wait_for(client.packet_queue.get(), timeout=2.0))[1] for _ in packets]
+		assert received == packets
+
+
+	@pytest.mark.asyncio
+	async def test_direct_parse_disconnect(self, server: TlsTcp6Server, client_factory):
+		"""31. direct_parse 모드에서 클라이언트 종료 시 서버의 클라이언트 목록에서 제거되는지 검증"""
+		client = await client_factory(server.port, parser_class=LengthPrefixedParser, direct_parse=True)
+		await client.start()
+		await wait_for_client_count(server, 1)
+
+		await client.close()
+		await wait_for_client_count(server, 0)
+		assert client._tx_stream.is_closing()
+
+
+
+
+@pytest.mark.parametrize("server", [{"parser_class": LengthPrefixedParser}], indirect=True)
+class TestTxBatch:
+	"""송신 큐 메시지를 모아 writelines()로 한 번에 송신하는 배치 및 흐름 제어 검증"""
+
+	@pytest.mark.asyncio
+	async def test_tx_batch_coalescing(self, server: TlsTcp6Server, client_factory):
+		"""32. 연속 송신한 메시지들이 더 적은 횟수로 묶여 송신되고 순서대로 에코되는지 검증"""
+		client = await client_factory(server.port, parser_class=LengthPrefixedParser, tx_max_batch=50, tx_linger=0.01)
+		await client.start()
+		await wait_for_client_count(server, 1)
+
+		packets = [struct.pack('!I', 4) + index.to_bytes(4, 'big') for index in range(200)]
+		for packet in packets:
+			await client.send(packet)
+
+		received = [(await asyncio.wait_for(client.packet_queue.get(), timeout=2.0))[1] for _ in packets]
+		assert received == packets
+
+		stats = client.get_tx_stats()
+		assert stats['records'] == len(packets)
+		assert stats['bytes'] == sum(len(packet) for packet in packets)
+		assert stats['flush_count'] < len(packets)
+		assert stats['max_records_per_flush'] <= 50
+		assert stats['records_per_flush'] > 1
+		assert stats['pending_bytes'] == 0
+
+
+	@pytest.mark.asyncio
+	async def test_tx_high_water_backpressure(self, server: TlsTcp6Server, client_factory):
+		"""33. 송신 대기 바이트가 상한을 넘으면 send()가 대기하고, 송신이 진행되면 대기가 해제되는지 검증"""
+		client = await client_factory(server.port, parser_class=LengthPrefixedParser, tx_high_water=100, tx_low_water=10)
+		packet = struct.pack('!I', 96) + b'x' * 96
+
+		# 송신 핸들러 시작 전이므로 대기 바이트가 줄어들지 않음
+		await client.send(packet)
+		blocked = asyncio.create_task(client.send(packet))
+		await asyncio.sleep(0.05)
+		assert not blocked.done()
+
+		await client.start()
+		await asyncio.wait_for(blocked, timeout=2.0)
+		for _ in range(2):
+			_, received = await asyncio.wait_for(client.packet_queue.get(), timeout=2.0)
+			assert received == packet
+		assert client.get_tx_stats()['send_wait_count'] == 1
+
+
+
+
+class TestSupervisor:
+	"""SO_REUSEPORT로 같은 포트를 공유하는 다중 프로세스 서버 관리자 검증"""
+
+	@pytest.mark.asyncio
+	async def test_supervisor_workers_and_restart(self, certs, unused_tcp_port: int, client_factory):
+		"""34. 작업 프로세스들이 같은 포트에서 에코하고, 통계가 합산되며, 순차 재시작 후에도 연결을 받는지 검증"""
+		supervisor = TlsTcp6Supervisor(
+			server_kwargs={
+				'cert_file': certs["server_cert"],
+				'key_file': certs["server_key"],
+				'ca_file': certs["ca"],
+				'host': "::1",
+				'port': unused_tcp_port,
+				'parser_class': BaseParser,
+			},
+			workers=2, stats_interval=0.1, drain_timeout=0.5
+		)
+		assert await asyncio.to_thread(supervisor.start)
+		try:
+			clients = []
+			for index in range(4):
+				client = await client_factory(unused_tcp_port)
+				await client.start()
+				await client.send(f"hello {index}".encode())
+				_, received = await asyncio.wait_for(client.packet_queue.get(), timeout=2.0)
+				assert received == f"hello {index}"
+				clients.append(client)
+
+			await asyncio.sleep(0.3)
+			stats = supervisor.get_stats()
+			assert (stats['workers'], stats['alive']) == (2, 2)
+			assert stats['accepted'] == 4
+			assert len({worker['pid'] for worker in stats['per_worker']}) == 2
+
+			old_pids = {worker['pid'] for worker in stats['per_worker']}
+			assert await asyncio.to_thread(supervisor.restart)
+			stats = supervisor.get_stats()
+			assert stats['restarts'] == 1
+			assert old_pids.isdisjoint({worker['pid'] for worker in stats['per_worker']})
+
+			client = await client_factory(unused_tcp_port)
+			await client.start()
+			await client.send(b"after restart")
+			_, received = await asyncio.wait_for(client.packet_queue.get(), timeout=2.0)
+			assert received == "after restart"
+		finally:
+			await asyncio.to_thread(supervisor.stop)
+		assert supervisor.get_stats()['workers'] == 0
+
+
+
+
+async def slow_echo(uuid: UUID, packet: str) -> str:
+	"""'slow' 패킷만 늦게 응답하는 비동기 패킷 처리 함수"""
+	if (packet == "slow"):
+		await asyncio.sleep(1.0)
+	return packet
+
+
+def thread_name_reply(uuid: UUID, packet: str) -> str:
+	"""실행된 스레드 이름을 응답하는 동기(CPU 작업용) 패킷 처리 함수"""
+	return threading.current_thread().name
+
+
+class TestDispatcher:
+	"""클라이언트별 순서를 보장하는 패킷 분배기 검증"""
+
+	@pytest.mark.asyncio
+	async def test_dispatcher_round_robin(self):
+		"""35. 동시 처리 1개에서도 레인마다 quantum 개씩 번갈아 처리하고 레인 내 순서를 유지하는지 검증"""
+		handled = []
+		async def handler(uuid, packet):
+			handled.append((uuid, packet))
+
+		dispatcher = PacketDispatcher(handler, concurrency=1, quantum=1)
+		for index in range(3):
+			dispatcher.put_nowait(("a", index))
+		for index in range(2):
+			dispatcher.put_nowait(("b", index))
+		assert dispatcher.get_stats()['queue_depth'] == {"a": 3, "b": 2}
+
+		dispatcher.start()
+		while (not dispatcher.empty() or (len(handled) < 5)):
+			await asyncio.sleep(0.01)
+		await dispatcher.stop()
+		assert handled == [("a", 0), ("b", 0), ("a", 1), ("b", 1), ("a", 2)]
+		assert dispatcher.get_stats()['dispatched'] == 5
+
+
+	@pytest.mark.asyncio
+	@pytest.mark.parametrize("server", [{"dispatch": True, "packet_handler": slow_echo}], indirect=True)
+	async def test_dispatch_slow_client_does_not_block(self, server: TlsTcp6Server, client_factory):
+		"""36. 한 클라이언트의 느린 처리가 다른 클라이언트를 막지 않고, 클라이언트별 응답 순서는 유지되는지 검증"""
+		slow_client = await client_factory(server.port)
+		fast_client = await client_factory(server.port)
+		await slow_client.start()
+		await fast_client.start()
+		await wait_for_client_count(server, 2)
+
+		await slow_client.send(b"slow")
+		await asyncio.sleep(0.1)
+		await slow_client.send(b"next")
+		await fast_client.send(b"fast")
+
+		_, received = await asyncio.wait_for(fast_client.packet_queue.get(), timeout=0.5)
+		assert received == "fast"
+		assert sorted(server.get_stats()['queue_depth'].values()) == [0, 1] # 느린 클라이언트의 'next'만 대기 중
+
+		# 기본 파서는 경계 구분이 없으므로 연속 응답이 합쳐질 수 있음
+		received = ""
+		while (len(received) < len("slownext")):
+			received += (await asyncio.wait_for(slow_client.packet_queue.get(), timeout=2.0))[1]
+		assert received == "slownext"
+
+
+	@pytest.mark.asyncio
+	@pytest.mark.parametrize("server", [{"dispatch": True, "packet_handler": thread_name_reply}], indirect=True)
+	async def test_dispatch_sync_handler_in_executor(self, server: TlsTcp6Server, client_factory):
+		"""37. 일반 함수 패킷 처리기는 스레드 풀에서 실행되고 응답이 클라이언트로 송신되는지 검증"""
+		client = await client_factory(server.port)
+		await client.start()
+		await wait_for_client_count(server, 1)
+
+		await client.send(b"work")
+		_, received = await asyncio.wait_for(client.packet_queue.get(), timeout=2.0)
+		assert received.startswith("PacketDispatcher")
+		assert server.get_stats()['dispatched'] == 1
+
+
+
+
+class TestIdleTimer:
+	"""타이머 힙 기반 유휴 연결 정리 및 keepalive 검증"""
+
+	@pytest.mark.asyncio
+	async def test_per_client_idle_timeout(self, server: TlsTcp6Server, client_factory):
+		"""38. 클라이언트별 유휴 종료 시간이 다른 클라이언트에 영향 없이 정확한 시각에 적용되는지 검증"""
+		short_client = await client_factory(server.port)
+		await short_client.start()
+		await wait_for_client_count(server, 1)
+		short_uuid = next(iter(server._clients))
+
+		long_client = await client_factory(server.port)
+		await long_client.start()
+		await wait_for_client_count(server, 2)
+
+		start_time = asyncio.get_running_loop().time()
+		assert server.set_idle_timeout(short_uuid, 0.3)
+		await wait_for_client_count(server, 1)
+		elapsed = asyncio.get_running_loop().time() - start_time
+		assert 0.25 <= elapsed < 1.0 # 기본 유휴 시간(5초)의 주기 검사가 아닌 만료 시각에 종료
+		assert short_uuid not in server._clients
+		assert not long_client._is_closing
+
+
+	@pytest.mark.asyncio
+	@pytest.mark.parametrize("server", [
+		{"idle_timeout": 1, "keepalive_interval": 0.3},
+		{"idle_timeout": 1, "keepalive_interval": 0.3, "parser_class": LengthPrefixedParser},
+		{"idle_timeout": 1, "keepalive_interval": 0.3, "parser_class": LengthPrefixedParser, "direct_parse": True},
+	], indirect=True, ids=["default", "length_prefix", "length_prefix_direct"])
+	async def test_keepalive_ping_pong(self, server: TlsTcp6Server, client_factory):
+		"""39. 유휴 클라이언트에게 파서 형식의 ping을 보내고, 클라이언트의 자동 pong으로 연결이 유지되며 응답이 없으면 종료되는지 검증"""
+		parser_class = server._parser_class
+		client = await client_factory(server.port, parser_class=parser_class)
+		await client.start()
+		await wait_for_client_count(server, 1)
+		server_socket = next(iter(server._clients.values()))
+
+		await asyncio.sleep(1.5) # idle_timeout(1초)보다 길게 대기: 자동 pong으로 연결 유지
+		assert len(server._clients) == 1
+		assert server_socket._last_ping_time > 0
+		assert client.packet_queue.empty() # ping은 패킷 큐에 넣지 않고, pong은 에코되지 않음
+
+		message = client._parser.build_keepalive(b"after keepalive") # 일반 패킷도 같은 형식으로 송수신됨
+		await client.send(message)
+		_, packet = await asyncio.wait_for(client.packet_queue.get(), timeout=1.0)
+		expected = message.decode() if (parser_class is BaseParser) else message
+		assert packet == expected
+
+		silent = await client_factory(server.port, parser_class=parser_class, keepalive_ping=None) # 자동 응답 안 함
+		await silent.start()
+		await wait_for_client_count(server, 2)
+		_, packet = await asyncio.wait_for(silent.packet_queue.get(), timeout=1.0)
+		assert silent._parser.is_keepalive(packet, b"PING") # 파서 형식(길이 헤더 포함)의 ping 수신
+		await wait_for_client_count(server, 1, timeout=2.0) # pong이 없으면 idle_timeout 후 종료
+		assert not client._is_closing
+
+
+
+
+class TestReconnect:
+	"""SSLContext 캐시, TLS 세션 재사용, 자동 재연결 검증"""
+
+	@pytest.mark.asyncio
+	async def test_tls_session_resumption(self, server: TlsTcp6Server, client_factory):
+		"""40. 같은 인증서의 클라이언트는 SSLContext를 공유하고, 재연결 시 TLS 세션을 재사용하는지 검증"""
+		TlsTcp6Socket.clear_ssl_context_cache()
+		first = await client_factory(server.port)
+		assert await first.start()
+		await first.send(b"ticket")
+		await asyncio.wait_for(first.packet_queue.get(), timeout=2.0) # 데이터 수신 시 TLS 1.3 세션 티켓도 수신됨
+		await first.close()
+		assert first.get_connection_stats()['tls_resumed'] == 0
+
+		second = await client_factory(server.port)
+		assert await second.start()
+		assert second._get_ssl_context() is first._get_ssl_context()
+		assert second.get_connection_stats()['tls_resumed'] == 1
+		assert second.get_connection_stats()['last_handshake_ms'] > 0
+		await wait_for_client_count(server, 1)
+		assert server.get_stats()['tls_resumed'] == 1
+
+
+	@pytest.mark.asyncio
+	async def test_run_forever_reconnects(self, server: TlsTcp6Server, client_factory):
+		"""41. 서버가 연결을 끊으면 백오프 후 다시 연결하고, stop() 호출 시 재연결을 멈추는지 검증"""
+		client = await client_factory(server.port, reconnect_min_delay=0.05, reconnect_max_delay=0.2)
+		run_task = asyncio.create_task(client.run_forever())
+		await wait_for_client_count(server, 1)
+
+		await next(iter(server._clients.values())).close()
+		waited = 0
+		while (client.get_connection_stats()['connect_count'] < 2):
+			await asyncio.sleep(0.01)
+			waited += 0.01
+			assert waited < 3.0, "재연결되지 않았습니다."
+		await wait_for_client_count(server, 1)
+
+		await client.send(b"again")
+		_, received = await asyncio.wait_for(client.packet_queue.get(), timeout=2.0)
+		assert received == "again"
+		stats = client.get_connection_stats()
+		assert stats['reconnect_count'] == 1
+
+		await client.stop()
+		await asyncio.wait_for(run_task, timeout=1.0)
+		await wait_for_client_count(server, 0)
+
+
+
+
+class TestMetrics:
+	"""연결 계측 훅 및 Prometheus / JSON 내보내기 검증"""
+
+	@pytest.mark.asyncio
+	@pytest.mark.parametrize("server", [{"hooks": MetricsHooks()}, {"hooks": MetricsHooks(), "direct_parse": True}], indirect=True)
+	async def test_server_metrics_hooks(self, server: TlsTcp6Server, client_factory):
+		"""42. 서버에 지정한 훅이 클라이언트 연결별 송수신 바이트/패킷 수, 파싱 시간, 핸드셰이크 시간을 수집하고, 종료 후에도 누적되는지 검증"""
+		hooks: MetricsHooks = server._hooks
+		client = await client_factory(server.port)
+		await client.start()
+		await wait_for_client_count(server, 1)
+
+		await client.send(b"metrics")
+		_, received = await asyncio.wait_for(client.packet_queue.get(), timeout=2.0)
+		assert received == "metrics"
+
+		snapshot = hooks.snapshot(per_connection=True)
+		assert snapshot['connections'] == 1
+		assert snapshot['bytes_in'] == len(b"metrics")
+		assert snapshot['bytes_out'] == len(b"metrics")
+		assert snapshot['packets_in'] == 1
+		assert snapshot['packets_out'] == 1
+		assert snapshot['parse_seconds']['count'] >= 1
+		assert snapshot['handshake_seconds']['count'] == 1 # 서버 측 핸드셰이크 시간
+		assert snapshot['connections_detail'][0]['bytes_in'] == len(b"metrics")
+
+		await client.close()
+		await wait_for_client_count(server, 0)
+		snapshot = hooks.snapshot()
+		assert (snapshot['connections'], snapshot['disconnect_count']) == (0, 1)
+		assert snapshot['bytes_in'] == len(b"metrics") # 종료된 연결의 값이 누적 합계에 남음
+
+		text = to_prometheus(snapshot)
+		assert f"tls_tcp6_received_bytes_total {len(b'metrics')}" in text
+		assert 'tls_tcp6_parse_seconds_bucket{le="+Inf"}' in text
+
+
+	@pytest.mark.asyncio
+	async def test_metrics_exporter_http(self, server: TlsTcp6Server, client_factory, unused_tcp_port_factory):
+		"""43. 클라이언트 훅이 연결 시간을 기록하고, MetricsExporter의 HTTP 엔드포인트가 Prometheus 형식을 응답하는지 검증"""
+		hooks = MetricsHooks()
+		client = await client_factory(server.port, hooks=hooks)
+		assert await client.start()
+		assert hooks.snapshot()['handshake_seconds']['count'] == 1
+
+		exporter = MetricsExporter(hooks, server=server)
+		port = unused_tcp_port_factory()
+		await exporter.start_http('::1', port)
+		try:
+			reader, writer = await asyncio.open_connection('::1', port)
+			writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+			await writer.drain()
+			response = (await asyncio.wait_for(reader.read(), timeout=2.0)).decode()
+			writer.close()
+		finally:
+			await exporter.stop_http()
+
+		assert response.startswith("HTTP/1.1 200 OK")
+		assert "tls_tcp6_handshake_seconds_count 1" in response
+		assert "tls_tcp6_server_clients 1" in response
+
+
+
+
+class TestLogging:
+	"""연결별 로거 어댑터, 패킷 기록 샘플링, 이벤트 루프 밖 로그 기록기 검증"""
+
+	@pytest.mark.asyncio
+	@pytest.mark.parametrize("server", [{"log_packet_sample": 2}], indirect=True)
+	async def test_connection_logger_and_packet_sampling(self, server: TlsTcp6Server, client_factory, caplog):
+		"""44. 연결마다 공유 로거의 이름을 바꾸지 않고, 패킷은 N개마다 1개만 DEBUG로 기록되는지 검증"""
+		caplog.set_level(logging.DEBUG, logger=TlsTcp6Def.LOGGER_NAME)
+		client = await client_factory(server.port)
+		await client.start()
+		await wait_for_client_count(server, 1)
+		assert logging.getLogger(TlsTcp6Def.LOGGER_NAME).name == TlsTcp6Def.LOGGER_NAME
+
+		for index in range(4):
+			await client.send(f"log{index}".encode())
+			await asyncio.wait_for(client.packet_queue.get(), timeout=2.0)
+
+		client_uuid = str(next(iter(server._clients)))
+		records = [record for record in caplog.records if (getattr(record, 'direction', None) == 'echo')]
+		assert [record.conn for record in records] == [client_uuid, client_uuid]
+		assert "'log1'" in records[0].getMessage() and "'log3'" in records[1].getMessage()
+		assert records[0].getMessage().startswith(f"[{client_uuid}]")
+
+
+	@pytest.mark.asyncio
+	async def test_queue_log_writer(self):
+		"""45. QueueLogWriter가 로그 기록을 리스너 스레드에서 처리하고, 종료 시 기존 핸들러를 복원하는지 검증"""
+		class ThreadRecorder(logging.Handler):
+			def __init__(self):
+				super().__init__()
+				self.records = []
+
+			def emit(self, record: logging.LogRecord):
+				self.records.append((threading.current_thread().name, self.format(record)))
+
+		logger = logging.getLogger('test_queue_log_writer')
+		logger.setLevel(logging.INFO)
+		recorder = ThreadRecorder()
+		logger.addHandler(recorder)
+		writer = QueueLogWriter([logger.name])
+		writer.start()
+		try:
+			assert logger.handlers != [recorder]
+			logger.info("queued %d", 1)
+		finally:
+			writer.stop()
+
+		assert logger.handlers == [recorder]
+		assert recorder.records[0][1] == "queued 1"
+		assert recorder.records[0][0] != threading.current_thread().name
+		assert writer.dropped == 0
+
+
+
 # 이 스크립트를 직접 실행하면 pytest를 통해 테스트를 실행합니다.
 if (__name__ == "__main__"):
 	pytest.main(["-v", "-s", __file__])
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# SqliteReplicationManager 수집(ingestion) 및 조회 처리량 벤치마크
+# made : hbesthee@naver.com
+# date : 2026-10-18
+#
+# 사용 예:
+#	python pkg/PyTest/bench-sqlite_replication_manager.py --producers 4 --rows 5000 --row-size 256 \
+#		--journal-mode WAL --synchronous NORMAL --output result.json
+#
+# 결과는 JSON으로 출력되므로 커밋 사이의 결과를 비교할 수 있습니다.
+
+# Original Packages
+from argparse import ArgumentParser, Namespace
+from datetime import date, datetime
+from os import path, urandom
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from time import perf_counter
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import json
+import logging
+import platform
+import sqlite3
+import subprocess
+
+
+
+# User's Package 들을 포함시키기 위한 sys.path에 프로젝트 폴더 추가하기
+from pathlib import Path
+from sys import path as sys_path
+project_folder = str(Path(__file__).parent.parent.parent)
+if (not project_folder in sys_path):
+	sys_path.append(str(project_folder))
+
+
+# User's Package
+from lib.sqlite_replication_manager import ReplicationMode, RetentionPeriod, SqliteReplicationManager
+
+
+
+TABLE_SCHEMA = "CREATE TABLE IF NOT EXISTS BENCH (id INTEGER PRIMARY KEY, producer INTEGER, seq INTEGER, payload BLOB)"
+SQL_INSERT = "INSERT INTO BENCH (producer, seq, payload) VALUES (?, ?, ?)"
+SQL_SELECT = "SELECT COUNT(*), MAX(seq) FROM BENCH WHERE producer = ?"
+
+
+
+def get_git_revision() -> str:
+	"""현재 커밋 해시 (git 저장소가 아니면 빈 문자열)"""
+	try:
+		return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_folder,
+				stderr=subprocess.DEVNULL).decode().strip()
+	except Exception:
+		return ''
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+	"""지연 시간 목록의 백분위 (ms)"""
+	if (not values):
+		return {'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+	values = sorted(values)
+	pick = lambda percent: values[min(len(values) - 1, int(len(values) * percent / 100))]
+	return {'p50': pick(50), 'p90': pick(90), 'p99': pick(99), 'max': values[-1]}
+
+
+def run_producer(manager: SqliteReplicationManager, producer: int, rows: int, payload: bytes):
+	"""execute_statement()로 rows 개의 행을 입력"""
+	for seq in range(rows):
+		manager.execute_statement('insert', (producer, seq, payload))
+
+
+def run_reader(manager: SqliteReplicationManager, producers: int, stop_event: Event, latencies: List[float]):
+	"""stop_event가 설정될 때까지 query()를 반복 실행하며 지연 시간 기록"""
+	producer = 0
+	while (not stop_event.is_set()):
+		start_time = perf_counter()
+		with manager.query(SQL_SELECT, (producer,)) as cursor:
+			cursor.fetchone()
+		latencies.append((perf_counter() - start_time) * 1000.0)
+		producer = (producer + 1) % producers
+
+
+def measure_rotation(manager: SqliteReplicationManager, timeout: float) -> Dict[str, Any]:
+	"""날짜를 다음 달로 바꾸어 월별 로테이션을 유도하고 완료까지 걸린 시간과 메인 DB 교체 중단 시간 측정"""
+	today = date.today()
+	next_month = date(today.year + 1, 1, 1) if (today.month == 12) else date(today.year, today.month + 1, 1)
+
+	class NextMonthDate(date):
+		@classmethod
+		def today(cls):
+			return next_month
+
+	start_time = perf_counter()
+	with patch('lib.sqlite_replication_manager.date', NextMonthDate):
+		manager._prev_check_time = 0
+		# 로테이션 시작(백업 파일 전환)을 확인한 뒤, 메인 DB 교체까지 끝났다는 신호를 기다림
+		while ((perf_counter() - start_time) < timeout):
+			if (manager.backup_db_path.endswith(f"{next_month.strftime('%Y%m')}.db")):
+				break
+			Event().wait(0.01)
+		manager._rotation_finished.wait(max(0.0, timeout - (perf_counter() - start_time)))
+
+	return {
+		'rotation_seconds': perf_counter() - start_time,
+		'rotation_pause_ms': manager.get_stats()['last_rotation_pause_ms'],
+	}
+
+
+def run_benchmark(args: Namespace) -> Dict[str, Any]:
+	"""설정에 따라 벤치마크를 1회 실행하고 결과 반환"""
+	payload = urandom(args.row_size)
+	with TemporaryDirectory() as temp_dir:
+		manager = SqliteReplicationManager(
+			db_name="bench",
+			db_folder=path.join(temp_dir, "db"),
+			backup_folder=path.join(temp_dir, "backup"),
+			table_schema=TABLE_SCHEMA,
+			retention_period=RetentionPeriod.ONE_YEAR if args.rotation else RetentionPeriod.UNLIMITED,
+			batch_max_size=args.batch_max_size,
+			batch_max_wait_ms=args.batch_max_wait_ms,
+			read_pool_size=max(1, args.readers),
+			queue_max_size=args.queue_max_size,
+			replication_mode=ReplicationMode(args.replication_mode),
+			statements={'insert': SQL_INSERT},
+			journal_mode=args.journal_mode,
+			synchronous=args.synchronous
+		)
+		try:
+			stop_event = Event()
+			read_latencies = []
+			readers = [Thread(target=run_reader, args=(manager, args.producers, stop_event, read_latencies), daemon=True)
+					for _ in range(args.readers)]
+			producers = [Thread(target=run_producer, args=(manager, producer, args.rows, payload), daemon=True)
+					for producer in range(args.producers)]
+
+			start_time = perf_counter()
+			for thread in readers + producers:
+				thread.start()
+			for thread in producers:
+				thread.join()
+			enqueue_seconds = perf_counter() - start_time
+			manager._execute_queue.join()
+			ingest_seconds = perf_counter() - start_time
+
+			stop_event.set()
+			for thread in readers:
+				thread.join()
+
+			total_rows = args.producers * args.rows
+			stats = manager.get_stats()
+			result = {
+				'total_rows': total_rows,
+				'enqueue_seconds': enqueue_seconds,
+				'ingest_seconds': ingest_seconds,
+				'rows_per_second': total_rows / ingest_seconds if ingest_seconds else 0.0,
+				'commit_latency_ms': stats['commit_latency_ms'],
+				'avg_batch_size': stats['avg_batch_size'],
+				'query_count': len(read_latencies),
+				'queries_per_second': len(read_latencies) / ingest_seconds if ingest_seconds else 0.0,
+				'query_latency_ms': percentiles(read_latencies),
+			}
+
+			if (args.rotation):
+				result.update(measure_rotation(manager, args.rotation_timeout))
+			return result
+
+		finally:
+			manager.close()
+
+
+def main():
+	parser = ArgumentParser(description="SqliteReplicationManager ingestion/query benchmark")
+	parser.add_argument('--producers', type=int, default=4, help='execute()를 호출하는 생산자 스레드 수')
+	parser.add_argument('--readers', type=int, default=2, help='query()를 호출하는 조회 스레드 수')
+	parser.add_argument('--rows', type=int, default=5000, help='생산자 스레드 하나가 입력할 행 수')
+	parser.add_argument('--row-size', type=int, default=128, help='행 하나의 payload 크기 (bytes)')
+	parser.add_argument('--journal-mode', default='WAL', help='PRAGMA journal_mode')
+	parser.add_argument('--synchronous', default='NORMAL', help='PRAGMA synchronous')
+	parser.add_argument('--batch-max-size', type=int, default=100, help='그룹 커밋 최대 작업 수')
+	parser.add_argument('--batch-max-wait-ms', type=float, default=2.0, help='그룹 커밋 최대 대기 시간 (ms)')
+	parser.add_argument('--queue-max-size', type=int, default=0, help='execute 큐 최대 크기 (0: 무제한)')
+	parser.add_argument('--replication-mode', choices=[mode.value for mode in ReplicationMode], default=ReplicationMode.SYNC.value,
+			help='백업 DB 복제 방식')
+	parser.add_argument('--rotation', action='store_true', help='수집 후 월별 로테이션 시간과 메인 DB 교체 중단 시간 측정')
+	parser.add_argument('--rotation-timeout', type=float, default=60.0, help='로테이션 완료 대기 최대 시간 (초)')
+	parser.add_argument('--repeat', type=int, default=1, help='반복 실행 횟수')
+	parser.add_argument('--output', help='결과 JSON 파일 경로 (생략 시 표준 출력)')
+	args = parser.parse_args()
+
+	logging.getLogger('lib.sqlite_replication_manager').setLevel(logging.WARNING)
+
+	report = {
+		'timestamp': datetime.now().isoformat(),
+		'revision': get_git_revision(),
+		'python': platform.python_version(),
+		'sqlite': sqlite3.sqlite_version,
+		'config': {key: value for key, value in vars(args).items() if (key != 'output')},
+		'runs': [run_benchmark(args) for _ in range(max(1, args.repeat))],
+	}
+
+	text = json.dumps(report, indent=2)
+	if (args.output):
+		with open(args.output, 'w', encoding='utf-8') as f:
+			f.write(text)
+	else:
+		print(text)
+
+
+if __name__ == "__main__":
+	main()
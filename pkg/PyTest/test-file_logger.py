@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+# file_logger 모듈 단위 시험
+# made : hbesthee@naver.com
+# date : 2025-06-20
+
+# Original Packages
+from datetime import datetime
+from logging import getLogger, makeLogRecord, DEBUG, INFO, WARNING
+from logging.handlers import TimedRotatingFileHandler
+from multiprocessing import get_context
+from queue import Queue
+from shutil import rmtree
+from time import sleep, time
+
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+
+
+# Third-party Packages
+import pytest
+
+
+
+# User's Package 들을 포함시키기 위한 sys.path에 프로젝트 폴더 추가하기
+from pathlib import Path
+from sys import path as sys_path
+project_folder = str(Path(__file__).parent.parent.parent)
+if (not project_folder in sys_path):
+	sys_path.append(str(project_folder))
+
+
+# User's Package
+from lib.file_logger import _queue_listeners, closeLogger, createLogger, DropQueueHandler, JsonLinesFormatter, LogCollector, LOG_FORMAT_JSON
+from lib.log_index import build_index, load_index, query
+
+
+
+def make_record(msg: str):
+	return makeLogRecord(dict(name = 'drop_test', levelno = INFO, levelname = 'INFO', msg = msg))
+
+
+def forward_log_lines(queue, log_path: str, worker_id: int):
+	""" (자식 프로세스) LogCollector 큐로 로그 레코드를 보냄 """
+	log = createLogger(log_path = log_path, log_filename = 'collector', log_level = INFO, log_console = False
+			, logger_name = 'collector_test', log_format = '%(message)s', log_collector = queue)
+	for index in range(100):
+		log.info('worker %d line %d', worker_id, index)
+
+
+def read_lines(file_path: str):
+	with open(file_path, 'r', encoding = 'utf-8') as f:
+		return f.read().splitlines()
+
+
+
+class TestFileLogger:
+
+	@pytest.fixture
+	def temp_dir(self):
+		"""임시 디렉토리 생성"""
+		temp_dir = tempfile.mkdtemp()
+		yield temp_dir
+		rmtree(temp_dir, ignore_errors = True)
+
+
+	def test_drop_policy_new(self):
+		"""큐가 가득 차면 새 레코드를 버림"""
+		queue = Queue(2)
+		handler = DropQueueHandler(queue, DropQueueHandler.DROP_NEW)
+		for msg in ('first', 'second', 'third'):
+			handler.handle(make_record(msg))
+
+		assert handler.dropped == 1
+		assert [queue.get_nowait().msg for _ in range(queue.qsize())] == ['first', 'second']
+
+
+	def test_drop_policy_old(self):
+		"""큐가 가득 차면 가장 오래된 레코드를 버리고 새 레코드를 넣음"""
+		queue = Queue(2)
+		handler = DropQueueHandler(queue, DropQueueHandler.DROP_OLD)
+		for msg in ('first', 'second', 'third'):
+			handler.handle(make_record(msg))
+
+		assert handler.dropped == 1
+		assert [queue.get_nowait().msg for _ in range(queue.qsize())] == ['second', 'third']
+
+
+	def test_drop_policy_invalid(self):
+		"""알 수 없는 drop_policy는 ValueError"""
+		with pytest.raises(ValueError):
+			DropQueueHandler(Queue(2), 'oldest')
+
+
+	def test_close_logger_flushes_batch(self, temp_dir):
+		"""flush_interval이 지나지 않아도 closeLogger()가 큐에 남은 레코드를 모두 기록하고 리스너를 정리"""
+		logger_name = 'batch_close_test'
+		log = createLogger(log_path = temp_dir, log_filename = 'batch', log_level = INFO, log_console = False
+				, logger_name = logger_name, log_format = '%(message)s', log_queue = True, flush_interval = 60.0, batch_size = 16)
+		for index in range(500):
+			log.info('line %d', index)
+
+		closeLogger(logger_name)
+
+		assert read_lines(os.path.join(temp_dir, 'batch.log')) == [f'line {index}' for index in range(500)]
+		assert logger_name not in _queue_listeners
+		assert len(getLogger(logger_name).handlers) == 0
+
+
+	def test_close_logger_drop_old_full_queue(self, temp_dir):
+		"""DROP_OLD 큐가 가득 찬 상태에서 닫아도 종료 표시가 버려지지 않고 리스너가 종료됨"""
+		logger_name = 'batch_close_drop_old_test'
+		log = createLogger(log_path = temp_dir, log_filename = 'drop_old', log_level = INFO, log_console = False
+				, logger_name = logger_name, log_format = '%(message)s', log_queue = True, queue_max_size = 4
+				, drop_policy = DropQueueHandler.DROP_OLD, flush_interval = 60.0)
+		listener = _queue_listeners[logger_name]
+		for index in range(200):
+			log.info('line %d', index)
+
+		closeLogger(logger_name)
+
+		assert listener._thread == None
+		lines = read_lines(os.path.join(temp_dir, 'drop_old.log'))
+		assert lines[-1] == 'line 199'
+
+
+	def test_atexit_drains_queue(self, temp_dir):
+		"""closeLogger()를 호출하지 않고 종료해도 atexit에서 큐에 남은 레코드를 기록"""
+		script = (
+			'import sys\n'
+			f'sys.path.insert(0, {project_folder!r})\n'
+			'from logging import INFO\n'
+			'from lib.file_logger import createLogger\n'
+			f'log = createLogger(log_path = {temp_dir!r}, log_filename = "atexit", log_level = INFO, log_console = False'
+			', logger_name = "atexit_test", log_format = "%(message)s", log_queue = True, flush_interval = 60.0)\n'
+			'for index in range(1000):\n'
+			'	log.info("line %d", index)\n'
+		)
+		subprocess.run([sys.executable, '-c', script], check = True, timeout = 60)
+
+		assert read_lines(os.path.join(temp_dir, 'atexit.log')) == [f'line {index}' for index in range(1000)]
+
+
+	def test_log_collector_writes_child_records(self, temp_dir):
+		"""자식 프로세스가 LogForwardHandler로 보낸 레코드를 LogCollector 프로세스가 파일로 기록"""
+		collector = LogCollector(start_method = 'fork')
+		collector.start()
+		try:
+			workers = [get_context('fork').Process(target = forward_log_lines, args = (collector.queue, temp_dir, worker_id))
+					for worker_id in range(2)]
+			for worker in workers:
+				worker.start()
+			for worker in workers:
+				worker.join(30)
+				assert worker.exitcode == 0
+		finally:
+			collector.stop()
+
+		assert not collector.is_alive()
+		lines = read_lines(os.path.join(temp_dir, 'collector.log'))
+		assert sorted(lines) == sorted(f'worker {worker_id} line {index}' for worker_id in range(2) for index in range(100))
+		for worker_id in range(2): # 프로세스마다 보낸 순서 유지
+			assert [line for line in lines if line.startswith(f'worker {worker_id} ')] == [f'worker {worker_id} line {index}' for index in range(100)]
+
+
+	def test_json_lines_formatter(self):
+		"""레코드 기본 항목과 extra, 예외 정보를 한 줄의 JSON 객체로 기록"""
+		try:
+			raise RuntimeError('boom')
+		except RuntimeError:
+			record = getLogger('json_test').makeRecord('json_test', WARNING, __file__, 10, 'value=%d', (3, ), sys.exc_info()
+					, extra = {'conn': 'peer-1'})
+
+		line = JsonLinesFormatter().format(record)
+
+		assert '\n' not in line
+		entry = json.loads(line)
+		assert entry['level'] == 'WARNING'
+		assert entry['levelno'] == WARNING
+		assert entry['logger'] == 'json_test'
+		assert entry['msg'] == 'value=3'
+		assert entry['conn'] == 'peer-1'
+		assert 'RuntimeError: boom' in entry['exc']
+
+
+	def test_json_rollover_builds_index(self, temp_dir):
+		"""JSON 로거의 로테이션은 .gz와 .gz.idx를 만들고, 색인으로 레벨 조건 조회"""
+		logger_name = 'json_rollover_test'
+		log = createLogger(log_path = temp_dir, log_filename = 'json', log_level = DEBUG, log_console = False
+				, logger_name = logger_name, log_format = LOG_FORMAT_JSON)
+		try:
+			for index in range(200):
+				log.debug('debug %d', index)
+			log.warning('warning line')
+			try:
+				raise ValueError('bad value')
+			except ValueError:
+				log.exception('error line')
+
+			file_handler = next(handler for handler in log.handlers if isinstance(handler, TimedRotatingFileHandler))
+			file_handler.doRollover()
+			assert file_handler.rotator._compressor == None # 블록 색인 압축은 build_index가 처리
+
+			deadline = time() + 10
+			while ((not glob.glob(os.path.join(temp_dir, 'json.log.*.gz.idx'))) and (time() < deadline)):
+				sleep(0.05)
+		finally:
+			for handler in list(log.handlers):
+				log.removeHandler(handler)
+				handler.close()
+
+		gz_files = glob.glob(os.path.join(temp_dir, 'json.log.*.gz'))
+		assert len(gz_files) == 1
+		assert load_index(gz_files[0]) != None
+		assert glob.glob(os.path.join(temp_dir, 'json.log.*[0-9]')) == [] # 압축 후 원본 제거
+
+		entries = [json.loads(line) for line in query(gz_files[0], min_level = WARNING)]
+		assert [entry['msg'] for entry in entries] == ['warning line', 'error line']
+		assert 'ValueError: bad value' in entries[1]['exc']
+		assert len(list(query(gz_files[0]))) == 202
+
+
+	def test_build_index_skips_blocks(self, temp_dir):
+		"""텍스트 로그를 여러 블록으로 압축하고, 시간 조건에 맞는 블록의 줄만 조회 (여러 줄 레코드 포함)"""
+		source = os.path.join(temp_dir, 'text.log')
+		with open(source, 'w', encoding = 'utf-8') as f:
+			for minute in range(60):
+				f.write(f'2026-10-18 09:{minute:02d}:00,000 INFO app.1] minute {minute}\n')
+			f.write('2026-10-18 10:00:00,500 ERROR app.2] failed\n')
+			f.write('Traceback (most recent call last):\n')
+			f.write('ValueError: bad value\n')
+
+		index_path = build_index(source, block_size = 256, remove_source = True)
+
+		gz_path = source + '.gz'
+		assert index_path == gz_path + '.idx'
+		assert not os.path.exists(source)
+		assert len(load_index(gz_path)['blocks']) > 1
+
+		since = datetime(2026, 10, 18, 9, 30).timestamp()
+		until = datetime(2026, 10, 18, 9, 35).timestamp()
+		assert [line.decode().split('] ')[1].strip() for line in query(gz_path, since = since, until = until)] == [f'minute {minute}' for minute in range(30, 35)]
+		assert list(query(gz_path, min_level = WARNING)) == [
+			b'2026-10-18 10:00:00,500 ERROR app.2] failed\n', b'Traceback (most recent call last):\n', b'ValueError: bad value\n']
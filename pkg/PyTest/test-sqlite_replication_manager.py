@@ -35,7 +35,8 @@ if (not project_folder in sys_path):
 
 
 # User's Package
-from lib.sqlite_replication_manager import RetentionPeriod, SqliteReplicationManager
+from lib.compressor import Compressor
+from lib.sqlite_replication_manager import QueueFullPolicy, ReplicationMode, RetentionPeriod, SpillJournal, SqliteReplicationManager, WriteAheadJournal
 
 
 
@@ -262,6 +263,38 @@ class TestSqliteReplicationManager:
 			assert len(result) == 6  # count + 5 data items
 
 
+	def test_query_with_parameters(self, manager):
+		"""파라미터 쿼리 및 iter_query 스트리밍 조회 테스트"""
+		manager.execute("CREATE TABLE IF NOT EXISTS stream_test (id INTEGER PRIMARY KEY, value INTEGER)")
+		for i in range(250):
+			manager.execute("INSERT INTO stream_test (value) VALUES (?)", (i,))
+		manager._execute_queue.join()
+
+		with manager.query("SELECT COUNT(*) FROM stream_test WHERE value >= ?", (200,)) as cursor:
+			assert cursor.fetchone()[0] == 50
+
+		values = [row[0] for row in manager.iter_query("SELECT value FROM stream_test ORDER BY value", fetch_size=16)]
+		assert values == list(range(250))
+
+
+	def test_query_not_blocked_by_writer_lock(self, manager):
+		"""쓰기 락을 잡고 있어도 조회가 병렬로 수행되는지 테스트"""
+		manager.execute("CREATE TABLE IF NOT EXISTS pool_test (id INTEGER PRIMARY KEY)")
+		manager._execute_queue.join()
+
+		def query_count():
+			with manager.query("SELECT COUNT(*) FROM pool_test") as cursor:
+				return cursor.fetchone()[0]
+
+		with manager._lock: # 워커가 쓰기 중인 상황을 모사
+			with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+				futures = [executor.submit(query_count) for _ in range(16)]
+				results = [future.result(timeout=5) for future in futures]
+
+		assert results == [0] * 16
+		assert manager._read_pool_created <= manager._read_pool_size
+
+
 	def test_retention_unlimited(self, temp_dirs):
 		"""무제한 보존 테스트"""
 		db_folder, backup_folder = temp_dirs
@@ -351,6 +384,99 @@ class TestSqliteReplicationManager:
 				assert data_count == 1 # 백업 DB는 새로 생성되어 데이터는 1개
 
 
+	@pytest.mark.parametrize("replay_memory_limit", [None, 10])
+	def test_online_rotation_keeps_draining(self, temp_dirs, replay_memory_limit):
+		"""로테이션 스냅샷이 진행되는 동안에도 execute() 큐가 계속 처리되는지 테스트 (다시 적용할 작업이 메모리 한도를 넘으면 디스크 저널 사용)"""
+		db_folder, backup_folder = temp_dirs
+		today = [date(2025, 5, 1)]
+
+		class FakeDate(date):
+			@classmethod
+			def today(cls):
+				return today[0]
+
+		with patch('lib.sqlite_replication_manager.date', FakeDate):
+			with SqliteReplicationManager(
+				db_name='online_rotation',
+				db_folder=db_folder,
+				backup_folder=backup_folder,
+				retention_period=RetentionPeriod.ONE_YEAR,
+				table_schema="CREATE TABLE IF NOT EXISTS ONLINE_DATA (id INTEGER PRIMARY KEY, data TEXT)"
+			) as manager:
+				for i in range(200):
+					manager.execute('INSERT INTO ONLINE_DATA (data) VALUES (?)', (f'may_{i}',))
+				manager._execute_queue.join()
+				if (replay_memory_limit != None):
+					manager._ROTATION_REPLAY_MEMORY_LIMIT = replay_memory_limit
+
+				# 스냅샷 생성을 지연시켜 오래 걸리는 로테이션을 모사
+				release_snapshot = threading.Event()
+				rotation_worker = manager._rotation_worker
+				def slow_rotation_worker(*args):
+					release_snapshot.wait(10)
+					rotation_worker(*args)
+				manager._rotation_worker = slow_rotation_worker
+
+				today[0] = date(2025, 6, 1)
+				manager._prev_check_time = 0
+				deadline = time() + 5
+				while ((manager._rotation_replay == None) and (time() < deadline)):
+					sleep(0.05)
+				assert manager._rotation_replay != None
+
+				# 로테이션 중에도 작업이 커밋되어야 함
+				for i in range(50):
+					manager.execute('INSERT INTO ONLINE_DATA (data) VALUES (?)', (f'june_{i}',))
+				manager._execute_queue.join()
+
+				backup_conn = sqlite3.connect(manager.backup_db_path)
+				assert backup_conn.execute("SELECT COUNT(*) FROM ONLINE_DATA").fetchone()[0] == 50
+				backup_conn.close()
+
+				replay_journal_path = f"{manager.main_db_path}.replay"
+				if (replay_memory_limit != None):
+					assert len(manager._rotation_replay) <= replay_memory_limit
+					assert len(manager._rotation_replay) + len(manager._rotation_replay_journal) == 50
+					assert os.path.exists(replay_journal_path)
+				else:
+					assert len(manager._rotation_replay) == 50
+					assert manager._rotation_replay_journal == None
+
+				release_snapshot.set()
+				deadline = time() + 5
+				while ((manager._rotation_replay != None) and (time() < deadline)):
+					sleep(0.05)
+				assert manager._rotation_replay == None
+
+				with manager.query("SELECT COUNT(*) FROM ONLINE_DATA") as cursor:
+					assert cursor.fetchone()[0] == 250
+				with manager.query("SELECT data FROM ONLINE_DATA WHERE data LIKE 'june_%' ORDER BY id") as cursor:
+					assert [row[0] for row in cursor.fetchall()] == [f'june_{i}' for i in range(50)] # 추가된 순서대로 다시 적용
+				assert manager._rotation_replay_journal == None
+				assert not os.path.exists(replay_journal_path)
+
+			assert os.path.exists(os.path.join(backup_folder, 'online_rotation-202505.db.gz'))
+
+
+	def test_worker_survives_maintenance_errors(self, manager):
+		"""주기 작업(저널 보충, 로테이션 확인)에서 예외가 발생해도 쓰기 워커가 계속 처리하는지 테스트"""
+		manager.execute("CREATE TABLE IF NOT EXISTS MAINTENANCE_TEST (id INTEGER)")
+		manager._execute_queue.join()
+
+		with patch.object(manager, '_refill_from_spill', side_effect=sqlite3.OperationalError("database is locked")), \
+				patch.object(manager, '_check_monthly_rotation', side_effect=RuntimeError("rotation failed")) as check_rotation:
+			for i in range(20):
+				manager.execute("INSERT INTO MAINTENANCE_TEST (id) VALUES (?)", (i,))
+			manager._execute_queue.join()
+			assert check_rotation.call_count >= 10 # 큐가 비지 않아도 배치마다 로테이션 확인
+
+		assert manager._worker_thread.is_alive()
+		manager.execute("INSERT INTO MAINTENANCE_TEST (id) VALUES (?)", (20,))
+		manager._execute_queue.join()
+		with manager.query("SELECT COUNT(*) FROM MAINTENANCE_TEST") as cursor:
+			assert cursor.fetchone()[0] == 21
+
+
 	def test_backup_compression(self, temp_dirs):
 		"""백업 압축 테스트"""
 		db_folder, backup_folder = temp_dirs
@@ -360,6 +486,8 @@ class TestSqliteReplicationManager:
 			db_folder=db_folder,
 			backup_folder=backup_folder
 		) as manager:
+			assert manager._compressor.processes == 0 # 기본 압축기는 spawn 프로세스 대신 스레드 사용
+
 			# 가짜 백업 파일 생성
 			test_backup_path = os.path.join(backup_folder, "compress_test-202401.db")
 			test_content = "This is test backup content"
@@ -383,6 +511,41 @@ class TestSqliteReplicationManager:
 				assert decompressed_content == test_content
 
 
+	def test_backup_compression_with_compressor(self, temp_dirs):
+		"""압축기 지정 시 블록 단위 멀티스레드 압축 및 압축 확장자별 오래된 백업 정리 테스트"""
+		db_folder, backup_folder = temp_dirs
+		progress = []
+		compressor = Compressor(level=9, threads=4, block_size=1024, processes=0)
+
+		with SqliteReplicationManager(
+			db_name="compressor_test",
+			db_folder=db_folder,
+			backup_folder=backup_folder,
+			retention_period=RetentionPeriod.ONE_MONTH,
+			compressor=compressor
+		) as manager:
+			test_backup_path = os.path.join(backup_folder, "compressor_test-202401.db")
+			test_content = os.urandom(10000) + b"backup" * 1000
+			with open(test_backup_path, 'wb') as f:
+				f.write(test_content)
+
+			compressed_path = compressor.submit(test_backup_path, progress=lambda done, total: progress.append((done, total))).result()
+			assert compressed_path == f"{test_backup_path}.gz"
+			assert progress[-1] == (len(test_content), len(test_content))
+			with gzip.open(compressed_path, 'rb') as f:
+				assert f.read() == test_content
+
+			# gzip 이외의 압축 확장자도 보존 기간에 따라 정리
+			for filename in ("compressor_test-202401.db.zst", "compressor_test-202401.db.lz4"):
+				with open(os.path.join(backup_folder, filename), 'wb') as f:
+					f.write(b"test backup data")
+			manager._cleanup_old_backups()
+			remaining_files = os.listdir(backup_folder)
+			assert not any(filename.startswith("compressor_test-202401.db.") for filename in remaining_files)
+
+		compressor.close()
+
+
 	def test_cleanup_old_backups(self, temp_dirs):
 		"""오래된 백업 정리 테스트"""
 		db_folder, backup_folder = temp_dirs
@@ -449,34 +612,189 @@ class TestSqliteReplicationManager:
 			assert result is not None
 
 
-	# def test_queue_full_handling(self, manager): TODO: 큐가 가득차는 상황에 대한 모의 시험 마무리 필요
-	# 	"""큐 가득찬 상황 처리 테스트"""
-	# 	# 큐를 가득 채우기 위해 많은 작업 추가
-	# 	original_queue = manager._execute_queue
+	def test_queue_full_handling(self, temp_dirs):
+		"""큐 가득찬 상황 처리 테스트 (REJECT / BLOCK 정책)"""
+		db_folder, backup_folder = temp_dirs
 
-	# 	# 작은 큐로 교체하여 테스트
-	# 	import queue
-	# 	manager._execute_queue = queue.Queue(maxsize=1)
+		with SqliteReplicationManager(
+			db_name="queue_full_test",
+			db_folder=db_folder,
+			backup_folder=backup_folder,
+			table_schema="CREATE TABLE IF NOT EXISTS TEST1 (id INTEGER)",
+			queue_max_size=1,
+			queue_full_policy=QueueFullPolicy.REJECT
+		) as manager:
+			with manager._lock: # 워커가 쓰기 락을 얻지 못하도록 막아 큐를 가득 채움
+				manager.execute("INSERT INTO TEST1 (id) VALUES (?)", (1,)) # 워커가 꺼내서 대기
+				sleep(TIME_WAIT_BACKGROUND_WORKING)
+				manager.execute("INSERT INTO TEST1 (id) VALUES (?)", (2,)) # 큐에 대기
+
+				with pytest.raises(RuntimeError, match="Execute queue is full"):
+					manager.execute("INSERT INTO TEST1 (id) VALUES (?)", (3,))
 
-	# 	try:
-	# 		# 큐를 가득 채움
-	# 		manager.execute("CREATE TABLE IF NOT EXISTS TEST1 (id INTEGER)")
+				manager.queue_full_policy = QueueFullPolicy.BLOCK
+				manager._execute_queue_timeout = 0.1
+				with pytest.raises(RuntimeError, match="Execute queue is full"):
+					manager.execute("INSERT INTO TEST1 (id) VALUES (?)", (4,))
 
-	# 		# 큐가 가득찬 상태에서 추가 작업 시도
-	# 		with pytest.raises(RuntimeError, match="Execute queue is full"):
-	# 			manager.execute("CREATE TABLE IF NOT EXISTS TEST1 (id INTEGER)")
-	# 			manager.execute("CREATE TABLE IF NOT EXISTS TEST2 (id INTEGER)")
-	# 			manager.execute("CREATE TABLE IF NOT EXISTS TEST3 (id INTEGER)")
-	# 			manager.execute("CREATE TABLE IF NOT EXISTS TEST4 (id INTEGER)")
-	# 			manager.execute("CREATE TABLE IF NOT EXISTS TEST1 (id INTEGER)")
-	# 			manager.execute("CREATE TABLE IF NOT EXISTS TEST2 (id INTEGER)")
-	# 			manager.execute("CREATE TABLE IF NOT EXISTS TEST3 (id INTEGER)")
-	# 			manager.execute("CREATE TABLE IF NOT EXISTS TEST4 (id INTEGER)")
+			manager._execute_queue.join()
+			with manager.query("SELECT id FROM TEST1 ORDER BY id") as cursor:
+				assert [row[0] for row in cursor.fetchall()] == [1, 2]
+			assert manager.get_stats()['rejected_count'] == 2
 
-	# 	finally:
-	# 		# 원래 큐로 복원
-	# 		manager._execute_queue = original_queue
-	# 		pass
+
+	def test_queue_drop_oldest_policy(self, temp_dirs):
+		"""DROP_OLDEST 정책 테스트"""
+		db_folder, backup_folder = temp_dirs
+
+		with SqliteReplicationManager(
+			db_name="drop_oldest_test",
+			db_folder=db_folder,
+			backup_folder=backup_folder,
+			table_schema="CREATE TABLE IF NOT EXISTS DROP_TEST (id INTEGER)",
+			queue_max_size=3,
+			queue_full_policy=QueueFullPolicy.DROP_OLDEST
+		) as manager:
+			with manager._lock:
+				manager.execute("INSERT INTO DROP_TEST (id) VALUES (?)", (0,))
+				sleep(TIME_WAIT_BACKGROUND_WORKING)
+				for i in range(1, 11):
+					manager.execute("INSERT INTO DROP_TEST (id) VALUES (?)", (i,))
+
+			manager._execute_queue.join()
+			with manager.query("SELECT id FROM DROP_TEST ORDER BY id") as cursor:
+				assert [row[0] for row in cursor.fetchall()] == [0, 8, 9, 10]
+			assert manager.get_stats()['dropped_count'] == 7
+
+
+	def test_queue_spill_policy(self, temp_dirs):
+		"""SPILL 정책 및 큐 게이지 테스트"""
+		db_folder, backup_folder = temp_dirs
+
+		with SqliteReplicationManager(
+			db_name="spill_test",
+			db_folder=db_folder,
+			backup_folder=backup_folder,
+			table_schema="CREATE TABLE IF NOT EXISTS SPILL_TEST (id INTEGER, payload BLOB)",
+			queue_max_size=2,
+			queue_full_policy=QueueFullPolicy.SPILL
+		) as manager:
+			with manager._lock:
+				for i in range(50):
+					manager.execute("INSERT INTO SPILL_TEST (id, payload) VALUES (?, ?)", (i, bytes([i])))
+				stats = manager.get_stats()
+				assert stats['queue_depth'] <= 2
+				assert stats['spill_depth'] > 0
+				assert os.path.exists(os.path.join(db_folder, "spill_test.spill"))
+
+			deadline = time() + 10
+			while ((manager.get_stats()['task_count'] < 50) and (time() < deadline)):
+				sleep(0.05)
+
+			with manager.query("SELECT id, payload FROM SPILL_TEST ORDER BY rowid") as cursor:
+				rows = cursor.fetchall()
+			assert [row[0] for row in rows] == list(range(50)) # 순서 유지
+			assert rows[10][1] == bytes([10])
+
+			stats = manager.get_stats()
+			assert stats['spill_depth'] == 0
+			assert stats['spilled_count'] > 0
+			assert stats['commit_latency_ms']['p99'] >= stats['commit_latency_ms']['p50'] > 0
+			assert stats['rows_per_second'] > 0
+
+		assert not os.path.exists(os.path.join(db_folder, "spill_test.spill"))
+
+
+	def test_spill_journal_reopen_after_partial_pop(self, temp_dirs):
+		"""커밋된 위치까지 꺼낸 작업은 저널을 다시 열어도 다시 처리하지 않는지 테스트"""
+		db_folder, _ = temp_dirs
+		os.makedirs(db_folder, exist_ok=True)
+		journal_path = os.path.join(db_folder, "reopen_test.spill")
+
+		journal = SpillJournal(journal_path)
+		for i in range(10):
+			journal.append({'sql': "INSERT", 'parameters': (i,)})
+		tasks = journal.pop(4)
+		journal.commit(tasks[-1]['spill_offset'])
+		assert journal.pop(2)[0]['parameters'] == (4,) # 꺼냈지만 커밋하지 않은 작업
+		journal.close()
+
+		# 비정상 종료 후 재시작: 커밋된 4개를 제외한 작업만 복구
+		journal = SpillJournal(journal_path)
+		assert journal.restored_count == len(journal) == 6
+		tasks = journal.pop(10)
+		assert [task['parameters'][0] for task in tasks] == list(range(4, 10))
+
+		# 모두 커밋되면 파일을 비움
+		journal.commit(tasks[-1]['spill_offset'])
+		assert len(journal) == 0
+		journal.close()
+		journal = SpillJournal(journal_path)
+		assert journal.restored_count == 0
+		journal.close()
+
+
+	def test_durable_queue_replay_after_crash(self, temp_dirs):
+		"""커밋되지 못한 작업이 저널에 남아 재시작 후 다시 처리되는지 테스트"""
+		db_folder, backup_folder = temp_dirs
+		options = {
+			'db_name': "durable_test",
+			'db_folder': db_folder,
+			'backup_folder': backup_folder,
+			'table_schema': "CREATE TABLE IF NOT EXISTS durable_test (id INTEGER PRIMARY KEY, value INTEGER)",
+			'durable_queue': True
+		}
+		journal_path = os.path.join(db_folder, "durable_test.journal")
+
+		with SqliteReplicationManager(**options) as manager:
+			for i in range(10):
+				manager.execute("INSERT INTO durable_test (value) VALUES (?)", (i,))
+			manager._execute_queue.join()
+			assert manager.get_stats()['journal_depth'] == 0
+
+			# 커밋 전에 프로세스가 종료된 상황을 모사: 작업이 실행되지 않아 저널에 남음
+			with patch.object(manager, '_execute_batch'):
+				for i in range(10, 25):
+					manager.execute("INSERT INTO durable_test (value) VALUES (?)", (i,))
+				manager._execute_queue.join()
+				assert manager.get_stats()['journal_depth'] == 15
+				manager._stop_background_worker()
+		assert os.path.exists(journal_path)
+
+		with SqliteReplicationManager(**options) as manager:
+			manager._execute_queue.join()
+			stats = manager.get_stats()
+			assert stats['journal_replayed_count'] == 15
+			assert stats['journal_depth'] == 0
+
+			with manager.query("SELECT COUNT(*), SUM(value) FROM durable_test") as cursor:
+				assert cursor.fetchone() == (25, sum(range(25)))
+		assert not os.path.exists(journal_path)
+
+
+	def test_write_ahead_journal_compaction(self, temp_dirs):
+		"""큐가 완전히 비지 않아도 커밋된 앞부분을 정리하여 저널 파일 크기가 계속 늘어나지 않는지 테스트"""
+		db_folder, _ = temp_dirs
+		os.makedirs(db_folder, exist_ok=True)
+		journal_path = os.path.join(db_folder, "compact_test.journal")
+		payload = bytes(64 * 1024)
+
+		journal = WriteAheadJournal(journal_path)
+		for i in range(400): # 약 25MB 기록, 항상 마지막 작업 1개는 커밋되지 않은 상태
+			journal.append({'sql': "INSERT", 'parameters': (i, payload)})
+			if (i > 0):
+				journal.commit(i)
+		assert len(journal) == 1
+		assert os.path.getsize(journal_path) <= 2 * WriteAheadJournal._INITIAL_SIZE
+
+		seq = journal.append({'sql': "INSERT", 'parameters': (400, payload)})
+		journal.close()
+
+		journal = WriteAheadJournal(journal_path)
+		assert [task['parameters'][0] for task in journal.take_pending()] == [399, 400]
+		journal.commit(seq)
+		assert len(journal) == 0
+		journal.close()
 
 
 	def test_connection_recovery(self, manager):
@@ -710,6 +1028,209 @@ class TestSqliteReplicationManager:
 		assert main_sum == backup_sum
 
 
+	def test_group_commit(self, temp_dirs):
+		"""그룹 커밋(배치 처리) 테스트"""
+		db_folder, backup_folder = temp_dirs
+
+		with SqliteReplicationManager(
+			db_name="group_commit_test",
+			db_folder=db_folder,
+			backup_folder=backup_folder,
+			table_schema="CREATE TABLE IF NOT EXISTS group_test (id INTEGER PRIMARY KEY, value TEXT UNIQUE)",
+			batch_max_size=100,
+			batch_max_wait_ms=20
+		) as manager:
+			for i in range(500):
+				manager.execute("INSERT INTO group_test (value) VALUES (?)", (f"value_{i}",))
+
+			# 같은 배치 안에서 제약 조건 위반 작업이 있어도 나머지 작업은 반영되어야 함
+			manager.execute("INSERT INTO group_test (value) VALUES (?)", ("value_0",))
+			manager.execute("INSERT INTO group_test (value) VALUES (?)", ("value_last",))
+
+			manager._execute_queue.join()
+
+			with manager.query("SELECT COUNT(*) FROM group_test") as cursor:
+				assert cursor.fetchone()[0] == 501
+
+			backup_conn = sqlite3.connect(manager.backup_db_path)
+			backup_count = backup_conn.execute("SELECT COUNT(*) FROM group_test").fetchone()[0]
+			backup_conn.close()
+			assert backup_count == 501
+
+			stats = manager.get_stats()
+			assert stats['task_count'] >= 502
+			assert stats['batch_count'] < stats['task_count']
+			assert 1 < stats['max_batch_size'] <= 100
+			assert stats['avg_batch_latency_ms'] > 0
+
+
+	def test_async_replication(self, temp_dirs):
+		"""비동기 복제 모드 테스트: 메인 DB 우선 커밋 후 백업 DB 적용 및 복제 지연 추적"""
+		db_folder, backup_folder = temp_dirs
+
+		with SqliteReplicationManager(
+			db_name="async_test",
+			db_folder=db_folder,
+			backup_folder=backup_folder,
+			table_schema="CREATE TABLE IF NOT EXISTS async_test (id INTEGER PRIMARY KEY, value INTEGER UNIQUE)",
+			batch_max_size=50,
+			replication_mode=ReplicationMode.ASYNC
+		) as manager:
+			for i in range(200):
+				manager.execute("INSERT INTO async_test (value) VALUES (?)", (i,))
+			manager.execute("INSERT INTO async_test (value) VALUES (?)", (0,)) # 메인 DB에서 실패한 작업은 복제되지 않음
+			manager._execute_queue.join()
+
+			deadline = time() + 5
+			while ((manager.get_stats()['replica_lag_statements'] > 0) and (time() < deadline)):
+				sleep(0.05)
+
+			stats = manager.get_stats()
+			assert stats['replica_lag_statements'] == 0
+			assert stats['replica_lag_seconds'] == 0.0
+			assert stats['replica_applied_seq'] == 200
+
+			backup_conn = sqlite3.connect(manager.backup_db_path)
+			assert backup_conn.execute("SELECT COUNT(*), SUM(value) FROM async_test").fetchone() == (200, sum(range(200)))
+			backup_conn.close()
+
+
+	def test_async_replication_catch_up_after_restart(self, temp_dirs):
+		"""비동기 복제 모드에서 적용되지 못한 복제 로그가 재시작 후 적용되는지 테스트"""
+		db_folder, backup_folder = temp_dirs
+		options = {
+			'db_name': "async_restart_test",
+			'db_folder': db_folder,
+			'backup_folder': backup_folder,
+			'table_schema': "CREATE TABLE IF NOT EXISTS restart_test (id INTEGER PRIMARY KEY, value INTEGER)",
+			'replication_mode': ReplicationMode.ASYNC
+		}
+
+		# 복제 스레드가 멈춘 상황을 모사
+		with patch.object(SqliteReplicationManager, '_apply_replication_log', return_value=0), \
+				SqliteReplicationManager(**options) as manager:
+			for i in range(30):
+				manager.execute("INSERT INTO restart_test (value) VALUES (?)", (i,))
+			manager._execute_queue.join()
+
+			stats = manager.get_stats()
+			assert stats['replica_lag_statements'] == 30
+			assert stats['replica_lag_seconds'] >= 0.0
+
+		backup_conn = sqlite3.connect(os.path.join(backup_folder, f"async_restart_test-{datetime.now().strftime('%Y%m')}.db"))
+		assert backup_conn.execute("SELECT COUNT(*) FROM restart_test").fetchone()[0] == 0
+		backup_conn.close()
+
+		with SqliteReplicationManager(**options) as manager:
+			deadline = time() + 5
+			while ((manager.get_stats()['replica_lag_statements'] > 0) and (time() < deadline)):
+				sleep(0.05)
+
+			backup_conn = sqlite3.connect(manager.backup_db_path)
+			assert backup_conn.execute("SELECT COUNT(*) FROM restart_test").fetchone()[0] == 30
+			backup_conn.close()
+
+
+	def test_query_range_across_partitions(self, temp_dirs):
+		"""로테이션된 월별 백업 파일(압축/비압축)과 현재 백업 파일에 걸친 기간 조회 테스트"""
+		db_folder, backup_folder = temp_dirs
+		os.makedirs(backup_folder, exist_ok=True)
+		schema = "CREATE TABLE IF NOT EXISTS events (ts TEXT, value INTEGER)"
+
+		# 이전 달 백업 파일 생성: 202401은 압축 파일만, 202402는 비압축 파일로 유지
+		for month, values in (("202401", (1, 2)), ("202402", (3,))):
+			old_path = os.path.join(backup_folder, f"range_test-{month}.db")
+			conn = sqlite3.connect(old_path)
+			conn.execute(schema)
+			conn.executemany("INSERT INTO events VALUES (?, ?)", [(f"{month}", value) for value in values])
+			conn.commit()
+			conn.close()
+		with open(os.path.join(backup_folder, "range_test-202401.db"), 'rb') as f_in:
+			with gzip.open(os.path.join(backup_folder, "range_test-202401.db.gz"), 'wb') as f_out:
+				f_out.write(f_in.read())
+		os.remove(os.path.join(backup_folder, "range_test-202401.db"))
+
+		with SqliteReplicationManager(
+			db_name="range_test",
+			db_folder=db_folder,
+			backup_folder=backup_folder,
+			table_schema=schema,
+			partition_cache_size=1
+		) as manager:
+			manager.execute("INSERT INTO events VALUES (?, ?)", ("now", 10))
+			manager._execute_queue.join()
+
+			rows = manager.query_range("SELECT value FROM events WHERE value > ?", date(2024, 1, 1), date.today(),
+					parameters=(0,), sort_key=lambda row: -row[0])
+			assert rows == [(10,), (3,), (2,), (1,)]
+
+			# 기간에 포함되지 않은 달과 존재하지 않는 달은 제외
+			assert manager.query_range("SELECT value FROM events", date(2024, 2, 1), date(2024, 2, 29)) == [(3,)]
+			assert manager.query_range("SELECT value FROM events", date(2023, 1, 1), date(2023, 12, 31)) == []
+
+			# 압축 해제본은 캐시에서 재사용
+			manager.query_range("SELECT value FROM events", date(2024, 1, 1), date(2024, 1, 31))
+			assert manager._partition_cache.misses == 1
+			assert manager._partition_cache.hits == 1
+			assert os.path.exists(os.path.join(backup_folder, ".partition_cache", "range_test-202401.db"))
+
+
+	def test_registered_statements_and_schema_version(self, temp_dirs):
+		"""이름 있는 SQL 문 실행 및 스키마 버전에 따른 스키마 적용 생략 테스트"""
+		db_folder, backup_folder = temp_dirs
+		options = {
+			'db_name': "statement_test",
+			'db_folder': db_folder,
+			'backup_folder': backup_folder,
+			'table_schema': "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, value INTEGER)",
+			'schema_version': 3,
+			'statements': {'insert_item': "INSERT INTO items (value) VALUES (?)"}
+		}
+
+		with SqliteReplicationManager(**options) as manager:
+			for i in range(10):
+				manager.execute_statement('insert_item', (i,))
+			manager._execute_queue.join()
+
+			with pytest.raises(KeyError):
+				manager.execute_statement('unknown', ())
+			with pytest.raises(ValueError):
+				manager.register_statement('insert_item', "INSERT INTO items (value) VALUES (0)")
+
+			with manager.query("PRAGMA user_version") as cursor:
+				assert cursor.fetchone()[0] == 3
+
+		# 버전이 같으면 스키마를 다시 적용하지 않고, 버전이 바뀌면 적용
+		options['table_schema'] += "; CREATE TABLE IF NOT EXISTS extra (id INTEGER PRIMARY KEY)"
+		for schema_version, expected in ((3, 0), (4, 1)):
+			options['schema_version'] = schema_version
+			with SqliteReplicationManager(**options) as manager:
+				with manager.query("SELECT COUNT(*) FROM sqlite_master WHERE name = 'extra'") as cursor:
+					assert cursor.fetchone()[0] == expected
+				with manager.query("SELECT COUNT(*) FROM items") as cursor:
+					assert cursor.fetchone()[0] == 10
+
+
+	def test_journal_and_synchronous_options(self, temp_dirs):
+		"""쓰기 연결의 journal_mode, synchronous PRAGMA 설정 테스트"""
+		db_folder, backup_folder = temp_dirs
+
+		with pytest.raises(ValueError):
+			SqliteReplicationManager(db_name="pragma_test", db_folder=db_folder, backup_folder=backup_folder, journal_mode="invalid")
+
+		with SqliteReplicationManager(
+			db_name="pragma_test",
+			db_folder=db_folder,
+			backup_folder=backup_folder,
+			journal_mode="truncate",
+			synchronous="full"
+		) as manager:
+			main_conn, backup_conn = manager._get_thread_connections()
+			for conn in (main_conn, backup_conn):
+				assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "truncate"
+				assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2 # FULL
+
+
 	def test_performance_benchmark(self, manager):
 		"""성능 벤치마크 테스트"""
 		# 테이블 생성